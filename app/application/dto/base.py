@@ -1,4 +1,5 @@
 """Serializer base models."""
+import json
 from logging import getLogger
 from typing import Type, Any
 
@@ -64,6 +65,18 @@ class ApiListQueryDtoBaseModel(BaseModel):
                 )
         return values
 
+    def cache_key(self, **extra: Any) -> str:
+        """Build a normalized cache key from the set query fields.
+
+        Unset fields are left out and keys are sorted, so equivalent queries
+        share the same key regardless of parameter order.
+        """
+        return json.dumps(
+            self.model_dump(mode='json', exclude_none=True) | extra,
+            sort_keys=True,
+            separators=(',', ':'),
+        )
+
     def to_domain(self) -> ApiListQuery:
         """Convert to domain object."""
         return ApiListQuery(
@@ -10,6 +10,9 @@ from app.domain.entities.sample_item import SampleItemBase, \
     SampleItemLengths, SampleItem
 from app.application.dto.base import ApiListQueryDtoBaseModel
 
+# Maximum number of IDs in a batch get request.
+BATCH_GET_MAX_IDS = 100
+
 
 class SampleItemCreate(SampleItemBase):
     """SampleItem entity create."""
@@ -34,6 +37,72 @@ class SampleItemReadDtoWithMeta(SampleItemReadDto):
     meta_data: SampleItemLengths
 
 
+class SampleItemBatchGetByIdDto(BaseModel):
+    """SampleItem batch get by ID request."""
+    ids: list[int] = PydanticField(
+        min_length=1,
+        max_length=BATCH_GET_MAX_IDS,
+        description='IDs of the SampleItems to fetch.',
+    )
+
+
+class SampleItemBatchGetByUUIDDto(BaseModel):
+    """SampleItem batch get by UUID request."""
+    ids: list[str] = PydanticField(
+        min_length=1,
+        max_length=BATCH_GET_MAX_IDS,
+        description='UUIDs of the SampleItems to fetch.',
+    )
+
+
+class SampleItemBatchEntryDto(BaseModel):
+    """SampleItem batch get result for one requested ID."""
+    id: int | str
+    found: bool = PydanticField(
+        description='Whether a SampleItem with this ID exists.')
+    item: SampleItemReadDtoWithMeta | SampleItemReadDto | None = None
+
+
+class SampleItemBatchDto(BaseModel):
+    """SampleItem batch get results, in the order of the requested IDs."""
+    items: list[SampleItemBatchEntryDto]
+
+
+class SampleItemTombstoneDto(BaseModel):
+    """Logically deleted SampleItem in a delta sync."""
+    uuid: str
+    deleted_at: datetime
+
+
+class SampleItemSyncDto(BaseModel):
+    """Changes to SampleItem entities since a watermark."""
+    items: list[SampleItemReadDto]
+    tombstones: list[SampleItemTombstoneDto]
+    watermark: str = PydanticField(
+        description='Send as `since` to fetch the following changes.')
+    has_more: bool = PydanticField(
+        description='Whether more changes are available right away. Changes '
+                    'made within the watermark overlap are returned by the '
+                    'next sync.')
+
+
+class SampleItemSyncQuery(BaseModel):
+    """SampleItem delta sync query."""
+    since: str | None = PydanticField(
+        Query(
+            default=None,
+            description='Watermark returned by the previous sync. Omit it '
+                        'for a full sync.',
+        ))
+    limit: int = PydanticField(
+        Query(
+            default=500,
+            ge=1,
+            le=1000,
+            description='Maximum number of changes to return.',
+        ))
+
+
 class SampleItemGetQuery(BaseModel):
     """SampleItem entity get query."""
     with_meta: bool = PydanticField(
@@ -43,6 +112,21 @@ class SampleItemGetQuery(BaseModel):
         ))
 
 
+class SampleItemSearchQuery(BaseModel):
+    """SampleItem full-text search query."""
+    q: str = PydanticField(Query(
+        min_length=1,
+        max_length=LEN_256,
+        description='Words to search for in SampleItem name and description. '
+                    'Supports "quoted phrases", "or" and "-word".',
+    ))
+    with_meta: bool = PydanticField(
+        Query(
+            default=False,
+            description='Include meta data in response',
+        ))
+
+
 class SampleItemApiListQueryDto(ApiListQueryDtoBaseModel):
     """SampleItem filter."""
     __entity_cls__ = SampleItem
@@ -52,6 +136,11 @@ class SampleItemApiListQueryDto(ApiListQueryDtoBaseModel):
         description='Fuzzy search query for SampleItem name, following '
                     'PostgreSQL ILIKE semantics, e.g. "%foo%" or "f_o"',
     ))
+    name__prefix: str | None = PydanticField(Query(
+        default=None,
+        description='Case-sensitive prefix of SampleItem name, e.g. "foo" '
+                    'matches "foobar". "%" and "_" match literally.',
+    ))
     created_at__gte: datetime | None = None
     created_at__lte: datetime | None = None
     created_at__asc: bool | None = None
@@ -2,12 +2,12 @@
 from datetime import datetime
 
 from fastapi import Query
-from pydantic import Field as PydanticField
+from pydantic import BaseModel, Field as PydanticField
 from sqlmodel import SQLModel, Field
 
 from app.application.dto.base import ApiListQueryDtoBaseModel
 from app.domain.entities.common import LEN_256
-from app.domain.entities.user import UserBase, User, Role
+from app.domain.entities.user import UserBase, User
 
 
 class UserCreate(UserBase):
@@ -26,9 +26,56 @@ class UserReadDto(UserBase):
     deleted_at: datetime | None = None
 
 
+class PermissionReadDto(SQLModel):
+    """Permission entity read."""
+    id: int
+    name: str
+    description: str | None = None
+
+
+class RoleReadDto(SQLModel):
+    """Role entity read."""
+    id: int
+    name: str
+    description: str | None = None
+
+
+class RoleReadDtoWithPermissions(RoleReadDto):
+    """Role entity read with its permissions."""
+    permissions: list[PermissionReadDto] = []
+
+
 class UserReadDtoWithRelated(UserReadDto):
-    """User entity read."""
-    roles: list[Role] = []
+    """User entity read with its roles."""
+    roles: list[RoleReadDto] = []
+
+
+class UserReadDtoWithPermissions(UserReadDto):
+    """User entity read with its roles and their permissions."""
+    roles: list[RoleReadDtoWithPermissions] = []
+
+
+USER_INCLUDES = ('roles', 'permissions')
+
+
+class UserIncludeQueryDto(BaseModel):
+    """Related entities to read with users."""
+    include: str | None = PydanticField(Query(
+        default=None,
+        pattern=rf'^({"|".join(USER_INCLUDES)})'
+                rf'(,({"|".join(USER_INCLUDES)}))*$',
+        description='Comma separated related entities to include, among '
+                    '"roles" and "permissions". "permissions" includes the '
+                    'roles with their permissions.',
+    ))
+
+    @property
+    def includes(self) -> frozenset[str]:
+        """Names of the included related entities."""
+        if not self.include:
+            return frozenset()
+        # pylint: disable=no-member
+        return frozenset(self.include.split(','))
 
 
 class UserUpdate(SQLModel):
@@ -47,15 +94,31 @@ class UserApiListQueryDto(ApiListQueryDtoBaseModel):
         description='Fuzzy search query for User first name, following '
                     'PostgreSQL ILIKE semantics, e.g. "%foo%" or "f_o"',
     ))
+    first_name__prefix: str | None = PydanticField(Query(
+        default=None,
+        description='Case-sensitive prefix of User first name, e.g. '
+                    '"foo" matches "foobar". "%" and "_" match literally.',
+    ))
     last_name__eq: str | None = None
     last_name__like: str | None = PydanticField(Query(
         default=None,
         description='Fuzzy search query for User first name, following '
                     'PostgreSQL ILIKE semantics, e.g. "%foo%" or "f_o"',
     ))
+    last_name__prefix: str | None = PydanticField(Query(
+        default=None,
+        description='Case-sensitive prefix of User last name, e.g. '
+                    '"foo" matches "foobar". "%" and "_" match literally.',
+    ))
     email__eq: str | None = None
     email__like: str | None = PydanticField(Query(
         default=None,
         description='Fuzzy search query for User email, following '
                     'PostgreSQL ILIKE semantics, e.g. "%foo%" or "f_o"',
     ))
+    email__prefix: str | None = PydanticField(Query(
+        default=None,
+        description='Case-sensitive prefix of User email, e.g. '
+                    '"foo@" matches "foo@example.com". "%" and "_" match '
+                    'literally.',
+    ))
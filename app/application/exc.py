@@ -55,3 +55,27 @@ class UniqueConstraintViolation(CustomBaseException):
 class OperationNotAllowed(CustomBaseException):
     """Raised when an operation is not allowed."""
     _status_code = 403
+
+
+class InvalidSyncWatermark(CustomBaseException):
+    """Raised when a delta sync watermark cannot be decoded."""
+    _status_code = 400
+
+
+class NotModified(CustomBaseException):
+    """Raised when the requested representation matches the client's ETag."""
+    _status_code = 304
+
+    def __init__(self, message: str, etag: str, detail: str | None = None):
+        super().__init__(message, detail)
+        self.etag = etag
+
+
+class QueryTooExpensive(CustomBaseException):
+    """Raised when a list query exceeds the configured cost limits."""
+    _status_code = 400
+
+
+class ServiceBusy(CustomBaseException):
+    """Raised when a bounded worker pool cannot take more work in time."""
+    _status_code = 503
@@ -0,0 +1,92 @@
+"""Cost guard for user-supplied list queries."""
+from typing import Any
+
+from sqlalchemy import Select
+
+from app.application.exc import QueryTooExpensive
+from app.domain.services.query_cost import QueryCostEstimator
+from app.domain.value_objects.api_query import ApiListQuery, \
+    ApiListQueryLimits, ApiListQueryOp
+
+_LIST_OPS = {ApiListQueryOp.IN.value, ApiListQueryOp.NOTIN.value}
+_LIKE_WILDCARDS = ('%', '_')
+
+
+class ListQueryGuard:
+    """Rejects list queries that exceed `ApiListQueryLimits`.
+
+    `check` only looks at the query parameters and runs before the statement
+    is built. `check_cost` asks the database planner and runs on a session,
+    but before the statement itself is executed.
+    """
+
+    def __init__(self, limits: ApiListQueryLimits) -> None:
+        """Constructor."""
+        self._limits = limits
+
+    @property
+    def limits(self) -> ApiListQueryLimits:
+        """The enforced limits."""
+        return self._limits
+
+    def check(
+            self,
+            api_query: ApiListQuery,
+            page: int | None = None,
+            size: int | None = None,
+    ) -> None:
+        """Check the filters and pagination of a list query.
+
+        Args:
+            api_query (ApiListQuery): The filters and sort keys.
+            page (int | None): The requested page number, starting at 1.
+            size (int | None): The requested page size.
+
+        Raises:
+            QueryTooExpensive: If any limit is exceeded.
+        """
+        limits = self._limits
+        if size is not None and size > limits.max_page_size:
+            raise QueryTooExpensive(
+                f'Page size must not exceed {limits.max_page_size}.')
+        if page is not None and page > limits.max_page_depth:
+            raise QueryTooExpensive(
+                f'Page must not exceed {limits.max_page_depth}; '
+                f'narrow the filters instead.')
+
+        for key, value in api_query.queries.items():
+            op = key.rsplit('__', 1)[-1]
+            if op in _LIST_OPS and isinstance(value, (list, tuple, set)) \
+                    and len(value) > limits.max_in_list_length:
+                raise QueryTooExpensive(
+                    f"'{key}' must not have more than "
+                    f'{limits.max_in_list_length} values.')
+            if op == ApiListQueryOp.LIKE.value \
+                    and not limits.allow_leading_wildcard \
+                    and isinstance(value, str) \
+                    and value.startswith(_LIKE_WILDCARDS):
+                raise QueryTooExpensive(
+                    f"'{key}' must not start with a wildcard.")
+
+    async def check_cost(
+            self,
+            stmt: Select[Any],
+            estimator: QueryCostEstimator,
+    ) -> None:
+        """Check the planner's estimated cost of `stmt` against the budget.
+
+        Does nothing when `max_plan_cost` is 0.
+
+        Raises:
+            QueryTooExpensive: If the estimated cost exceeds the budget.
+        """
+        if self._limits.max_plan_cost <= 0:
+            return
+
+        cost = await estimator.estimate(stmt)
+        if cost > self._limits.max_plan_cost:
+            raise QueryTooExpensive(
+                'Query is too expensive; narrow the filters.',
+                detail=f'Estimated cost {cost:.0f} exceeds the budget of '
+                       f'{self._limits.max_plan_cost:.0f}.',
+            )
@@ -22,10 +22,12 @@ class LoginUseCase(
             user_auth_service: UserAuthService,
             login_session_service: LoginSessionService,
             login_session_repository: LoginSessionRepository,
+            signed_cookie: bool = False,
     ):
         self._user_auth_service = user_auth_service
         self._login_session_service = login_session_service
         self._login_session_repository = login_session_repository
+        self._signed_cookie = signed_cookie
 
     async def __call__(
             self,
@@ -46,7 +48,8 @@ class LoginUseCase(
         session = self._login_session_service.create_session(user)
         _added_session = await self._login_session_repository.add(session)
 
-        cookie_data = session_cookie_config.model_dump() | {
-            'value': session.id}
+        value = self._login_session_service.sign_session(session) \
+            if self._signed_cookie else session.id
+        cookie_data = session_cookie_config.model_dump() | {'value': value}
 
         return SessionCookie.model_validate(cookie_data)
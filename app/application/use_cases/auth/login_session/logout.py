@@ -1,9 +1,11 @@
 """Logout use case."""
+import functools
 from logging import getLogger
 from typing import Any
 
 from app.application.use_cases.base import AsyncBaseUseCase
 from app.domain.repositories.login_session import LoginSessionRepository
+from app.domain.services.auth.login_session import LoginSessionCache
 
 logger = getLogger('uvicorn')
 
@@ -16,8 +18,10 @@ class LogoutUseCase(
     def __init__(
             self,
             login_session_repository: LoginSessionRepository,
+            login_session_cache: LoginSessionCache,
     ):
         self._login_session_repository = login_session_repository
+        self._login_session_cache = login_session_cache
 
     async def __call__(
             self,
@@ -34,3 +38,9 @@ class LogoutUseCase(
             return
 
         await self._login_session_repository.delete(session_id)
+        await self._login_session_cache.invalidate(session_id)
+        # Requests of this process may read the session until the delete
+        # commits, and cache it again.
+        self._login_session_repository.after_commit(
+            functools.partial(
+                self._login_session_cache.invalidate_local, session_id))
@@ -1,16 +1,20 @@
 """Base class of application use cases."""
 
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar, Any
+from typing import Generic, TypeVar, Any, Callable, ClassVar, Collection, \
+    Sequence
 
 from pydantic import BaseModel
-from sqlalchemy import Select
+from sqlalchemy import Row, Select
 from sqlmodel import SQLModel
 
 from app.application.dto.base import ApiListQueryDtoBaseModel
-from app.application.exc import EntityNotFound
+from app.application.exc import EntityNotFound, NotModified
+from app.application.queries.list_query_guard import ListQueryGuard
 from app.domain.repositories.base import BaseQueryFactory, \
     AsyncBaseRepository
+from app.domain.services.cache import TaggedCache
+from app.domain.services.etag import entity_etag, etag_matches, page_etag
 from app.domain.value_objects.api_query import ApiListQuery
 
 T = TypeVar('T')
@@ -60,19 +64,87 @@ class BaseListUseCase(
     BaseUseCase[Select[tuple[EntityT]]],
     Generic[ApiListQueryT, EntityT],
 ):
-    """Async list use case base class."""
+    """Async list use case base class.
+
+    When a `guard` is given, the query and pagination are checked against its
+    limits before the statement is built.
+    """
 
     def __init__(
             self,
             query_factory: BaseQueryFactory[EntityT],
+            guard: ListQueryGuard | None = None,
     ) -> None:
         """Constructor."""
         self._query_factory = query_factory
+        self._guard = guard
+
+    def __call__(
+            self,
+            api_query: ApiListQueryT,
+            page: int | None = None,
+            size: int | None = None,
+            includes: Collection[str] = (),
+    ) -> Select[tuple[EntityT]]:
+        """Build the list statement.
+
+        Related entities named in `includes` are loaded with the page.
 
-    def __call__(self, api_query: ApiListQueryT) -> Select[tuple[EntityT]]:
+        Raises:
+            QueryTooExpensive: If the guard rejects the query.
+        """
         domain_model = api_query.to_domain() \
             if api_query is not None else ApiListQuery.empty()
-        return self._query_factory.list_query(domain_model)
+        if self._guard is not None:
+            self._guard.check(domain_model, page=page, size=size)
+        return self._query_factory.list_query(
+            domain_model, includes=includes)
+
+
+class ETagPageTransformer(Generic[EntityT]):
+    """Wraps a list transformer to answer conditional requests for a page.
+
+    The ETag of the page is computed from the `(id, updated_at)` of the raw
+    rows returned by the page query and the `total`, `page` and `size` of
+    the page, before the rows are transformed. The page is built after the
+    transformation, so `total` must be counted before the page query runs.
+    """
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def __init__(
+            self,
+            transformer: Callable[[Sequence[Any]], Sequence[Any]],
+            total: int | None,
+            page: int | None,
+            size: int | None,
+            variant: str = '',
+            if_none_match: str | None = None,
+    ) -> None:
+        """Constructor."""
+        self._transformer = transformer
+        self._total = total
+        self._page = page
+        self._size = size
+        self._variant = variant
+        self._if_none_match = if_none_match
+        self.etag: str | None = None
+
+    def __call__(self, xs: Sequence[EntityT | Row[Any]]) -> Sequence[Any]:
+        """Transform the rows of the page.
+
+        Raises:
+            NotModified: If `if_none_match` matches the ETag of the page.
+                The rows are not transformed in that case.
+        """
+        # Rows of queries selecting extra columns carry the entity first.
+        entities = (x[0] if isinstance(x, Row) else x for x in xs)
+        self.etag = page_etag(
+            ((getattr(x, 'id'), getattr(x, 'updated_at', None))
+             for x in entities),
+            self._total, self._page, self._size, variant=self._variant)
+        if etag_matches(self._if_none_match, self.etag):
+            raise NotModified('Page has not been modified.', self.etag)
+        return self._transformer(xs)
 
 
 class AsyncBaseGetByIdUseCase(
@@ -80,7 +152,11 @@ class AsyncBaseGetByIdUseCase(
     Generic[IdT, ApiQueryT, ApiBodyT, EntityT, ReturnT],
     ABC
 ):
-    """Async get use case base class."""
+    """Async get use case base class.
+
+    After a call, `etag` holds the strong ETag of the returned
+    representation, derived from the entity's `id` and `updated_at`.
+    """
 
     def __init__(
             self,
@@ -88,23 +164,45 @@ class AsyncBaseGetByIdUseCase(
     ) -> None:
         """Constructor."""
         self._repository: AsyncBaseRepository[IdT, EntityT] = repository
+        self.etag: str | None = None
 
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
     async def __call__(
             self,
             entity_id: IdT,
             query: ApiQueryT,
             body: ApiBodyT,
             *args: Any,
+            if_none_match: str | None = None,
+            load_options: list[Any] | None = None,
             **kwargs: Any,
     ) -> ReturnT:
-        """Execute the use case."""
-        entity = await self._repository.get_by_id(entity_id)
+        """Execute the use case.
+
+        `load_options` are passed to the repository, e.g. to load the
+        related entities the DTO conversion reads.
+
+        Raises:
+            EntityNotFound: If the entity does not exist.
+            NotModified: If `if_none_match` matches the current ETag. The
+                DTO conversion is skipped in that case.
+        """
+        entity = await self._repository.get_by_id(
+            entity_id, load_options=load_options)
         if not entity:
             raise EntityNotFound(
                 EntityNotFound.to_msg(entity_id),
                 detail=f'Entity with ID {entity_id} does not exist.'
             )
 
+        self.etag = entity_etag(
+            getattr(entity, 'id'),
+            getattr(entity, 'updated_at', None),
+            variant=query.model_dump_json() if query is not None else '',
+        )
+        if etag_matches(if_none_match, self.etag):
+            raise NotModified('Entity has not been modified.', self.etag)
+
         return self._to_return_dto(entity, query, body)
 
     @abstractmethod
@@ -117,20 +215,94 @@ class AsyncBaseGetByIdUseCase(
         """Convert an EntityT to a ReturnDTO."""
 
 
-class AsyncBaseCreateUseCase(
-    AsyncBaseUseCase[ReturnT],
-    Generic[IdT, ApiQueryT, EntityT, CreateT, ReturnT],
+class AsyncBaseGetManyByIdsUseCase(
+    AsyncBaseUseCase[list[ReturnT | None]],
+    Generic[IdT, ApiQueryT, EntityT, ReturnT],
     ABC
 ):
-    """Async create use case base class."""
+    """Async batch get use case base class.
+
+    All the entities are fetched in a single query and returned in the order
+    of the requested IDs, with None for IDs without an entity. Repeated IDs
+    are fetched once.
+    """
 
     def __init__(
             self,
-            repository: AsyncBaseRepository[IdT, EntityT],
+            repository: AsyncBaseRepository[IdT, EntityT]
     ) -> None:
         """Constructor."""
         self._repository: AsyncBaseRepository[IdT, EntityT] = repository
 
+    async def __call__(
+            self,
+            entity_ids: Sequence[IdT],
+            query: ApiQueryT,
+            *args: Any,
+            **kwargs: Any,
+    ) -> list[ReturnT | None]:
+        """Execute the use case."""
+        found = await self._repository.get_many_by_ids(
+            list(dict.fromkeys(entity_ids)))
+        found_ids = list(found)
+        dtos = dict(zip(
+            found_ids,
+            self._to_return_dtos([found[x] for x in found_ids], query),
+        ))
+        return [dtos.get(entity_id) for entity_id in entity_ids]
+
+    @abstractmethod
+    def _to_return_dtos(
+            self,
+            entities: Sequence[EntityT],
+            query: ApiQueryT,
+    ) -> Sequence[ReturnT]:
+        """Convert EntityTs to ReturnDTOs, in the same order."""
+
+
+class AsyncBaseWriteUseCase(
+    AsyncBaseUseCase[T],
+    Generic[IdT, EntityT, T],
+    ABC
+):
+    """Async base class of the use cases that write entities.
+
+    Cached entries tagged with any of `_cache_tags` are dropped from `cache`
+    once the transaction of the write commits, whoever calls the use case.
+    """
+    _cache_tags: ClassVar[Collection[str]] = ()
+
+    def __init__(
+            self,
+            repository: AsyncBaseRepository[IdT, EntityT],
+            cache: TaggedCache | None = None,
+    ) -> None:
+        """Constructor.
+
+        Raises:
+            ValueError: If the use case has `_cache_tags` but no `cache`.
+        """
+        if self._cache_tags and cache is None:
+            raise ValueError(
+                f'{type(self).__name__} needs the cache it invalidates.')
+        self._repository: AsyncBaseRepository[IdT, EntityT] = repository
+        self._cache = cache
+
+    def _invalidate_cache_on_commit(self) -> None:
+        cache = self._cache
+        if cache is None or not self._cache_tags:
+            return
+        tags = list(self._cache_tags)
+        self._repository.after_commit(lambda: cache.invalidate_tags(tags))
+
+
+class AsyncBaseCreateUseCase(
+    AsyncBaseWriteUseCase[IdT, EntityT, ReturnT],
+    Generic[IdT, ApiQueryT, EntityT, CreateT, ReturnT],
+    ABC
+):
+    """Async create use case base class."""
+
     async def __call__(
             self,
             dto: CreateT,
@@ -141,6 +313,7 @@ class AsyncBaseCreateUseCase(
         """Execute the use case."""
         entity = self._from_create_dto(dto, query)
         created_entity = await self._repository.add(entity)
+        self._invalidate_cache_on_commit()
 
         return self._to_return_dto(created_entity, query)
 
@@ -154,19 +327,12 @@ class AsyncBaseCreateUseCase(
 
 
 class AsyncBaseUpdateUseCase(
-    AsyncBaseUseCase[ReturnT],
+    AsyncBaseWriteUseCase[IdT, EntityT, ReturnT],
     Generic[IdT, ApiQueryT, EntityT, UpdateT, ReturnT],
     ABC
 ):
     """Async update use case base class."""
 
-    def __init__(
-            self,
-            repository: AsyncBaseRepository[IdT, EntityT],
-    ) -> None:
-        """Constructor."""
-        self._repository: AsyncBaseRepository[IdT, EntityT] = repository
-
     async def __call__(
             self,
             entity_id: IdT,
@@ -178,6 +344,7 @@ class AsyncBaseUpdateUseCase(
         """Execute the use case."""
         data = self._from_update_dto(dto, query)
         updated_entity = await self._repository.update(entity_id, data)
+        self._invalidate_cache_on_commit()
 
         return self._to_return_dto(updated_entity, query)
 
@@ -192,19 +359,12 @@ class AsyncBaseUpdateUseCase(
 
 
 class AsyncBaseLogicalDeleteUseCase(
-    AsyncBaseUseCase[None],
+    AsyncBaseWriteUseCase[IdT, EntityT, None],
     Generic[IdT, EntityT],
     ABC
 ):
     """Async logical delete use case base class."""
 
-    def __init__(
-            self,
-            repository: AsyncBaseRepository[IdT, EntityT],
-    ) -> None:
-        """Constructor."""
-        self._repository: AsyncBaseRepository[IdT, EntityT] = repository
-
     async def __call__(
             self,
             entity_id: IdT,
@@ -213,22 +373,16 @@ class AsyncBaseLogicalDeleteUseCase(
     ) -> None:
         """Execute the use case."""
         await self._repository.logical_delete(entity_id)
+        self._invalidate_cache_on_commit()
 
 
 class AsyncBasePhysicalDeleteUseCase(
-    AsyncBaseUseCase[None],
+    AsyncBaseWriteUseCase[IdT, EntityT, None],
     Generic[IdT, EntityT],
     ABC
 ):
     """Async physical delete use case base class."""
 
-    def __init__(
-            self,
-            repository: AsyncBaseRepository[IdT, EntityT],
-    ) -> None:
-        """Constructor."""
-        self._repository: AsyncBaseRepository[IdT, EntityT] = repository
-
     async def __call__(
             self,
             entity_id: IdT,
@@ -237,3 +391,4 @@ class AsyncBasePhysicalDeleteUseCase(
     ) -> None:
         """Execute the use case."""
         await self._repository.delete(entity_id)
+        self._invalidate_cache_on_commit()
@@ -0,0 +1,21 @@
+"""SampleItem batch get use case."""
+from typing import Sequence
+
+from app.application.dto.sample_item import SampleItemReadDto, \
+    SampleItemGetQuery
+from app.application.use_cases.base import AsyncBaseGetManyByIdsUseCase
+from app.application.use_cases.sample_item.common import \
+    sample_items_to_read_dtos
+from app.domain.entities.sample_item import SampleItem
+
+
+class SampleItemGetManyByIdsUseCase(
+    AsyncBaseGetManyByIdsUseCase[
+        int, SampleItemGetQuery, SampleItem, SampleItemReadDto]
+):
+    """SampleItem batch get use case."""
+
+    def _to_return_dtos(self, entities: Sequence[SampleItem],
+                        query: SampleItemGetQuery,
+                        ) -> Sequence[SampleItemReadDto]:
+        return sample_items_to_read_dtos(entities, query)
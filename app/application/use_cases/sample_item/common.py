@@ -1,25 +1,44 @@
 """Common functions for SampleItem use case."""
-from typing import Sequence
+from typing import Any, Sequence
 
 from pydantic import TypeAdapter
+from sqlalchemy import Row
 
 from app.application.dto.sample_item import SampleItemReadDto, \
-    SampleItemGetQuery, SampleItemReadDtoWithMeta
-from app.domain.entities.sample_item import SampleItem
+    SampleItemGetQuery, SampleItemReadDtoWithMeta, SampleItemBatchDto, \
+    SampleItemBatchEntryDto
+from app.domain.entities.sample_item import SampleItem, SampleItemLengths
 from app.domain.services.sample_item_service import SampleItemService
 
+# Cache tag shared by every cached response built from `sample_items` rows.
+SAMPLE_ITEMS_CACHE_TAG = SampleItem.__tablename__
+
+_READ_FIELDS = tuple(SampleItemReadDto.model_fields)
+# Built once, their validators are reused by every page.
+_READ_LIST_ADAPTER = TypeAdapter(list[SampleItemReadDto])
+_READ_WITH_META_LIST_ADAPTER = TypeAdapter(list[SampleItemReadDtoWithMeta])
+
 
 def sample_item_to_read(data: SampleItem) -> SampleItemReadDto:
     """Read SampleItem from SampleItem."""
     return SampleItemReadDto.model_validate(data)
 
 
+def _with_meta_to_read(
+        data: SampleItem,
+        meta_data: SampleItemLengths | dict[str, Any],
+) -> SampleItemReadDtoWithMeta:
+    """Validate the read fields of `data` and `meta_data` in one pass."""
+    fields = {field: getattr(data, field) for field in _READ_FIELDS}
+    fields['meta_data'] = meta_data
+    return SampleItemReadDtoWithMeta.model_validate(fields)
+
+
 def sample_item_with_meta_to_read(
         data: SampleItem) -> SampleItemReadDtoWithMeta:
     """Read SampleItem with meta from SampleItem."""
-    lengths = SampleItemService.calculate_lengths(data)
-    merged = data.model_dump() | {'meta_data': lengths.model_dump()}
-    return SampleItemReadDtoWithMeta.model_validate(merged)
+    return _with_meta_to_read(
+        data, SampleItemService.calculate_lengths(data))
 
 
 def sample_item_to_read_dto(
@@ -35,15 +54,56 @@ def sample_item_to_read_dto(
 
 def sample_item_list_transformer(
         xs: Sequence[SampleItem]) -> Sequence[SampleItemReadDto]:
-    """Transform a list of SampleItems into SampleItemRead."""
-    transformed = [sample_item_to_read(x) for x in xs]
-    adapter = TypeAdapter(list[SampleItemReadDto])
-    return adapter.validate_python(transformed)
+    """Transform a list of SampleItems into SampleItemRead.
+
+    Each entity is validated once, from its attributes.
+    """
+    return _READ_LIST_ADAPTER.validate_python(xs, from_attributes=True)
 
 
 def sample_item_with_meta_list_transformer(
-        xs: Sequence[SampleItem]) -> Sequence[SampleItemReadDtoWithMeta]:
-    """Transform a list of SampleItems into SampleItemReadWithMeta."""
-    transformed = [sample_item_with_meta_to_read(x) for x in xs]
-    adapter = TypeAdapter(list[SampleItemReadDtoWithMeta])
-    return adapter.validate_python(transformed)
+        xs: Sequence[Row[tuple[SampleItem, int, int]]],
+) -> Sequence[SampleItemReadDtoWithMeta]:
+    """Transform rows of `SampleItemQueryFactory.with_meta` queries into
+    SampleItemReadWithMeta.
+
+    The lengths come from the query, so each row maps straight into the DTO
+    and the page is validated in a single pass.
+    """
+    return _READ_WITH_META_LIST_ADAPTER.validate_python([
+        {field: getattr(entity, field) for field in _READ_FIELDS} | {
+            'meta_data': {
+                'name_length': name_length,
+                'description_length': description_length,
+            },
+        }
+        for entity, name_length, description_length in xs
+    ])
+
+
+def sample_items_to_read_dtos(
+        xs: Sequence[SampleItem],
+        query: SampleItemGetQuery,
+) -> Sequence[SampleItemReadDto]:
+    """Read many SampleItems, with meta data if the query asks for it."""
+    if not query.with_meta:
+        return sample_item_list_transformer(xs)
+
+    return _READ_WITH_META_LIST_ADAPTER.validate_python([
+        {field: getattr(entity, field) for field in _READ_FIELDS}
+        | {'meta_data': meta_data}
+        for entity, meta_data in zip(
+            xs, SampleItemService.calculate_lengths_many(xs))
+    ])
+
+
+def sample_item_batch_to_read(
+        ids: Sequence[int | str],
+        results: Sequence[SampleItemReadDto | None],
+) -> SampleItemBatchDto:
+    """Pair batch get results with the requested IDs."""
+    return SampleItemBatchDto(items=[
+        SampleItemBatchEntryDto(
+            id=entity_id, found=result is not None, item=result)
+        for entity_id, result in zip(ids, results)
+    ])
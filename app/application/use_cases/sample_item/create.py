@@ -4,7 +4,8 @@ from shortuuid import uuid
 from app.application.dto.sample_item import SampleItemCreate, \
     SampleItemReadDto
 from app.application.use_cases.base import AsyncBaseCreateUseCase
-from app.application.use_cases.sample_item.common import sample_item_to_read
+from app.application.use_cases.sample_item.common import \
+    SAMPLE_ITEMS_CACHE_TAG, sample_item_to_read
 from app.domain.entities.sample_item import SampleItem
 
 
@@ -14,6 +15,7 @@ class SampleItemCreateUseCase(
         SampleItemReadDto],
 ):
     """SampleItem create use case implementation."""
+    _cache_tags = (SAMPLE_ITEMS_CACHE_TAG,)
 
     def _from_create_dto(
             self,
@@ -1,5 +1,7 @@
 """SampleItem logical delete use case."""
 from app.application.use_cases.base import AsyncBaseLogicalDeleteUseCase
+from app.application.use_cases.sample_item.common import \
+    SAMPLE_ITEMS_CACHE_TAG
 from app.domain.entities.sample_item import SampleItem
 
 
@@ -7,3 +9,4 @@ class SampleItemLogicalDeleteUseCase(
     AsyncBaseLogicalDeleteUseCase[int, SampleItem]
 ):
     """SampleItem logical delete use case."""
+    _cache_tags = (SAMPLE_ITEMS_CACHE_TAG,)
@@ -0,0 +1,38 @@
+"""SampleItem search use case."""
+from sqlalchemy import Select
+
+from app.application.dto.sample_item import SampleItemSearchQuery
+from app.application.queries.list_query_guard import ListQueryGuard
+from app.application.use_cases.base import BaseUseCase
+from app.domain.entities.sample_item import SampleItem
+from app.domain.repositories.sample_item import SampleItemQueryFactory
+from app.domain.value_objects.api_query import ApiListQuery
+
+
+# pylint: disable=too-few-public-methods
+class SampleItemSearchUseCase(BaseUseCase[Select[tuple[SampleItem]]]):
+    """SampleItem full-text search use case implementation."""
+
+    def __init__(
+            self,
+            query_factory: SampleItemQueryFactory,
+            guard: ListQueryGuard | None = None,
+    ) -> None:
+        """Constructor."""
+        self._query_factory = query_factory
+        self._guard = guard
+
+    def __call__(
+            self,
+            query: SampleItemSearchQuery,
+            page: int | None = None,
+            size: int | None = None,
+    ) -> Select[tuple[SampleItem]]:
+        """Build the search statement.
+
+        Raises:
+            QueryTooExpensive: If the guard rejects the pagination.
+        """
+        if self._guard is not None:
+            self._guard.check(ApiListQuery.empty(), page=page, size=size)
+        return self._query_factory.search_query(query.q)
@@ -0,0 +1,79 @@
+"""SampleItem delta sync use case."""
+from datetime import datetime, timedelta
+from typing import cast
+
+from app.application.dto.sample_item import SampleItemSyncDto, \
+    SampleItemSyncQuery, SampleItemTombstoneDto
+from app.application.exc import InvalidSyncWatermark
+from app.application.use_cases.base import AsyncBaseUseCase
+from app.application.use_cases.sample_item.common import sample_item_to_read
+from app.domain.repositories.sample_item import SampleItemRepository
+from app.domain.value_objects.sync import SyncWatermark
+
+
+# pylint: disable=too-few-public-methods
+class SampleItemSyncUseCase(AsyncBaseUseCase[SampleItemSyncDto]):
+    """SampleItem delta sync use case implementation.
+
+    The watermark is never later than the current time minus `overlap`,
+    the horizon, so changes from transactions that were still running are
+    fetched by the next sync even when they are stamped before changes
+    already returned. While the last returned change is older than the
+    horizon and more follow, the watermark is its position and `has_more`
+    is true. Otherwise the watermark is the horizon, and changes within it
+    are returned again by the next sync. Clients must apply changes
+    idempotently by `uuid`.
+    """
+
+    def __init__(
+            self,
+            repository: SampleItemRepository,
+            overlap: timedelta,
+    ) -> None:
+        """Constructor."""
+        self._repository = repository
+        self._overlap = overlap
+
+    async def __call__(self, query: SampleItemSyncQuery) -> SampleItemSyncDto:
+        """Execute the use case.
+
+        Raises:
+            InvalidSyncWatermark: If `query.since` is not a valid watermark.
+        """
+        try:
+            since = SyncWatermark.decode(query.since) \
+                if query.since is not None else None
+        except ValueError as err:
+            raise InvalidSyncWatermark(
+                'Invalid sync watermark.', detail=str(err)) from err
+
+        now = await self._repository.current_timestamp()
+        entities = await self._repository.list_changed_since(
+            since, query.limit + 1)
+        has_more = len(entities) > query.limit
+        entities = entities[:query.limit]
+
+        watermark = SyncWatermark(updated_at=now - self._overlap)
+        if has_more:
+            last = entities[-1]
+            if (last.updated_at, last.id) < (
+                    watermark.updated_at, watermark.id):
+                watermark = SyncWatermark(
+                    updated_at=cast(datetime, last.updated_at),
+                    id=cast(int, last.id),
+                )
+            else:
+                # Paging past the horizon could skip late commits, and
+                # paging from it would return this page again.
+                has_more = False
+
+        return SampleItemSyncDto(
+            items=[sample_item_to_read(x) for x in entities
+                   if x.deleted_at is None],
+            tombstones=[
+                SampleItemTombstoneDto(uuid=x.uuid, deleted_at=x.deleted_at)
+                for x in entities if x.deleted_at is not None
+            ],
+            watermark=watermark.encode(),
+            has_more=has_more,
+        )
@@ -4,7 +4,8 @@ from typing import Any
 from app.application.dto.sample_item import SampleItemUpdateDto, \
     SampleItemReadDto
 from app.application.use_cases.base import AsyncBaseUpdateUseCase, ReturnT
-from app.application.use_cases.sample_item.common import sample_item_to_read
+from app.application.use_cases.sample_item.common import \
+    SAMPLE_ITEMS_CACHE_TAG, sample_item_to_read
 from app.domain.entities.sample_item import SampleItem
 
 
@@ -13,6 +14,7 @@ class SampleItemUpdateUseCase(
         int, None, SampleItem, SampleItemUpdateDto, SampleItemReadDto]
 ):
     """SampleItem update use case."""
+    _cache_tags = (SAMPLE_ITEMS_CACHE_TAG,)
 
     def _to_return_dto(
             self,
@@ -1,20 +1,70 @@
 """Common functions for User use case."""
-from typing import Sequence
+from typing import Callable, Collection, Sequence
 
 from pydantic import TypeAdapter
 
-from app.application.dto.user import UserReadDto
+from app.application.dto.user import UserReadDto, UserReadDtoWithRelated, \
+    UserReadDtoWithPermissions
 from app.domain.entities.user import User
 
+# Built once, its validator is reused by every page.
+_READ_LIST_ADAPTER = TypeAdapter(list[UserReadDto])
+_READ_WITH_RELATED_LIST_ADAPTER = TypeAdapter(list[UserReadDtoWithRelated])
+_READ_WITH_PERMISSIONS_LIST_ADAPTER = TypeAdapter(
+    list[UserReadDtoWithPermissions])
+
 
 def user_to_read(data: User) -> UserReadDto:
     """Convert user to user read dto."""
     return UserReadDto.model_validate(data)
 
 
+def user_read_dto_cls(includes: Collection[str]) -> type[UserReadDto] \
+        | type[UserReadDtoWithRelated] | type[UserReadDtoWithPermissions]:
+    """User read dto class holding the related entities in `includes`.
+
+    Only relations loaded with the user may be read, since reading another
+    one would lazy load it.
+    """
+    if 'permissions' in includes:
+        return UserReadDtoWithPermissions
+    if 'roles' in includes:
+        return UserReadDtoWithRelated
+    return UserReadDto
+
+
 def user_list_transformer(
         xs: Sequence[User]) -> Sequence[UserReadDto]:
-    """Transform a list of users into user read."""
-    transformed = [user_to_read(x) for x in xs]
-    adapter = TypeAdapter(list[UserReadDto])
-    return adapter.validate_python(transformed)
+    """Transform a list of users into user read.
+
+    Each entity is validated once, from its attributes.
+    """
+    return _READ_LIST_ADAPTER.validate_python(xs, from_attributes=True)
+
+
+def user_with_related_list_transformer(
+        xs: Sequence[User]) -> Sequence[UserReadDtoWithRelated]:
+    """Transform a list of users with loaded roles into user read."""
+    return _READ_WITH_RELATED_LIST_ADAPTER.validate_python(
+        xs, from_attributes=True)
+
+
+def user_with_permissions_list_transformer(
+        xs: Sequence[User]) -> Sequence[UserReadDtoWithPermissions]:
+    """Transform a list of users with loaded roles and permissions into
+    user read."""
+    return _READ_WITH_PERMISSIONS_LIST_ADAPTER.validate_python(
+        xs, from_attributes=True)
+
+
+def user_list_transformer_for(
+        includes: Collection[str],
+) -> Callable[[Sequence[User]], Sequence[UserReadDto]
+              | Sequence[UserReadDtoWithRelated]
+              | Sequence[UserReadDtoWithPermissions]]:
+    """List transformer reading the related entities in `includes`."""
+    if 'permissions' in includes:
+        return user_with_permissions_list_transformer
+    if 'roles' in includes:
+        return user_with_related_list_transformer
+    return user_list_transformer
@@ -1,4 +1,6 @@
 """User create use case."""
+from typing import Any
+
 from shortuuid import uuid
 
 from app.application.dto.user import UserCreate, UserReadDto
@@ -23,6 +25,23 @@ class UserCreateUseCase(
     ):
         super().__init__(repository)
         self._user_auth_service = user_auth_service
+        self._password_hash: str | None = None
+
+    async def __call__(
+            self,
+            dto: UserCreate,
+            query: None,
+            *args: Any,
+            **kwargs: Any,
+    ) -> UserReadDto:
+        """Execute the use case.
+
+        The password is hashed first, since the entity conversion is
+        synchronous and hashing is not.
+        """
+        self._password_hash = await self._user_auth_service.hash_password(
+            dto.password)
+        return await super().__call__(dto, query, *args, **kwargs)
 
     def _from_create_dto(
             self,
@@ -31,9 +50,7 @@ class UserCreateUseCase(
     ) -> User:
         data_dict = dto.model_dump()
         data_dict['uuid'] = uuid()
-        data_dict['password_hash'] = self._user_auth_service.hash_password(
-            data_dict['password']
-        )
+        data_dict['password_hash'] = self._password_hash
         del data_dict['password']
 
         return User.model_validate(data_dict)
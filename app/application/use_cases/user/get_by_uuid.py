@@ -1,7 +1,9 @@
 """User get use case."""
-from app.application.dto.user import UserReadDto
+from app.application.dto.user import UserReadDto, UserIncludeQueryDto, \
+    UserReadDtoWithRelated, UserReadDtoWithPermissions
 from app.application.use_cases.base import AsyncBaseGetByIdUseCase
-from app.application.use_cases.user.common import user_to_read
+from app.application.use_cases.user.common import user_to_read, \
+    user_read_dto_cls
 from app.domain.entities.user import User
 
 
@@ -14,3 +16,20 @@ class UserGetByUUIDUseCase(
     def _to_return_dto(self, entity: User, query: None, body: None
                        ) -> UserReadDto:
         return user_to_read(entity)
+
+
+class UserWithRelatedGetByUUIDUseCase(
+    AsyncBaseGetByIdUseCase[
+        str, UserIncludeQueryDto, None, User,
+        UserReadDto | UserReadDtoWithRelated | UserReadDtoWithPermissions]
+):
+    """User get use case reading the included related entities.
+
+    The related entities must be loaded with the user, through the
+    `load_options` of the query factory for the same includes.
+    """
+
+    def _to_return_dto(
+            self, entity: User, query: UserIncludeQueryDto, body: None,
+    ) -> UserReadDto | UserReadDtoWithRelated | UserReadDtoWithPermissions:
+        return user_read_dto_cls(query.includes).model_validate(entity)
@@ -0,0 +1,93 @@
+"""Calibrate password hashing.
+
+Measures the verify latency of the password hasher on this machine for
+increasing costs, and prints the settings with the highest cost that stays
+within the target. Run it on the production hardware, then set the printed
+values; stored hashes are upgraded on the next login of each user.
+"""
+import logging
+import os
+import statistics
+import sys
+import time
+
+import click
+
+# NEED this when executing this file from other directory.
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.infrastructure.services.password_hasher import ARGON2, BCRYPT, \
+    PasslibPasswordHasher
+
+logger = logging.getLogger('uvicorn')
+
+MAX_BCRYPT_ROUNDS = 20
+MAX_ARGON2_TIME_COST = 32
+
+
+def verify_ms(hasher: PasslibPasswordHasher, samples: int) -> float:
+    """Median latency of verifying a password, in milliseconds."""
+    password = 'calibration-password'
+    password_hash = hasher.hash(password)
+    latencies = []
+    for _ in range(samples):
+        started = time.perf_counter()
+        hasher.verify_and_update(password, password_hash)
+        latencies.append((time.perf_counter() - started) * 1000)
+    return statistics.median(latencies)
+
+
+@click.command()
+@click.option('--scheme', type=click.Choice([BCRYPT, ARGON2]),
+              default=BCRYPT, show_default=True,
+              help="Password hash scheme.")
+@click.option('--target-ms', default=250.0, show_default=True,
+              help="Maximum verify latency.")
+@click.option('--samples', default=5, show_default=True,
+              help="Verifications measured per cost.")
+@click.option('--argon2-memory-cost-kib', default=65536, show_default=True,
+              help="argon2 memory cost, kept fixed.")
+@click.option('--argon2-parallelism', default=4, show_default=True,
+              help="argon2 parallelism, kept fixed.")
+def main(
+        scheme: str,
+        target_ms: float,
+        samples: int,
+        argon2_memory_cost_kib: int,
+        argon2_parallelism: int,
+) -> None:
+    """Pick the password hashing cost for a target verify latency."""
+    logging.basicConfig(level=logging.INFO)
+    logging.getLogger('uvicorn').setLevel(logging.INFO)
+
+    if scheme == BCRYPT:
+        costs = range(4, MAX_BCRYPT_ROUNDS + 1)
+        cost_setting = 'PASSWORD_BCRYPT_ROUNDS'
+    else:
+        costs = range(1, MAX_ARGON2_TIME_COST + 1)
+        cost_setting = 'PASSWORD_ARGON2_TIME_COST'
+
+    chosen = costs[0]
+    for cost in costs:
+        hasher = PasslibPasswordHasher(
+            scheme=scheme,
+            bcrypt_rounds=cost,
+            argon2_time_cost=cost,
+            argon2_memory_cost_kib=argon2_memory_cost_kib,
+            argon2_parallelism=argon2_parallelism,
+        )
+        latency = verify_ms(hasher, samples)
+        logger.info('%s=%d: %.1f ms', cost_setting, cost, latency)
+        if latency > target_ms:
+            break
+        chosen = cost
+
+    click.echo(f'PASSWORD_HASH_SCHEME={scheme}')
+    click.echo(f'{cost_setting}={chosen}')
+    if scheme == ARGON2:
+        click.echo(f'PASSWORD_ARGON2_MEMORY_COST_KIB={argon2_memory_cost_kib}')
+        click.echo(f'PASSWORD_ARGON2_PARALLELISM={argon2_parallelism}')
+
+
+if __name__ == '__main__':
+    main()  # pylint: disable=no-value-for-parameter
@@ -38,6 +38,25 @@ class Settings(BaseSettings):
     login_session_cookie_secure: bool = True
     login_session_cookie_httponly: bool = True
     login_session_cookie_samesite: str = 'lax'
+    # With the signed session cookie auth method, revoked sessions may be
+    # accepted for this long.
+    login_session_revocation_check_interval_seconds: float = 60.0
+
+    # login session reaper
+    # Expired and logically deleted sessions are deleted every interval, in
+    # batches of this size with a pause between them.
+    login_session_reap_interval_seconds: float = 300.0
+    login_session_reap_batch_size: int = 500
+    login_session_reap_batch_pause_seconds: float = 0.1
+
+    # login session cache
+    # Sessions are cached in process for the local TTL and, with a Redis
+    # URL, in Redis for the shared TTL, but never past their expiry. After a
+    # logout, other processes may accept the session for the local TTL. A
+    # TTL of 0 disables a tier.
+    login_session_cache_local_ttl_seconds: float = 5.0
+    login_session_cache_local_max_entries: int = 10000
+    login_session_cache_shared_ttl_seconds: float = 300.0
 
     # token auth
     issuer: str = 'https://fawapp.com'
@@ -46,6 +65,79 @@ class Settings(BaseSettings):
     refresh_token_expire_minutes: int = 60 * 24 * 7
     token_secret_key: str = 'you_must_change_this_key'
     token_algorithm: str = 'HS256'
+    # `stdlib`, `pyjwt` or `jose`. `stdlib` only supports the HS algorithms,
+    # `jose` RS256 but not EdDSA.
+    token_backend: str = 'stdlib'
+    # PEM key files by `kid`, for the RS256 and EdDSA algorithms. Tokens are
+    # signed with the private key of `token_signing_key_id`; the other keys,
+    # private or public only, still verify the tokens they signed. All of
+    # the public keys are served at `/.well-known/jwks.json`.
+    token_key_files: dict[str, str] = {}
+    token_signing_key_id: str = ''
+    jwks_max_age_seconds: int = 300
+    # Payloads of verified access tokens are kept until they expire. 0
+    # disables the cache.
+    access_token_cache_max_entries: int = 10000
+
+    # permissions
+    # Permission masks of roles and users are reloaded after this TTL, so
+    # role changes made elsewhere apply within it. A TTL of 0 disables the
+    # cache.
+    permission_cache_ttl_seconds: float = 60.0
+    permission_cache_max_entries: int = 10000
+
+    # password hashing
+    # Hashes are computed and verified on this many threads. Logins that
+    # wait longer than the queue timeout for one are answered with 503.
+    password_hashing_max_workers: int = 4
+    password_hashing_queue_timeout_seconds: float = 5.0
+    # `bcrypt`, or `argon2` with `argon2-cffi` installed. Stored hashes with
+    # another scheme or other parameters are rehashed on the next login.
+    # `app/calibrate_password_hashing.py` picks them for a target latency.
+    password_hash_scheme: str = 'bcrypt'
+    password_bcrypt_rounds: int = 12
+    password_argon2_time_cost: int = 3
+    password_argon2_memory_cost_kib: int = 65536
+    password_argon2_parallelism: int = 4
+
+    # last login
+    # Login times are queued and written in batches of this many users.
+    last_login_flush_interval_seconds: float = 5.0
+    last_login_flush_batch_size: int = 1000
+
+    # response cache
+    # A TTL of 0 disables the cache.
+    list_cache_ttl_seconds: float = 5.0
+    list_cache_max_entries: int = 1024
+
+    # list query cost guard
+    # A plan cost budget of 0 disables the EXPLAIN check.
+    list_query_max_in_list_length: int = 100
+    list_query_allow_leading_wildcard: bool = True
+    list_query_max_page_size: int = 100
+    list_query_max_page_depth: int = 1000
+    list_query_max_plan_cost: float = 0.0
+
+    # delta sync
+    # Writes that take longer than this to commit may be missed by a sync.
+    sync_watermark_overlap_seconds: float = 5.0
+
+    # response compression
+    # Content codings in order of preference. `br` needs `brotli` or
+    # `brotlicffi` and `zstd` needs `zstandard`, they are skipped otherwise.
+    compression_encodings: list[str] = ['br', 'zstd', 'gzip']
+    compression_minimum_size: int = 1024
+
+    # OpenAPI document
+    # Written by `app/generate_openapi.py` at image build time, which sets
+    # the path. Without it, the startup fails unless the runtime fallback is
+    # enabled, which should only be the case in development and tests.
+    openapi_schema_path: str = ''
+    openapi_runtime_fallback: bool = False
+
+    # redis
+    # Empty disables everything that is shared through Redis.
+    redis_url: str = ''
 
     # FOR TEST ONLY
     pass_hash_for_test: str = 'pass_hash_for_test_auth'
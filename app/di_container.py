@@ -1,13 +1,16 @@
 """DI container."""
 import logging
+from datetime import timedelta
 
 from dependency_injector import containers, providers
 from shortuuid import uuid
 
 from app import config
 from app.application.dto.session_auth import SessionCookieConfig, SameSite
+from app.application.queries.list_query_guard import ListQueryGuard
 from app.domain.factories.sample_item import SampleItemFactory
 from app.domain.factories.token_auth import JwtPayloadFactory
+from app.domain.value_objects.api_query import ApiListQueryLimits
 from app.infrastructure.database.database import Database
 from app.infrastructure.repositories.login_session_in_db import \
     InDBLoginSessionRepository
@@ -16,11 +19,26 @@ from app.infrastructure.repositories.sample_item_in_db import \
     InDBSampleItemByUUIDRepository
 from app.infrastructure.repositories.user_in_db import InDBUserRepository, \
     InDBUserByEmailRepository, InDBUserByUUIDRepository, InDBUserQueryFactory
+from app.infrastructure.services.jwt_backends import create_jwt_backend
+from app.infrastructure.services.key_value_store import RedisKeyValueStore
+from app.infrastructure.services.last_login import \
+    WriteBehindLastLoginRecorder
 from app.infrastructure.services.login_session import LoginSessionServiceImpl
+from app.infrastructure.services.login_session_cache import \
+    TwoTierLoginSessionCache
+from app.infrastructure.services.login_session_reaper import \
+    BatchedLoginSessionReaper
+from app.infrastructure.services.metrics import InMemoryMetricsRecorder
+from app.infrastructure.services.password_hasher import PasslibPasswordHasher
+from app.infrastructure.services.query_cost import PostgresQueryCostEstimator
+from app.infrastructure.services.tagged_cache import InMemoryTaggedCache
 from app.infrastructure.services.token_auth import InDBUserTokenAuthService, \
     JwtTokenServiceImpl
+from app.infrastructure.services.token_cache import CachingJwtTokenService
+from app.infrastructure.services.token_keys import TokenKeyRing
+from app.infrastructure.services.worker_pool import BoundedWorkerPool
 from app.interfaces.middlewares.authorizer import AccessTokenAuthorizer, \
-    SessionCookieAuthorizer
+    AuthMethod, SessionCookieAuthorizer, SignedSessionCookieAuthorizer
 from app.interfaces.middlewares.permission_checker import PermissionChecker
 
 logger = logging.getLogger('uvicorn')
@@ -32,6 +50,7 @@ class Container(containers.DeclarativeContainer):
     wiring_config = containers.WiringConfiguration(
         modules=[
             'app.interfaces.controllers.base',
+            'app.interfaces.controllers.well_known',
             'app.interfaces.controllers.v1.base',
 
             # V1 app endpoints
@@ -39,6 +58,8 @@ class Container(containers.DeclarativeContainer):
             'app.interfaces.controllers.v1.session_auth',
             'app.interfaces.controllers.v1.public.sample_item',
             'app.interfaces.controllers.v1.public.sample_item_by_uuid',
+            'app.interfaces.controllers.v1.public.sample_item_search',
+            'app.interfaces.controllers.v1.public.sample_item_sync',
 
             # V1 app admin endpoints
             'app.interfaces.controllers.v1.admin.user',
@@ -59,6 +80,22 @@ class Container(containers.DeclarativeContainer):
         db.provided.session,
     )
 
+    metrics = providers.Singleton(InMemoryMetricsRecorder)
+
+    list_query_guard = providers.Singleton(
+        ListQueryGuard,
+        limits=ApiListQueryLimits(
+            max_in_list_length=conf.list_query_max_in_list_length,
+            allow_leading_wildcard=conf.list_query_allow_leading_wildcard,
+            max_page_size=conf.list_query_max_page_size,
+            max_page_depth=conf.list_query_max_page_depth,
+            max_plan_cost=conf.list_query_max_plan_cost,
+        ),
+    )
+    query_cost_estimator_factory = providers.Factory(
+        PostgresQueryCostEstimator.factory,
+    )
+
     sample_item_factory = SampleItemFactory(get_now, uuid)
     sample_item_repository = providers.Factory(
         InDBSampleItemRepository.factory,
@@ -71,6 +108,16 @@ class Container(containers.DeclarativeContainer):
     sample_item_query_factory = providers.Factory(
         InDBSampleItemQueryFactory,
     )
+    sample_item_list_cache = providers.Singleton(
+        InMemoryTaggedCache,
+        name='sample_item_list_cache',
+        ttl_seconds=conf.list_cache_ttl_seconds,
+        max_entries=conf.list_cache_max_entries,
+        metrics=metrics,
+    )
+    sync_watermark_overlap = providers.Object(
+        timedelta(seconds=conf.sync_watermark_overlap_seconds),
+    )
 
     user_repository = providers.Factory(
         InDBUserRepository.factory,
@@ -88,9 +135,35 @@ class Container(containers.DeclarativeContainer):
         InDBUserQueryFactory,
     )
 
+    password_hashing_pool = providers.Singleton(
+        BoundedWorkerPool,
+        name='password_hashing',
+        max_workers=conf.password_hashing_max_workers,
+        queue_timeout_seconds=conf.password_hashing_queue_timeout_seconds,
+        metrics=metrics,
+    )
+    password_hasher = providers.Singleton(
+        PasslibPasswordHasher,
+        scheme=conf.password_hash_scheme,
+        bcrypt_rounds=conf.password_bcrypt_rounds,
+        argon2_time_cost=conf.password_argon2_time_cost,
+        argon2_memory_cost_kib=conf.password_argon2_memory_cost_kib,
+        argon2_parallelism=conf.password_argon2_parallelism,
+    )
+    last_login_recorder = providers.Singleton(
+        WriteBehindLastLoginRecorder,
+        session_factory=db_session_factory,
+        user_repository_factory=user_repository,
+        flush_interval_seconds=conf.last_login_flush_interval_seconds,
+        batch_size=conf.last_login_flush_batch_size,
+        metrics=metrics,
+    )
     user_auth_service_factory = providers.Factory(
         InDBUserTokenAuthService.create_factory,
         get_now=get_now,
+        password_hasher=password_hasher,
+        password_hashing_pool=password_hashing_pool,
+        last_login_recorder=last_login_recorder,
     )
     jwt_payload_factory = providers.Factory(
         JwtPayloadFactory,
@@ -100,12 +173,31 @@ class Container(containers.DeclarativeContainer):
         refresh_token_expire_minutes=conf.refresh_token_expire_minutes,
         get_now=get_now,
     )
+    jwt_backend = providers.Singleton(
+        create_jwt_backend,
+        name=conf.token_backend,
+    )
+    token_key_ring = providers.Singleton(
+        TokenKeyRing.from_files,
+        algorithm=conf.token_algorithm,
+        key_files=conf.token_key_files,
+        signing_key_id=conf.token_signing_key_id,
+    )
     jwt_token_service = providers.Factory(
         JwtTokenServiceImpl,
         token_secret_key=conf.token_secret_key,
         token_algorithm=conf.token_algorithm,
         issuer=conf.issuer,
         audience=conf.audience,
+        backend=jwt_backend,
+        key_ring=token_key_ring,
+    )
+    jwks_max_age_seconds = providers.Object(conf.jwks_max_age_seconds)
+    access_token_verifier = providers.Singleton(
+        CachingJwtTokenService,
+        jwt_token_service=jwt_token_service,
+        max_entries=conf.access_token_cache_max_entries,
+        metrics=metrics,
     )
 
     login_session_repository_factory = providers.Factory(
@@ -118,9 +210,34 @@ class Container(containers.DeclarativeContainer):
         login_session_expire_minutes=conf.login_session_expire_minutes,
         get_now=get_now,
     )
+    login_session_reaper = providers.Singleton(
+        BatchedLoginSessionReaper,
+        session_factory=db_session_factory,
+        login_session_repository_factory=login_session_repository_factory,
+        interval_seconds=conf.login_session_reap_interval_seconds,
+        batch_size=conf.login_session_reap_batch_size,
+        batch_pause_seconds=conf.login_session_reap_batch_pause_seconds,
+        metrics=metrics,
+    )
     login_session_cookie_name = providers.Object(
         conf.login_session_cookie_name,
     )
+    signed_session_cookie = providers.Object(
+        conf.auth_method == AuthMethod.SIGNED_SESSION_COOKIE,
+    )
+    shared_key_value_store = providers.Singleton(
+        RedisKeyValueStore,
+        url=conf.redis_url,
+    ) if conf.redis_url else providers.Object(None)
+    login_session_cache = providers.Singleton(
+        TwoTierLoginSessionCache,
+        local_ttl_seconds=conf.login_session_cache_local_ttl_seconds,
+        local_max_entries=conf.login_session_cache_local_max_entries,
+        shared_store=shared_key_value_store,
+        shared_ttl_seconds=conf.login_session_cache_shared_ttl_seconds,
+        metrics=metrics,
+        get_now=get_now,
+    )
     _session_cookie_config = SessionCookieConfig(
         key=conf.login_session_cookie_name,
         httponly=conf.login_session_cookie_httponly,
@@ -132,16 +249,28 @@ class Container(containers.DeclarativeContainer):
 
     access_token_authorizer = providers.Factory(
         AccessTokenAuthorizer,
-        jwt_token_service=jwt_token_service,
+        jwt_token_service=access_token_verifier,
     )
     session_cookie_authorizer_factory = providers.Factory(
         SessionCookieAuthorizer.create_factory,
         login_session_repository_factory=login_session_repository_factory,
         login_session_service=login_session_service,
         login_session_cookie_name=conf.login_session_cookie_name,
+        login_session_cache=login_session_cache,
+    )
+    signed_session_cookie_authorizer_factory = providers.Factory(
+        SignedSessionCookieAuthorizer.create_factory,
+        login_session_repository_factory=login_session_repository_factory,
+        login_session_service=login_session_service,
+        login_session_cookie_name=conf.login_session_cookie_name,
+        revocation_check_interval_seconds=conf
+        .login_session_revocation_check_interval_seconds,
     )
-    permission_checker = providers.Factory(
+    permission_checker = providers.Singleton(
         PermissionChecker,
         session_factory=db_session_factory,
         user_by_uuid_repository_factory=user_by_uuid_repository,
+        ttl_seconds=conf.permission_cache_ttl_seconds,
+        max_entries=conf.permission_cache_max_entries,
+        metrics=metrics,
     )
@@ -1,6 +1,7 @@
 """Common classes and functions for entities."""
 from typing import Any
 
+from sqlalchemy import Index, text
 from sqlalchemy.types import DateTime
 from sqlmodel import Column, Field
 
@@ -23,6 +24,51 @@ def DatetimeWithTimeZone(
     return Field(*args, **kwargs)
 
 
+def ActiveIndex(
+        table_name: str,
+        *columns: str,
+        kind: str = '',
+        **kwargs: Any,
+) -> Index:
+    """Partial index over rows that are not logically deleted.
+
+    Repositories and list queries always filter on `deleted_at IS NULL`, so
+    indexes limited to those rows stay small and skip tombstones. `kind` is
+    added to the index name to tell apart indexes on the same columns.
+    """
+    name = '_'.join([table_name, *columns] + ([kind] if kind else []))
+    return Index(
+        f'ix_{name}_active',
+        *columns,
+        postgresql_where=text('deleted_at IS NULL'),
+        **kwargs,
+    )
+
+
+def TrigramIndex(table_name: str, column: str) -> Index:
+    """GIN trigram index answering `ILIKE '%...%'` on `column`.
+
+    Requires the `pg_trgm` extension.
+    """
+    return ActiveIndex(
+        table_name, column, kind='trgm',
+        postgresql_using='gin',
+        postgresql_ops={column: 'gin_trgm_ops'},
+    )
+
+
+def PrefixIndex(table_name: str, column: str) -> Index:
+    """B-tree index answering anchored `LIKE 'foo%'` on `column`.
+
+    `text_pattern_ops` compares characters byte-wise, so the index can serve
+    prefix matches regardless of the database collation.
+    """
+    return ActiveIndex(
+        table_name, column, kind='prefix',
+        postgresql_ops={column: 'text_pattern_ops'},
+    )
+
+
 LEN_64 = 64
 LEN_128 = 128
 LEN_256 = 256
@@ -1,6 +1,7 @@
 """Login session entity."""
 from datetime import datetime
 
+from sqlalchemy import Index, text
 from sqlalchemy.sql import func
 from sqlmodel import SQLModel, Field
 
@@ -10,6 +11,13 @@ from app.domain.entities.common import DatetimeWithTimeZone
 class LoginSession(SQLModel, table=True):
     """Login session entity."""
     __tablename__ = "login_sessions"
+    __table_args__ = (
+        Index('ix_login_sessions_expires_at', 'expires_at'),
+        # Only holds the logically deleted sessions the reaper has yet to
+        # delete, so it stays small.
+        Index('ix_login_sessions_deleted_at', 'deleted_at',
+              postgresql_where=text('deleted_at IS NOT NULL')),
+    )
     id: str = Field(max_length=128, primary_key=True, index=True)
     user_id: int = Field(nullable=False)
     user_uuid: str = Field(nullable=False)
@@ -2,11 +2,13 @@
 from datetime import datetime
 
 from pydantic import BaseModel
+from sqlalchemy import Column, Computed, Index, text
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.sql import func
 from sqlmodel import Field, SQLModel
 
 from app.domain.entities.common import LEN_256, \
-    DatetimeWithTimeZone
+    DatetimeWithTimeZone, ActiveIndex, TrigramIndex, PrefixIndex
 
 
 class SampleItemBase(SQLModel):
@@ -26,6 +28,15 @@ class SampleItemBase(SQLModel):
 class SampleItem(SampleItemBase, SQLModel, table=True):
     """SampleItem entity."""
     __tablename__ = "sample_items"
+    __table_args__ = (
+        ActiveIndex('sample_items', 'name'),
+        ActiveIndex('sample_items', 'created_at'),
+        TrigramIndex('sample_items', 'name'),
+        PrefixIndex('sample_items', 'name'),
+        # Delta sync scans changes in `(updated_at, id)` order, tombstones
+        # included, so this index is not partial.
+        Index('ix_sample_items_updated_at_id', 'updated_at', 'id'),
+    )
     id: int | None = Field(default=None, primary_key=True, index=True)
     uuid: str = Field(
         unique=True, index=True, nullable=False,
@@ -45,6 +56,34 @@ class SampleItem(SampleItemBase, SQLModel, table=True):
     deleted_at: datetime | None = DatetimeWithTimeZone(default=None)
 
 
+# Text search configuration of `search_vector` and of search queries.
+SAMPLE_ITEM_SEARCH_CONFIG = 'english'
+
+# Generated full-text search document, `name` ranked above `description`.
+# The column is part of the table but not mapped on the entity, so loading a
+# SampleItem never reads it.
+sample_item_search_vector = Column(
+    'search_vector',
+    TSVECTOR,
+    Computed(
+        f"setweight(to_tsvector('{SAMPLE_ITEM_SEARCH_CONFIG}'::regconfig, "
+        f"coalesce(name, '')), 'A') || "
+        f"setweight(to_tsvector('{SAMPLE_ITEM_SEARCH_CONFIG}'::regconfig, "
+        f"coalesce(description, '')), 'B')",
+        persisted=True,
+    ),
+    nullable=True,
+)
+SampleItem.__table__.append_column(  # type: ignore[attr-defined]
+    sample_item_search_vector)
+Index(
+    'ix_sample_items_search_vector_active',
+    sample_item_search_vector,
+    postgresql_using='gin',
+    postgresql_where=text('deleted_at IS NULL'),
+)
+
+
 class SampleItemLengths(BaseModel):
     """Value object to represent lengths of SampleItem fields."""
     name_length: int
@@ -5,7 +5,8 @@ from pydantic import EmailStr
 from sqlalchemy.sql import func
 from sqlmodel import SQLModel, Field, AutoString, Relationship
 
-from app.domain.entities.common import LEN_256, DatetimeWithTimeZone
+from app.domain.entities.common import LEN_256, DatetimeWithTimeZone, \
+    ActiveIndex, TrigramIndex, PrefixIndex
 
 
 class UserBase(SQLModel):
@@ -29,6 +30,16 @@ class UserRoles(SQLModel, table=True):
 class User(UserBase, SQLModel, table=True):
     """User entity."""
     __tablename__ = 'users'
+    __table_args__ = (
+        ActiveIndex('users', 'first_name'),
+        ActiveIndex('users', 'last_name'),
+        TrigramIndex('users', 'email'),
+        TrigramIndex('users', 'first_name'),
+        TrigramIndex('users', 'last_name'),
+        PrefixIndex('users', 'email'),
+        PrefixIndex('users', 'first_name'),
+        PrefixIndex('users', 'last_name'),
+    )
     id: int | None = Field(default=None, primary_key=True, index=True)
     uuid: str = Field(
         unique=True, index=True, nullable=False,
@@ -1,6 +1,6 @@
 """Base repository interface for managing domain entities."""
 from abc import abstractmethod, ABC
-from typing import Generic, TypeVar, Any
+from typing import Generic, TypeVar, Any, Callable, Collection, Sequence
 
 from sqlalchemy import Select
 from sqlmodel import SQLModel
@@ -28,6 +28,14 @@ class AsyncBaseRepository(
                         **kwargs: Any) -> EntityT | None:
         """Retrieve an entity by its ID"""
 
+    @abstractmethod
+    async def get_many_by_ids(self, entity_ids: Sequence[IdT],
+                              *args: Any,
+                              load_options: list[Any] | None = None,
+                              **kwargs: Any) -> dict[IdT, EntityT]:
+        """Retrieve the entities with the given IDs in one query, keyed by
+        their ID. IDs without an entity are missing from the result."""
+
     @abstractmethod
     async def add(self, entity: EntityT,
                   *args: Any, **kwargs: Any) -> EntityT:
@@ -48,6 +56,10 @@ class AsyncBaseRepository(
                      *args: Any, **kwargs: Any) -> None:
         """Delete an entity by its ID"""
 
+    @abstractmethod
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        """Call `callback` once, when the session next commits."""
+
 
 class BaseQueryFactory(
     Generic[EntityT],
@@ -60,6 +72,19 @@ class BaseQueryFactory(
             self,
             api_query: ApiListQuery,
             *args: Any,
+            includes: Collection[str] = (),
             **kwargs: Any
     ) -> Select[tuple[EntityT]]:
-        """Construct a SQL query for retrieving a list of entities."""
+        """Construct a SQL query for retrieving a list of entities.
+
+        Related entities named in `includes` are loaded with the page.
+        """
+
+    @abstractmethod
+    def load_options(self, includes: Collection[str]) -> list[Any]:
+        """Loader options eagerly loading the related entities named in
+        `includes`, for `list_query` and `get_by_id`.
+
+        Raises:
+            ValueError: If an include is not supported by the entity.
+        """
@@ -1,5 +1,5 @@
 """LoginSession repository interface."""
-from abc import ABC
+from abc import ABC, abstractmethod
 
 from app.domain.entities.login_session import LoginSession
 from app.domain.repositories.base import AsyncBaseRepository
@@ -9,4 +9,15 @@ class LoginSessionRepository(
     AsyncBaseRepository[str, LoginSession],
     ABC
 ):
-    """LoginSession repository interface."""
+    """LoginSession repository interface.
+
+    Expired sessions are handled as deleted ones.
+    """
+
+    @abstractmethod
+    async def delete_ended(self, batch_size: int) -> int:
+        """Delete up to `batch_size` expired or logically deleted sessions.
+
+        Returns:
+            int: The number of deleted sessions.
+        """
@@ -1,8 +1,13 @@
 """SampleItem repository interface."""
-from abc import ABC
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Sequence
+
+from sqlalchemy import Select
 
 from app.domain.entities.sample_item import SampleItem
 from app.domain.repositories.base import AsyncBaseRepository, BaseQueryFactory
+from app.domain.value_objects.sync import SyncWatermark
 
 
 class SampleItemRepository(
@@ -11,6 +16,30 @@ class SampleItemRepository(
 ):
     """SampleItem repository interface."""
 
+    @abstractmethod
+    async def list_changed_since(
+            self,
+            since: SyncWatermark | None,
+            limit: int,
+    ) -> Sequence[SampleItem]:
+        """List entities changed after `since`, oldest change first.
+
+        Logically deleted entities are included, so their deletion can be
+        synced.
+
+        Args:
+            since (SyncWatermark | None): Position after which to list
+                changes. `None` lists every entity.
+            limit (int): Maximum number of entities to return.
+
+        Returns:
+            Sequence[SampleItem]: Entities in `(updated_at, id)` order.
+        """
+
+    @abstractmethod
+    async def current_timestamp(self) -> datetime:
+        """Current time of the clock that stamps `updated_at`."""
+
 
 class SampleItemQueryFactory(
     BaseQueryFactory[SampleItem],
@@ -18,6 +47,34 @@ class SampleItemQueryFactory(
 ):
     """SampleItem query."""
 
+    @abstractmethod
+    def with_meta(
+            self,
+            stmt: Select[tuple[SampleItem]],
+    ) -> Select[tuple[SampleItem, int, int]]:
+        """Add the meta data columns to a SampleItem query.
+
+        Args:
+            stmt (Select[tuple[SampleItem]]): A list or search query.
+
+        Returns:
+            Select[tuple[SampleItem, int, int]]: The same query also selecting
+                `name_length` and `description_length`, matching
+                `SampleItemService.calculate_lengths`.
+        """
+
+    @abstractmethod
+    def search_query(self, text: str) -> Select[tuple[SampleItem]]:
+        """Construct a full-text search query, best matches first.
+
+        Args:
+            text (str): Search text in web search syntax.
+
+        Returns:
+            Select[tuple[SampleItem]]: Matching entities that are not
+                logically deleted.
+        """
+
 
 class SampleItemByUUIDRepository(
     AsyncBaseRepository[str, SampleItem],
@@ -1,5 +1,7 @@
 """User repository interface."""
-from abc import ABC
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Mapping
 
 from app.domain.entities.user import User
 from app.domain.repositories.base import AsyncBaseRepository, BaseQueryFactory
@@ -11,6 +13,19 @@ class UserRepository(
 ):
     """User repository interface."""
 
+    @abstractmethod
+    async def update_last_logins(
+            self,
+            last_logins: Mapping[int, datetime],
+    ) -> None:
+        """Set `last_login` of many users in one statement.
+
+        A user's `last_login` is never moved backwards.
+
+        Args:
+            last_logins (Mapping[int, datetime]): Login time by user ID.
+        """
+
 
 class UserQueryFactory(
     BaseQueryFactory[User],
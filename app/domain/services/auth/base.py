@@ -12,5 +12,5 @@ class UserAuthService(ABC):
         """Authenticate user"""
 
     @abstractmethod
-    def hash_password(self, password: str) -> str:
+    async def hash_password(self, password: str) -> str:
         """Hash password"""
@@ -0,0 +1,16 @@
+"""Last login services."""
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+
+class LastLoginRecorder(ABC):
+    """Records the last login time of users."""
+
+    @abstractmethod
+    def record(self, user_id: int, logged_in_at: datetime) -> None:
+        """Record a login. It may be written to storage later."""
+
+    @abstractmethod
+    async def flush(self) -> int:
+        """Write the recorded logins and return how many users were
+        updated."""
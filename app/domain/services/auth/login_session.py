@@ -12,3 +12,44 @@ class LoginSessionService(ABC):
     @abstractmethod
     def create_session(self, user: User) -> LoginSession:
         """Create a new session."""
+
+    @abstractmethod
+    def sign_session(self, session: LoginSession) -> str:
+        """Encode a session into a signed and timestamped cookie value."""
+
+    @abstractmethod
+    def load_signed_session(self, value: str) -> LoginSession | None:
+        """Decode a cookie value of `sign_session`.
+
+        Returns None if the signature is invalid or the session expired.
+        """
+
+
+class LoginSessionCache(ABC):
+    """Cache of login sessions by ID, in front of the repository."""
+
+    @abstractmethod
+    async def get(self, session_id: str) -> LoginSession | None:
+        """Return the cached session, or None on a miss."""
+
+    @abstractmethod
+    async def set(self, session: LoginSession) -> None:
+        """Cache a session loaded from the repository. It is never kept
+        past its `expires_at`."""
+
+    @abstractmethod
+    async def invalidate(self, session_id: str) -> None:
+        """Drop a session from every tier of the cache."""
+
+    @abstractmethod
+    def invalidate_local(self, session_id: str) -> None:
+        """Drop a session from the tier of this process only."""
+
+
+class LoginSessionReaper(ABC):
+    """Deletes the sessions that ended."""
+
+    @abstractmethod
+    async def reap(self) -> int:
+        """Delete the expired and logically deleted sessions and return how
+        many were deleted."""
@@ -0,0 +1,28 @@
+"""Password hashing services."""
+from abc import ABC, abstractmethod
+
+
+class PasswordHasher(ABC):
+    """One-way password hashing.
+
+    Methods are CPU-bound and blocking; async callers run them on a worker
+    pool.
+    """
+
+    @abstractmethod
+    def hash(self, password: str) -> str:
+        """Hash a password with the current scheme and parameters."""
+
+    @abstractmethod
+    def verify_and_update(
+            self,
+            password: str,
+            password_hash: str,
+    ) -> tuple[bool, str | None]:
+        """Verify a password against a stored hash.
+
+        Returns:
+            tuple[bool, str | None]: Whether the password matches, and a new
+                hash to store when it does but `password_hash` uses an
+                outdated scheme or parameters.
+        """
@@ -0,0 +1,50 @@
+"""Cache services."""
+from abc import ABC, abstractmethod
+from typing import Awaitable, Callable, Iterable, TypeVar
+
+ValueT = TypeVar('ValueT')
+
+
+class TaggedCache(ABC):
+    """Cache whose entries can be invalidated in groups by tag."""
+
+    @abstractmethod
+    async def get_or_load(
+            self,
+            key: str,
+            tags: Iterable[str],
+            loader: Callable[[], Awaitable[ValueT]],
+    ) -> ValueT:
+        """Return the cached value for `key`, loading it on a miss.
+
+        Concurrent misses for the same key share a single `loader` call.
+        """
+
+    @abstractmethod
+    def invalidate_tags(self, tags: Iterable[str]) -> None:
+        """Drop every entry carrying any of the given tags."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Drop every entry."""
+
+
+class KeyValueStore(ABC):
+    """Key-value store shared between processes, with expiring entries."""
+
+    @abstractmethod
+    async def get(self, key: str) -> bytes | None:
+        """Return the value of `key`, or None if it is missing or expired."""
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        """Store `value` under `key` for `ttl_seconds`."""
+
+    @abstractmethod
+    async def add(self, key: str, value: bytes, ttl_seconds: float) -> bool:
+        """Store `value` under `key` for `ttl_seconds` unless `key` is
+        already stored, and return whether it was stored."""
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """Drop `key` if it is stored."""
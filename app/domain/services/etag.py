@@ -0,0 +1,85 @@
+"""ETag services."""
+import hashlib
+from datetime import datetime
+from typing import Any, Iterable
+
+
+def _quote(digest_source: str) -> str:
+    digest = hashlib.blake2b(
+        digest_source.encode('utf-8'), digest_size=16).hexdigest()
+    return f'"{digest}"'
+
+
+def entity_etag(
+        entity_id: Any,
+        updated_at: datetime | None,
+        variant: str = '',
+) -> str:
+    """Strong ETag of a single entity representation.
+
+    Args:
+        entity_id (Any): The primary key of the entity.
+        updated_at (datetime | None): The last update time of the entity.
+        variant (str): Distinguishes representations of the same entity,
+            e.g. with and without meta data.
+
+    Returns:
+        str: A quoted strong ETag.
+    """
+    stamp = updated_at.isoformat() if updated_at is not None else ''
+    return _quote(f'{entity_id}:{stamp}:{variant}')
+
+
+# pylint: disable=too-many-arguments,too-many-positional-arguments
+def page_etag(
+        rows: Iterable[tuple[Any, datetime | None]],
+        total: int | None,
+        page: int | None,
+        size: int | None,
+        variant: str = '',
+) -> str:
+    """Strong ETag of a page of entities.
+
+    Derived from the ordered ids of the page, the latest `updated_at`
+    among them and the `total`, `page` and `size` of the page, so any edit,
+    insertion, deletion or reordering on the page, and any insertion or
+    deletion on another page, changes it.
+
+    Args:
+        rows (Iterable[tuple[Any, datetime | None]]): `(id, updated_at)` of
+            every entity on the page, in page order.
+        total (int | None): The number of entities of all pages.
+        page (int | None): The page number.
+        size (int | None): The page size.
+        variant (str): Distinguishes representations of the same page.
+
+    Returns:
+        str: A quoted strong ETag.
+    """
+    ids = []
+    max_updated_at: datetime | None = None
+    for entity_id, updated_at in rows:
+        ids.append(str(entity_id))
+        if updated_at is not None and (
+                max_updated_at is None or updated_at > max_updated_at):
+            max_updated_at = updated_at
+    stamp = max_updated_at.isoformat() if max_updated_at is not None else ''
+    return _quote(
+        f'{",".join(ids)}:{stamp}:{total}:{page}:{size}:{variant}')
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Evaluate an `If-None-Match` header against the current ETag.
+
+    Uses the weak comparison required for `If-None-Match`, so `W/"x"`
+    matches `"x"`.
+    """
+    if not if_none_match:
+        return False
+
+    candidates = [tag.strip() for tag in if_none_match.split(',')]
+    if '*' in candidates:
+        return True
+
+    return etag.removeprefix('W/') in {
+        tag.removeprefix('W/') for tag in candidates}
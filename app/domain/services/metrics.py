@@ -0,0 +1,23 @@
+"""Metrics services."""
+from abc import ABC, abstractmethod
+from typing import Any
+
+
+class MetricsRecorder(ABC):
+    """Records counters, gauges and observations for runtime metrics."""
+
+    @abstractmethod
+    def increment(self, name: str, value: float = 1.0) -> None:
+        """Increment a counter."""
+
+    @abstractmethod
+    def set_gauge(self, name: str, value: float) -> None:
+        """Set a gauge to the given value."""
+
+    @abstractmethod
+    def observe(self, name: str, value: float) -> None:
+        """Record an observation, e.g. a latency or a size."""
+
+    @abstractmethod
+    def snapshot(self) -> dict[str, Any]:
+        """Return a point-in-time copy of all recorded metrics."""
@@ -0,0 +1,14 @@
+"""Query cost services."""
+from abc import ABC, abstractmethod
+from typing import Any
+
+from sqlalchemy import Select
+
+
+# pylint: disable=too-few-public-methods
+class QueryCostEstimator(ABC):
+    """Estimates the cost of a query before it is executed."""
+
+    @abstractmethod
+    async def estimate(self, stmt: Select[Any]) -> float:
+        """Return the planner's estimated total cost of `stmt`."""
@@ -1,4 +1,6 @@
 """SampleItem service."""
+from typing import Iterable
+
 from app.domain.entities.sample_item import SampleItem, SampleItemLengths
 
 
@@ -21,5 +23,29 @@ class SampleItemService:
         """
         return SampleItemLengths(
             name_length=len(sample_item.name),
-            description_length=len(sample_item.description),
+            description_length=len(sample_item.description or ''),
         )
+
+    @staticmethod
+    def calculate_lengths_many(
+            sample_items: Iterable[SampleItem],
+    ) -> list[SampleItemLengths]:
+        """
+        Calculate the lengths for many SampleItem instances at once.
+
+        For SampleItems that do not come from the database; database queries
+        compute the same values with `SampleItemQueryFactory.with_meta`.
+
+        Args:
+            sample_items (Iterable[SampleItem]): SampleItem instances.
+
+        Returns:
+            list[SampleItemLengths]: The lengths, in the same order.
+        """
+        return [
+            SampleItemLengths(
+                name_length=len(sample_item.name),
+                description_length=len(sample_item.description or ''),
+            )
+            for sample_item in sample_items
+        ]
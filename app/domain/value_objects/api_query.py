@@ -13,6 +13,7 @@ class ApiListQueryOp(str, Enum):
     EQ = 'eq'
     NEQ = 'neq'
     LIKE = 'like'
+    PREFIX = 'prefix'
     LT = 'lt'
     GT = 'gt'
     LTE = 'lte'
@@ -36,3 +37,15 @@ class ApiListQuery(BaseModel):
     def empty() -> 'ApiListQuery':
         """Return empty query"""
         return ApiListQuery(queries={})
+
+
+class ApiListQueryLimits(BaseModel):
+    """Caps on the cost of user-supplied list queries.
+
+    `max_plan_cost` of 0 disables the planner estimate check.
+    """
+    max_in_list_length: int = 100
+    allow_leading_wildcard: bool = True
+    max_page_size: int = 100
+    max_page_depth: int = 1000
+    max_plan_cost: float = 0.0
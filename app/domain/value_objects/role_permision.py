@@ -1,5 +1,6 @@
 """Role and Permission Value Object."""
 from enum import Enum
+from typing import Iterable
 
 
 class RoleName(str, Enum):
@@ -14,3 +15,22 @@ class PermissionName(str, Enum):
     ADMIN_WRITE = 'admin:write'
     ADMIN_UPDATE = 'admin:update'
     ADMIN_DELETE = 'admin:delete'
+
+
+# One bit per permission, so that a set of permissions is an int and
+# checking it is a single AND.
+PERMISSION_BITS: dict[PermissionName, int] = {
+    name: 1 << i for i, name in enumerate(PermissionName)}
+ALL_PERMISSIONS_MASK = (1 << len(PermissionName)) - 1
+
+
+def permission_mask(names: Iterable[str]) -> int:
+    """Return the bitmask of permission names.
+
+    Raises:
+        ValueError: If a name is not a `PermissionName`.
+    """
+    mask = 0
+    for name in names:
+        mask |= PERMISSION_BITS[PermissionName(name)]
+    return mask
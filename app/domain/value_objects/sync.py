@@ -0,0 +1,41 @@
+"""Delta sync value objects."""
+import base64
+from datetime import datetime
+
+from pydantic import BaseModel
+
+
+class SyncWatermark(BaseModel):
+    """Position in the `(updated_at, id)` order of changed entities.
+
+    Clients receive it as an opaque token and send it back to fetch the
+    changes after it.
+    """
+    updated_at: datetime
+    id: int = 0
+
+    def encode(self) -> str:
+        """Encode as an opaque URL-safe token."""
+        raw = f'{self.updated_at.isoformat()}|{self.id}'.encode('utf-8')
+        return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+    @staticmethod
+    def decode(token: str) -> 'SyncWatermark':
+        """Decode a token issued by `encode`.
+
+        Raises:
+            ValueError: If the token is malformed.
+        """
+        padded = token + '=' * (-len(token) % 4)
+        try:
+            raw = base64.urlsafe_b64decode(padded).decode('utf-8')
+            updated_at, entity_id = raw.rsplit('|', 1)
+            watermark = SyncWatermark(
+                updated_at=datetime.fromisoformat(updated_at),
+                id=int(entity_id),
+            )
+        except (ValueError, UnicodeDecodeError) as err:
+            raise ValueError(f'Malformed sync watermark: {token}') from err
+        if watermark.updated_at.tzinfo is None:
+            raise ValueError(f'Malformed sync watermark: {token}')
+        return watermark
@@ -0,0 +1,40 @@
+"""Generate the OpenAPI document.
+
+Writes the document served at `/openapi.json`, with its precompressed
+variants next to it. Run it at image build time and point
+`OPENAPI_SCHEMA_PATH` to the output.
+"""
+import logging
+import os
+import sys
+from pathlib import Path
+
+import click
+
+# NEED this when executing this file from other directory.
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.config import get_settings
+from app.interfaces.controllers.openapi import build_openapi_schema
+from app.interfaces.views.openapi_document import OpenApiDocument
+
+logger = logging.getLogger('uvicorn')
+
+
+@click.command()
+@click.option('--output', required=True, type=click.Path(dir_okay=False),
+              help="Path of the JSON document.")
+def main(output: str) -> None:
+    """Generate the OpenAPI document."""
+    logging.basicConfig(level=logging.INFO)
+    logging.getLogger('uvicorn').setLevel(logging.INFO)
+    config = get_settings()
+    document = OpenApiDocument.from_schema(
+        build_openapi_schema(config.app_name))
+    document.save(Path(output))
+    logger.info('OpenAPI document written to %s, ETag %s, variants: %s',
+                output, document.etag, ', '.join(document.encoded))
+
+
+if __name__ == '__main__':
+    main()
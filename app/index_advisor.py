@@ -0,0 +1,53 @@
+"""Index advisor.
+
+Reports which filter and sort columns declared by the list query DTOs have no
+supporting index. Exits with status 1 when any is missing.
+"""
+import asyncio
+import logging
+import os
+import sys
+
+import click
+
+# NEED this when executing this file from other directory.
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.config import get_settings, \
+    get_settings_for_testing
+from app.infrastructure.database.database import Database
+from app.infrastructure.database.index_advisor import IndexAdvice, advise, \
+    fetch_indexes, list_query_dto_classes
+
+logger = logging.getLogger('uvicorn')
+
+
+async def index_advisor(test: bool) -> list[IndexAdvice]:
+    """Compare the list query DTOs with the indexes in the database."""
+    config = get_settings_for_testing() if test else get_settings()
+    db = Database(db_url=config.db_dsn, echo=config.echo_sql)
+    try:
+        async with db.get_engine().connect() as connection:
+            indexes = await fetch_indexes(connection)
+    finally:
+        await db.get_engine().dispose()
+    return advise(list_query_dto_classes(), indexes)
+
+
+@click.command()
+@click.option('--test', is_flag=True, help="Inspect the test database.")
+@click.option('--missing-only', is_flag=True,
+              help="Only report columns without a supporting index.")
+def main(test: bool, missing_only: bool) -> None:
+    """Report list query columns without a supporting index."""
+    advices = asyncio.run(index_advisor(test))
+    for advice in advices:
+        if advice.missing or not missing_only:
+            click.echo(str(advice))
+
+    if any(advice.missing for advice in advices):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
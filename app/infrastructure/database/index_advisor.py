@@ -0,0 +1,152 @@
+"""Index advisor for list query DTOs.
+
+Compares the filter and sort columns declared by `ApiListQueryDtoBaseModel`
+subclasses with the indexes that exist in the database.
+"""
+import importlib
+import pkgutil
+from typing import Iterable
+
+from pydantic import BaseModel
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+import app.application.dto as dto_package
+from app.application.dto.base import ApiListQueryDtoBaseModel
+from app.domain.value_objects.api_query import ApiListQueryOp
+
+# Operators answered by a b-tree whose leading column is the filtered column.
+BTREE_OPS = frozenset({
+    ApiListQueryOp.EQ, ApiListQueryOp.NEQ,
+    ApiListQueryOp.LT, ApiListQueryOp.GT,
+    ApiListQueryOp.LTE, ApiListQueryOp.GTE,
+    ApiListQueryOp.IN, ApiListQueryOp.NOTIN,
+    ApiListQueryOp.ASC, ApiListQueryOp.DESC,
+})
+# Operator classes that let an index answer `ILIKE '%...%'`.
+TRIGRAM_OPCLASSES = frozenset({'gin_trgm_ops', 'gist_trgm_ops'})
+# B-tree operator classes that compare byte-wise. They answer equality and
+# anchored prefix matches, but not ranges or sorts in the column collation.
+PATTERN_OPCLASSES = frozenset({'text_pattern_ops', 'varchar_pattern_ops'})
+PATTERN_OPS = frozenset({
+    ApiListQueryOp.EQ, ApiListQueryOp.IN, ApiListQueryOp.PREFIX,
+})
+SOFT_DELETE_PREDICATE = '(deleted_at IS NULL)'
+
+_INDEXES_QUERY = text("""
+SELECT t.relname AS table_name,
+       i.relname AS index_name,
+       am.amname AS method,
+       a.attname AS column_name,
+       opc.opcname AS opclass,
+       pg_get_expr(ix.indpred, ix.indrelid) AS predicate
+FROM pg_index ix
+JOIN pg_class t ON t.oid = ix.indrelid
+JOIN pg_class i ON i.oid = ix.indexrelid
+JOIN pg_namespace n ON n.oid = t.relnamespace
+JOIN pg_am am ON am.oid = i.relam
+JOIN pg_attribute a ON a.attrelid = t.oid AND a.attnum = ix.indkey[0]
+JOIN pg_opclass opc ON opc.oid = ix.indclass[0]
+WHERE n.nspname = current_schema()
+""")
+
+
+class IndexInfo(BaseModel):
+    """Leading column of an existing index."""
+    table_name: str
+    index_name: str
+    method: str
+    column_name: str
+    opclass: str
+    predicate: str | None = None
+
+    @property
+    def soft_delete_aware(self) -> bool:
+        """Whether the index only covers rows that are not deleted."""
+        return self.predicate == SOFT_DELETE_PREDICATE
+
+    def supports(self, op: ApiListQueryOp) -> bool:
+        """Whether the index can answer `op` on its leading column."""
+        if op == ApiListQueryOp.LIKE:
+            return self.opclass in TRIGRAM_OPCLASSES
+        if self.method != 'btree':
+            return False
+        if self.opclass in PATTERN_OPCLASSES:
+            return op in PATTERN_OPS
+        return op in BTREE_OPS
+
+
+class IndexAdvice(BaseModel):
+    """Index coverage of one column and operator of a list query DTO."""
+    dto_name: str
+    table_name: str
+    column_name: str
+    op: ApiListQueryOp
+    index_name: str | None = None
+    soft_delete_aware: bool = False
+
+    @property
+    def missing(self) -> bool:
+        """Whether no index supports the operator."""
+        return self.index_name is None
+
+    def __str__(self) -> str:
+        target = f'{self.table_name}.{self.column_name} __{self.op.value}'
+        if self.index_name is None:
+            return f'MISSING  {target} ({self.dto_name})'
+        note = '' if self.soft_delete_aware else ', not partial'
+        return f'ok       {target} -> {self.index_name}{note}'
+
+
+def list_query_dto_classes() -> list[type[ApiListQueryDtoBaseModel]]:
+    """Import every DTO module and return the list query DTO classes."""
+    for module_info in pkgutil.iter_modules(dto_package.__path__):
+        importlib.import_module(f'{dto_package.__name__}.{module_info.name}')
+    return [
+        cls for cls in ApiListQueryDtoBaseModel.__subclasses__()
+        if cls.__entity_cls__ is not None
+    ]
+
+
+async def fetch_indexes(connection: AsyncConnection) -> list[IndexInfo]:
+    """Read the leading column of every index in the current schema."""
+    result = await connection.execute(_INDEXES_QUERY)
+    return [IndexInfo.model_validate(row) for row in result.mappings()]
+
+
+def advise(
+        dto_classes: Iterable[type[ApiListQueryDtoBaseModel]],
+        indexes: Iterable[IndexInfo],
+) -> list[IndexAdvice]:
+    """Match every `{column}__{op}` DTO field with a supporting index.
+
+    Soft-delete aware indexes are preferred, since list queries always
+    filter on `deleted_at IS NULL`.
+    """
+    indexes_by_column: dict[tuple[str, str], list[IndexInfo]] = {}
+    for index in indexes:
+        indexes_by_column.setdefault(
+            (index.table_name, index.column_name), []).append(index)
+
+    advices = []
+    for dto_cls in dto_classes:
+        table_name = str(
+            getattr(dto_cls.__entity_cls__, '__tablename__'))
+        for field_name in dto_cls.model_fields:
+            column_name, op_value = field_name.split('__')
+            op = ApiListQueryOp(op_value)
+            candidates = sorted(
+                (index for index in indexes_by_column.get(
+                    (table_name, column_name), []) if index.supports(op)),
+                key=lambda index: not index.soft_delete_aware,
+            )
+            best = candidates[0] if candidates else None
+            advices.append(IndexAdvice(
+                dto_name=dto_cls.__name__,
+                table_name=table_name,
+                column_name=column_name,
+                op=op,
+                index_name=best.index_name if best else None,
+                soft_delete_aware=best.soft_delete_aware if best else False,
+            ))
+    return advices
@@ -1,10 +1,12 @@
 """Repository implementation base class."""
 from datetime import datetime
 from logging import getLogger
-from typing import Generic, Any, Callable
+from typing import Generic, Any, Callable, Collection, Sequence
 
-from sqlalchemy import select, Select
+from sqlalchemy import any_, bindparam, event, select, Select
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from app.application.exc import EntityNotFound
 from app.domain.repositories.base import EntityT, AsyncBaseRepository, IdT, \
@@ -47,15 +49,44 @@ class InDBBaseEntityRepository(
         where_clauses = [
             getattr(self._entity_cls, self.id_field) == entity_id]
         if not include_deleted:
-            where_clauses.append(
-                getattr(self._entity_cls,
-                        self._deleted_at_field).is_(None))
+            where_clauses.extend(self._live_clauses())
         stmt = select(self._entity_cls).where(*where_clauses)
         if load_options:
             stmt = stmt.options(*load_options)
         result = await self._db_session.execute(stmt)
         return result.scalars().unique().one_or_none()
 
+    async def get_many_by_ids(self, entity_ids: Sequence[IdT], *args: Any,
+                              load_options: list[Any] | None = None,
+                              include_deleted: bool = False,
+                              **kwargs: Any,
+                              ) -> dict[IdT, EntityT]:
+        """Retrieve entities by their IDs with `id = ANY(:entity_ids)`.
+
+        The IDs are bound as a single array parameter, so every batch size
+        shares the same statement and the same cached plan.
+        """
+        if not entity_ids:
+            return {}
+        id_column = getattr(self._entity_cls, self.id_field)
+        where_clauses = [id_column == any_(bindparam(
+            'entity_ids', list(entity_ids), type_=ARRAY(id_column.type)))]
+        if not include_deleted:
+            where_clauses.extend(self._live_clauses())
+        stmt = select(self._entity_cls).where(*where_clauses)
+        if load_options:
+            stmt = stmt.options(*load_options)
+        result = await self._db_session.execute(stmt)
+        return {
+            getattr(entity, self.id_field): entity
+            for entity in result.scalars().unique()
+        }
+
+    def _live_clauses(self) -> list[Any]:
+        """Conditions of the entities that are not deleted."""
+        return [
+            getattr(self._entity_cls, self._deleted_at_field).is_(None)]
+
     async def add(self, entity: EntityT, *args: Any, **kwargs: Any,
                   ) -> EntityT:
         """Add an entity"""
@@ -104,23 +135,60 @@ class InDBBaseEntityRepository(
         else:
             logger.warning('Entity with ID %s does not exist.', entity_id)
 
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        """Call `callback` once, when the session next commits."""
+        event.listen(
+            self._db_session.sync_session, 'after_commit',
+            lambda _session: callback(), once=True)
+
 
 class InDBBaseQueryFactory(
     BaseQueryFactory[EntityT],
     Generic[EntityT],
 ):
-    """Base query factory for in-database repositories."""
+    """Base query factory for in-database repositories.
+
+    `_include_paths` maps the name of each supported include to the path of
+    relationship attributes to load, starting from the entity.
+    """
     _entity_cls: type[EntityT]
     _deleted_at_field: str = 'deleted_at'
+    _include_paths: dict[str, tuple[str, ...]] = {}
 
     def list_query(
             self,
             api_query: ApiListQuery,
             *args: Any,
+            includes: Collection[str] = (),
             **kwargs: Any,
     ) -> Select[tuple[EntityT]]:
         """list query."""
-        return self._list_query(api_query, self._entity_cls)
+        stmt = self._list_query(api_query, self._entity_cls)
+        load_options = self.load_options(includes)
+        if load_options:
+            stmt = stmt.options(*load_options)
+        return stmt
+
+    def load_options(self, includes: Collection[str]) -> list[Any]:
+        """Build one `selectinload` chain per include.
+
+        Each relationship is loaded by a single `SELECT ... WHERE IN` over
+        the parent keys, so a page issues a fixed number of queries however
+        many entities it holds.
+        """
+        options = []
+        for include in sorted(includes):
+            if include not in self._include_paths:
+                raise ValueError(f'Unsupported include: {include}')
+            model: Any = self._entity_cls
+            option: Any = None
+            for name in self._include_paths[include]:
+                attr = getattr(model, name)
+                option = selectinload(attr) if option is None \
+                    else option.selectinload(attr)
+                model = attr.property.mapper.class_
+            options.append(option)
+        return options
 
     def _list_query(
             self,
@@ -145,6 +213,8 @@ class InDBBaseQueryFactory(
             ApiListQueryOp.EQ: lambda field_, value_: field_ == value_,
             ApiListQueryOp.NEQ: lambda field_, value_: field_ != value_,
             ApiListQueryOp.LIKE: lambda field_, value_: field_.ilike(value_),
+            ApiListQueryOp.PREFIX: lambda field_, value_: field_.startswith(
+                value_, autoescape=True),
             ApiListQueryOp.GT: lambda field_, value_: field_ > value_,
             ApiListQueryOp.GTE: lambda field_, value_: field_ >= value_,
             ApiListQueryOp.LT: lambda field_, value_: field_ < value_,
@@ -1,7 +1,8 @@
 """LoginSession repository in database."""
 from datetime import datetime
-from typing import Callable
+from typing import Any, Callable
 
+from sqlalchemy import delete, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.domain.entities.login_session import LoginSession
@@ -16,6 +17,32 @@ class InDBLoginSessionRepository(
     """LoginSession repository in database."""
     _entity_cls = LoginSession
 
+    def _live_clauses(self) -> list[Any]:
+        """Conditions of the sessions that are neither deleted nor
+        expired."""
+        return super()._live_clauses() + [
+            getattr(LoginSession, 'expires_at') > self._get_now()]
+
+    async def delete_ended(self, batch_size: int) -> int:
+        """`DELETE ... WHERE id IN (SELECT ... LIMIT ... FOR UPDATE SKIP
+        LOCKED)`, so concurrent reapers take different rows."""
+        session_id = getattr(LoginSession, 'id')
+        ended_ids = (
+            select(session_id)
+            .where(or_(
+                getattr(LoginSession, 'expires_at') <= self._get_now(),
+                getattr(LoginSession, 'deleted_at').is_not(None),
+            ))
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        result = await self._db_session.execute(
+            delete(LoginSession)
+            .where(session_id.in_(ended_ids.scalar_subquery()))
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
+
     @staticmethod
     def factory(
             get_now: Callable[[], datetime]
@@ -1,13 +1,17 @@
 """SampleItem repository in DB"""
 from datetime import datetime
 from logging import getLogger
-from typing import Callable
+from typing import Callable, Sequence, cast as typing_cast
 
+from sqlalchemy import Select, cast, func, literal, select, tuple_
+from sqlalchemy.dialects.postgresql import REGCONFIG
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.domain.entities.sample_item import SampleItem
+from app.domain.entities.sample_item import SampleItem, \
+    SAMPLE_ITEM_SEARCH_CONFIG, sample_item_search_vector
 from app.domain.repositories.sample_item import SampleItemRepository, \
     SampleItemQueryFactory, SampleItemByUUIDRepository
+from app.domain.value_objects.sync import SyncWatermark
 from app.infrastructure.repositories.base import InDBBaseQueryFactory, \
     InDBBaseEntityRepository
 
@@ -28,6 +32,40 @@ class InDBSampleItemRepository(
         """Factory method."""
         return lambda db_session: InDBSampleItemRepository(db_session, get_now)
 
+    async def list_changed_since(
+            self,
+            since: SyncWatermark | None,
+            limit: int,
+    ) -> Sequence[SampleItem]:
+        """List entities changed after `since`, oldest change first.
+
+        Uses the `(updated_at, id)` index; logical deletes bump `updated_at`,
+        so tombstones are found the same way.
+        """
+        updated_at = getattr(SampleItem, 'updated_at')
+        entity_id = getattr(SampleItem, 'id')
+        stmt = select(SampleItem)
+        if since is not None:
+            # A row comparison, so the planner can seek the composite index.
+            stmt = stmt.where(
+                tuple_(updated_at, entity_id) > tuple_(
+                    literal(since.updated_at, updated_at.type),
+                    literal(since.id, entity_id.type),
+                ))
+        stmt = stmt.order_by(updated_at, entity_id).limit(limit)
+        result = await self._db_session.execute(stmt)
+        return result.scalars().all()
+
+    async def current_timestamp(self) -> datetime:
+        """Current database time.
+
+        `updated_at` is stamped by the database, so watermarks are issued
+        from the same clock.
+        """
+        result = await self._db_session.execute(
+            select(func.clock_timestamp()))  # pylint: disable=not-callable
+        return typing_cast(datetime, result.scalar_one())
+
 
 class InDBSampleItemQueryFactory(
     SampleItemQueryFactory,
@@ -35,6 +73,43 @@ class InDBSampleItemQueryFactory(
     """In-DB SampleItem query."""
     _entity_cls = SampleItem
 
+    def with_meta(
+            self,
+            stmt: Select[tuple[SampleItem]],
+    ) -> Select[tuple[SampleItem, int, int]]:
+        """Select the meta data lengths next to the entity.
+
+        The database computes them, so listing with meta data does not
+        copy or re-validate the entities.
+        """
+        # pylint: disable=not-callable
+        return stmt.add_columns(
+            func.char_length(
+                getattr(SampleItem, 'name')).label('name_length'),
+            func.coalesce(
+                func.char_length(getattr(SampleItem, 'description')), 0,
+            ).label('description_length'),
+        )
+
+    def search_query(self, text: str) -> Select[tuple[SampleItem]]:
+        """Full-text search over the generated `search_vector` column.
+
+        `text` is parsed with `websearch_to_tsquery`, so quoted phrases, `or`
+        and `-word` work and malformed input never raises. Results are
+        ordered by `ts_rank`, ties broken by `id`.
+        """
+        ts_query = func.websearch_to_tsquery(
+            cast(literal(SAMPLE_ITEM_SEARCH_CONFIG), REGCONFIG), text)
+        rank = func.ts_rank(sample_item_search_vector, ts_query)
+        return (
+            select(SampleItem)
+            .where(
+                getattr(SampleItem, self._deleted_at_field).is_(None),
+                sample_item_search_vector.bool_op('@@')(ts_query),
+            )
+            .order_by(rank.desc(), getattr(SampleItem, 'id'))
+        )
+
 
 class InDBSampleItemByUUIDRepository(
     SampleItemByUUIDRepository,
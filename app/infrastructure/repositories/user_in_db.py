@@ -1,8 +1,9 @@
 """User repository in DB"""
 from datetime import datetime
 from logging import getLogger
-from typing import Callable
+from typing import Callable, Mapping
 
+from sqlalchemy import DateTime, Integer, column, or_, update, values
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.domain.entities.user import User
@@ -28,6 +29,30 @@ class InDBUserRepository(
         """Factory method."""
         return lambda db_session: InDBUserRepository(db_session, get_now)
 
+    async def update_last_logins(
+            self,
+            last_logins: Mapping[int, datetime],
+    ) -> None:
+        """`UPDATE users ... FROM (VALUES ...)` with one row per user."""
+        if not last_logins:
+            return
+        logins = values(
+            column('id', Integer),
+            column('last_login', DateTime(timezone=True)),
+            name='logins',
+        ).data(list(last_logins.items()))
+        last_login = getattr(User, 'last_login')
+        await self._db_session.execute(
+            update(User)
+            .where(
+                getattr(User, 'id') == logins.c.id,
+                or_(last_login.is_(None),
+                    last_login < logins.c.last_login),
+            )
+            .values(last_login=logins.c.last_login)
+            .execution_options(synchronize_session=False)
+        )
+
 
 class InDBUserByEmailRepository(
     UserByEmailRepository,
@@ -68,3 +93,7 @@ class InDBUserQueryFactory(
 ):
     """In-DB User query."""
     _entity_cls = User
+    _include_paths = {
+        'roles': ('roles',),
+        'permissions': ('roles', 'permissions'),
+    }
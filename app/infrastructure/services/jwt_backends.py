@@ -0,0 +1,286 @@
+"""JWT encoding and verification backends of `JwtTokenServiceImpl`."""
+import base64
+import binascii
+import hashlib
+import hmac
+import json
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Callable
+
+import jwt as pyjwt
+from jose import jwk as jose_jwk
+from jose import jwt as jose_jwt
+from jose.exceptions import JOSEError
+from jwt.algorithms import get_default_algorithms
+
+# HMAC algorithms, signed and verified with a shared secret.
+_HMAC_ALGORITHMS = frozenset({'HS256', 'HS384', 'HS512'})
+
+
+class JwtError(Exception):
+    """Invalid token, or claims that do not verify."""
+
+
+class JwtBackend(ABC):
+    """Encodes and verifies signed JWTs."""
+
+    # Signing algorithms the backend supports.
+    algorithms: frozenset[str]
+
+    def __init__(self) -> None:
+        self._parsed_keys: dict[tuple[str, str], Any] = {}
+
+    def _key(self, key: str, algorithm: str) -> Any:
+        """Return `key` as the library takes it.
+
+        Parsing a PEM key costs far more than a signature, tens of
+        milliseconds for an RSA private key, so asymmetric keys are parsed
+        once by `_parse_key` and reused.
+        """
+        if algorithm in _HMAC_ALGORITHMS:
+            return key
+        parsed = self._parsed_keys.get((key, algorithm))
+        if parsed is None:
+            parsed = self._parsed_keys[key, algorithm] = \
+                self._parse_key(key, algorithm)
+        return parsed
+
+    # pylint: disable=unused-argument
+    def _parse_key(self, key: str, algorithm: str) -> Any:
+        """Parse an asymmetric PEM key; backends of HMAC only never do."""
+        return key
+
+    @abstractmethod
+    def encode(
+            self,
+            claims: dict[str, Any],
+            key: str,
+            algorithm: str,
+            kid: str | None = None,
+    ) -> str:
+        """Sign `claims` into a compact JWT, with `kid` in its header.
+
+        `key` is the secret of HMAC algorithms, or the private PEM key of
+        asymmetric ones.
+        """
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    @abstractmethod
+    def decode(
+            self,
+            token: str,
+            key: str,
+            algorithm: str,
+            audience: str,
+            issuer: str,
+    ) -> dict[str, Any]:
+        """Verify the signature and the claims of a token and return them.
+
+        `key` is the secret of HMAC algorithms, or the public PEM key of
+        asymmetric ones. `exp` and `nbf` are checked against the current
+        time, `aud` and `iss` against `audience` and `issuer`.
+
+        Raises:
+            JwtError: If the token is invalid.
+        """
+
+
+class JoseJwtBackend(JwtBackend):
+    """Backend of `python-jose`."""
+    algorithms = _HMAC_ALGORITHMS | {'RS256'}
+
+    def _parse_key(self, key: str, algorithm: str) -> Any:
+        return jose_jwk.construct(key, algorithm)
+
+    def encode(
+            self,
+            claims: dict[str, Any],
+            key: str,
+            algorithm: str,
+            kid: str | None = None,
+    ) -> str:
+        return jose_jwt.encode(
+            claims, self._key(key, algorithm), algorithm=algorithm,
+            headers={'kid': kid} if kid is not None else None)
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def decode(
+            self,
+            token: str,
+            key: str,
+            algorithm: str,
+            audience: str,
+            issuer: str,
+    ) -> dict[str, Any]:
+        try:
+            return jose_jwt.decode(
+                token, self._key(key, algorithm), algorithms=[algorithm],
+                audience=audience, issuer=issuer)
+        except JOSEError as err:
+            raise JwtError(str(err)) from err
+
+
+class PyJwtBackend(JwtBackend):
+    """Backend of `PyJWT`."""
+    algorithms = _HMAC_ALGORITHMS | {'RS256', 'EdDSA'}
+
+    def _parse_key(self, key: str, algorithm: str) -> Any:
+        return get_default_algorithms()[algorithm].prepare_key(key)
+
+    def encode(
+            self,
+            claims: dict[str, Any],
+            key: str,
+            algorithm: str,
+            kid: str | None = None,
+    ) -> str:
+        return pyjwt.encode(
+            claims, self._key(key, algorithm), algorithm=algorithm,
+            headers={'kid': kid} if kid is not None else None)
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def decode(
+            self,
+            token: str,
+            key: str,
+            algorithm: str,
+            audience: str,
+            issuer: str,
+    ) -> dict[str, Any]:
+        try:
+            claims: dict[str, Any] = pyjwt.decode(
+                token, self._key(key, algorithm), algorithms=[algorithm],
+                audience=audience, issuer=issuer)
+            return claims
+        except pyjwt.PyJWTError as err:
+            raise JwtError(str(err)) from err
+
+
+_HMAC_DIGESTS: dict[str, Callable[[], Any]] = {
+    'HS256': hashlib.sha256,
+    'HS384': hashlib.sha384,
+    'HS512': hashlib.sha512,
+}
+
+
+def _b64encode(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b'=')
+
+
+def _b64decode(data: bytes) -> bytes:
+    return base64.urlsafe_b64decode(data + b'=' * (-len(data) % 4))
+
+
+def _json(data: dict[str, Any]) -> bytes:
+    return json.dumps(data, separators=(',', ':')).encode()
+
+
+class StdlibJwtBackend(JwtBackend):
+    """HMAC backend built on `hmac`, `base64` and `json` only.
+
+    It supports the HS256, HS384 and HS512 algorithms and nothing else, so
+    it has far less to parse and dispatch than general purpose libraries.
+    """
+    algorithms = frozenset(_HMAC_DIGESTS)
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._headers = {
+            algorithm: _b64encode(_json({'alg': algorithm, 'typ': 'JWT'}))
+            for algorithm in self.algorithms
+        }
+
+    def encode(
+            self,
+            claims: dict[str, Any],
+            key: str,
+            algorithm: str,
+            kid: str | None = None,
+    ) -> str:
+        header = self._headers[algorithm] if kid is None else _b64encode(
+            _json({'alg': algorithm, 'typ': 'JWT', 'kid': kid}))
+        signing_input = header + b'.' + _b64encode(_json(claims))
+        signature = hmac.digest(
+            key.encode(), signing_input, _HMAC_DIGESTS[algorithm])
+        return (signing_input + b'.' + _b64encode(signature)).decode()
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def decode(
+            self,
+            token: str,
+            key: str,
+            algorithm: str,
+            audience: str,
+            issuer: str,
+    ) -> dict[str, Any]:
+        try:
+            signing_input, _, signature = token.encode().rpartition(b'.')
+            header, _, payload = signing_input.partition(b'.')
+            if json.loads(_b64decode(header)).get('alg') != algorithm:
+                raise JwtError('The token is not signed with the algorithm.')
+            expected = hmac.digest(
+                key.encode(), signing_input, _HMAC_DIGESTS[algorithm])
+            if not hmac.compare_digest(expected, _b64decode(signature)):
+                raise JwtError('Signature verification failed.')
+            claims = json.loads(_b64decode(payload))
+        except (AttributeError, UnicodeError, ValueError,
+                binascii.Error) as err:
+            raise JwtError('Invalid token.') from err
+
+        if not isinstance(claims, dict):
+            raise JwtError('Invalid payload.')
+        _verify_claims(claims, audience, issuer)
+        return claims
+
+
+def unverified_kid(token: str) -> str | None:
+    """Return the `kid` of the header of a token, before verifying it.
+
+    Raises:
+        JwtError: If the token has no readable header.
+    """
+    try:
+        header = json.loads(_b64decode(token.encode().partition(b'.')[0]))
+    except (AttributeError, UnicodeError, ValueError,
+            binascii.Error) as err:
+        raise JwtError('Invalid token.') from err
+    if not isinstance(header, dict):
+        raise JwtError('Invalid header.')
+    kid = header.get('kid')
+    return kid if isinstance(kid, str) else None
+
+
+def _verify_claims(
+        claims: dict[str, Any], audience: str, issuer: str) -> None:
+    """Check the registered claims as `python-jose` does, with no leeway."""
+    now = int(time.time())
+    for name in ('exp', 'nbf', 'iat'):
+        if name in claims and not isinstance(claims[name], int):
+            raise JwtError(f'Invalid {name} claim.')
+    if 'exp' in claims and claims['exp'] < now:
+        raise JwtError('Signature has expired.')
+    if 'nbf' in claims and claims['nbf'] > now:
+        raise JwtError('The token is not yet valid (nbf).')
+
+    aud = claims.get('aud')
+    if not (aud == audience
+            or isinstance(aud, list) and audience in aud):
+        raise JwtError('Invalid audience.')
+    if claims.get('iss') != issuer:
+        raise JwtError('Invalid issuer.')
+
+
+# Backends by the name of the `token_backend` setting.
+JWT_BACKENDS: dict[str, Callable[[], JwtBackend]] = {
+    'stdlib': StdlibJwtBackend,
+    'pyjwt': PyJwtBackend,
+    'jose': JoseJwtBackend,
+}
+
+
+def create_jwt_backend(name: str) -> JwtBackend:
+    """Create the backend of the `token_backend` setting."""
+    if name not in JWT_BACKENDS:
+        raise ValueError(f'Unsupported JWT backend: {name}')
+    return JWT_BACKENDS[name]()
@@ -0,0 +1,77 @@
+"""Key-value store implementations."""
+import time
+from typing import Callable
+
+from redis.asyncio import Redis
+
+from app.domain.services.cache import KeyValueStore
+
+
+def _milliseconds(seconds: float) -> int:
+    # Redis rejects a zero expiry.
+    return max(1, int(seconds * 1000))
+
+
+class RedisKeyValueStore(KeyValueStore):
+    """Key-value store backed by Redis."""
+
+    def __init__(self, url: str) -> None:
+        self._redis = Redis.from_url(url)
+
+    async def get(self, key: str) -> bytes | None:
+        """Return the value of `key`, or None if it is missing or expired."""
+        value: bytes | None = await self._redis.get(key)
+        return value
+
+    async def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        """Store `value` under `key` for `ttl_seconds`."""
+        await self._redis.set(key, value, px=_milliseconds(ttl_seconds))
+
+    async def add(self, key: str, value: bytes, ttl_seconds: float) -> bool:
+        """Store `value` under `key` for `ttl_seconds` unless `key` is
+        already stored, and return whether it was stored."""
+        return bool(await self._redis.set(
+            key, value, px=_milliseconds(ttl_seconds), nx=True))
+
+    async def delete(self, key: str) -> None:
+        """Drop `key` if it is stored."""
+        await self._redis.delete(key)
+
+    async def close(self) -> None:
+        """Close the connections to Redis."""
+        await self._redis.aclose()
+
+
+class InMemoryKeyValueStore(KeyValueStore):
+    """Process-local stand-in for `RedisKeyValueStore`, for tests."""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self._entries: dict[str, tuple[bytes, float]] = {}
+
+    async def get(self, key: str) -> bytes | None:
+        """Return the value of `key`, or None if it is missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            return None
+        return value
+
+    async def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        """Store `value` under `key` for `ttl_seconds`."""
+        self._entries[key] = (value, self._clock() + ttl_seconds)
+
+    async def add(self, key: str, value: bytes, ttl_seconds: float) -> bool:
+        """Store `value` under `key` for `ttl_seconds` unless `key` is
+        already stored, and return whether it was stored."""
+        if await self.get(key) is not None:
+            return False
+        await self.set(key, value, ttl_seconds)
+        return True
+
+    async def delete(self, key: str) -> None:
+        """Drop `key` if it is stored."""
+        self._entries.pop(key, None)
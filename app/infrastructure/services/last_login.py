@@ -0,0 +1,118 @@
+"""Write-behind last login recorder implementation."""
+import asyncio
+import time
+from contextlib import suppress
+from datetime import datetime
+from logging import getLogger
+from typing import AsyncContextManager, Callable
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.repositories.user import UserRepository
+from app.domain.services.auth.last_login import LastLoginRecorder
+from app.domain.services.metrics import MetricsRecorder
+
+logger = getLogger('uvicorn')
+
+
+# pylint: disable=too-many-instance-attributes
+class WriteBehindLastLoginRecorder(LastLoginRecorder):
+    """Queues last login times in memory and writes them in batches.
+
+    Logins only update the queue, which keeps the latest time per user. It
+    is flushed every `flush_interval_seconds`, or as soon as it holds
+    `batch_size` users, with one `UPDATE ... FROM (VALUES ...)` per batch,
+    and once more on `stop`. Logins of a worker that dies before a flush
+    are lost, which is acceptable for `last_login`.
+
+    `last_login.pending` is the number of queued users, `last_login.flushed`
+    counts the written ones and `last_login.flush_ms` times the flushes.
+    """
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def __init__(
+            self,
+            session_factory: Callable[[], AsyncContextManager[AsyncSession]],
+            user_repository_factory: Callable[[AsyncSession], UserRepository],
+            flush_interval_seconds: float,
+            batch_size: int,
+            metrics: MetricsRecorder,
+    ) -> None:
+        self._session_factory = session_factory
+        self._user_repository_factory = user_repository_factory
+        self._flush_interval_seconds = flush_interval_seconds
+        self._batch_size = batch_size
+        self._metrics = metrics
+        self._pending: dict[int, datetime] = {}
+        self._wake = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+    def record(self, user_id: int, logged_in_at: datetime) -> None:
+        """Queue a login."""
+        self._queue(user_id, logged_in_at)
+        self._metrics.set_gauge('last_login.pending', len(self._pending))
+        if len(self._pending) >= self._batch_size:
+            self._wake.set()
+
+    async def flush(self) -> int:
+        """Write the queued logins.
+
+        Raises:
+            Exception: If the update fails. The logins are queued again.
+        """
+        if not self._pending:
+            return 0
+        pending, self._pending = self._pending, {}
+        # Sorted, so concurrent flushes of several workers lock the rows in
+        # the same order and cannot deadlock.
+        items = sorted(pending.items())
+        started = time.perf_counter()
+        try:
+            async with self._session_factory() as db_session:
+                async with db_session.begin():
+                    repository = self._user_repository_factory(db_session)
+                    for i in range(0, len(items), self._batch_size):
+                        await repository.update_last_logins(
+                            dict(items[i:i + self._batch_size]))
+        except Exception:
+            for user_id, logged_in_at in items:
+                self._queue(user_id, logged_in_at)
+            self._metrics.increment('last_login.flush_errors')
+            raise
+        finally:
+            self._metrics.set_gauge('last_login.pending', len(self._pending))
+
+        self._metrics.increment('last_login.flushed', len(items))
+        self._metrics.observe(
+            'last_login.flush_ms', (time.perf_counter() - started) * 1000)
+        return len(items)
+
+    def start(self) -> None:
+        """Start flushing periodically on the running event loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop flushing periodically and flush what is left."""
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        await self.flush()
+
+    def _queue(self, user_id: int, logged_in_at: datetime) -> None:
+        queued_at = self._pending.get(user_id)
+        if queued_at is None or queued_at < logged_in_at:
+            self._pending[user_id] = logged_in_at
+
+    async def _run(self) -> None:
+        while True:
+            with suppress(TimeoutError):
+                await asyncio.wait_for(
+                    self._wake.wait(), self._flush_interval_seconds)
+            self._wake.clear()
+            try:
+                await self.flush()
+            except Exception:  # pylint: disable=broad-exception-caught
+                logger.exception('Failed to flush last_login updates.')
@@ -1,8 +1,10 @@
 """LoginSession service implement."""
 import secrets
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Callable
 
+from itsdangerous import BadData, URLSafeTimedSerializer
+
 from app.domain.entities.login_session import LoginSession
 from app.domain.entities.user import User
 from app.domain.services.auth.login_session import LoginSessionService
@@ -24,6 +26,8 @@ class LoginSessionServiceImpl(
         self._login_session_secret_key = login_session_secret_key
         self._login_session_expire_minutes = login_session_expire_minutes
         self._get_now = get_now
+        self._serializer = URLSafeTimedSerializer(
+            login_session_secret_key, salt='login-session')
 
     def create_session(self, user: User) -> LoginSession:
         session_id = self._generate_session_id()
@@ -39,6 +43,35 @@ class LoginSessionServiceImpl(
             expires_at=expires_at,
         )
 
+    def sign_session(self, session: LoginSession) -> str:
+        # A list rather than an object keeps the cookie small.
+        return self._serializer.dumps([
+            session.id,
+            session.user_id,
+            session.user_uuid,
+            int(session.expires_at.timestamp()),
+        ])
+
+    def load_signed_session(self, value: str) -> LoginSession | None:
+        try:
+            session_id, user_id, user_uuid, expires_at = \
+                self._serializer.loads(
+                    value,
+                    max_age=self._login_session_expire_minutes * 60,
+                )
+        except (BadData, TypeError, ValueError):
+            return None
+
+        session = LoginSession(
+            id=session_id,
+            user_id=user_id,
+            user_uuid=user_uuid,
+            expires_at=datetime.fromtimestamp(expires_at, timezone.utc),
+        )
+        if session.expires_at <= to_utc(self._get_now()):
+            return None
+        return session
+
     @staticmethod
     def _generate_session_id() -> str:
         """
@@ -0,0 +1,172 @@
+"""Login session cache implementation."""
+import json
+import time
+from collections import OrderedDict
+from datetime import datetime
+from logging import getLogger
+from typing import Callable
+
+from pydantic_core import to_json
+
+from app.domain.entities.login_session import LoginSession
+from app.domain.services.auth.login_session import LoginSessionCache
+from app.domain.services.cache import KeyValueStore
+from app.domain.services.metrics import MetricsRecorder
+
+logger = getLogger('uvicorn')
+
+KEY_PREFIX = 'login_session:'
+# Stored in the shared tier in place of an invalidated session, so that a
+# request which read the session before it was deleted cannot cache it again.
+TOMBSTONE = b''
+
+
+# pylint: disable=too-many-instance-attributes
+class TwoTierLoginSessionCache(LoginSessionCache):
+    """Login session cache with a process-local tier and a shared one.
+
+    Sessions are kept in an LRU in this process for `local_ttl_seconds` and,
+    with a `shared_store`, in that store for `shared_ttl_seconds`, but never
+    past their `expires_at`. A TTL of 0 disables a tier.
+
+    Invalidating a session drops it here and from the shared store. Other
+    processes may still accept it from their local tier until its local TTL
+    runs out, so that TTL should be short.
+
+    Errors of the shared store are logged and handled as misses, the session
+    is then read from the database.
+    """
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def __init__(
+            self,
+            local_ttl_seconds: float,
+            local_max_entries: int,
+            shared_store: KeyValueStore | None,
+            shared_ttl_seconds: float,
+            metrics: MetricsRecorder,
+            get_now: Callable[[], datetime],
+            clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._local_ttl_seconds = local_ttl_seconds
+        self._local_max_entries = local_max_entries
+        self._shared_store = shared_store \
+            if shared_ttl_seconds > 0 else None
+        self._shared_ttl_seconds = shared_ttl_seconds
+        self._metrics = metrics
+        self._get_now = get_now
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[LoginSession, float]] = \
+            OrderedDict()
+
+    async def get(self, session_id: str) -> LoginSession | None:
+        """Return the cached session, or None on a miss."""
+        entry = self._entries.get(session_id)
+        if entry is not None:
+            session, expires_at = entry
+            if expires_at > self._clock():
+                self._entries.move_to_end(session_id)
+                self._metrics.increment('login_session_cache.local.hits')
+                return session
+            del self._entries[session_id]
+
+        shared_session = await self._get_shared(session_id)
+        if shared_session is not None:
+            self._metrics.increment('login_session_cache.shared.hits')
+            self._store_local(shared_session)
+            return shared_session
+
+        self._metrics.increment('login_session_cache.misses')
+        return None
+
+    async def set(self, session: LoginSession) -> None:
+        """Cache a session loaded from the repository. It is never kept
+        past its `expires_at`.
+
+        A session the shared tier holds a tombstone for was read before its
+        invalidation committed, it is not cached locally either.
+        """
+        if not await self._set_shared(session):
+            return
+        self._store_local(session)
+
+    async def invalidate(self, session_id: str) -> None:
+        """Drop a session from every tier of the cache."""
+        self.invalidate_local(session_id)
+        if self._shared_store is None:
+            return
+
+        try:
+            await self._shared_store.set(
+                KEY_PREFIX + session_id, TOMBSTONE, self._shared_ttl_seconds)
+        except Exception as err:  # pylint: disable=broad-exception-caught
+            self._shared_error('invalidate', session_id, err)
+
+    def invalidate_local(self, session_id: str) -> None:
+        """Drop a session from the local tier only."""
+        self._entries.pop(session_id, None)
+        self._metrics.set_gauge('login_session_cache.size', len(self._entries))
+
+    def clear(self) -> None:
+        """Drop every session of the local tier. The shared tier is kept."""
+        self._entries.clear()
+        self._metrics.set_gauge('login_session_cache.size', 0)
+
+    async def _get_shared(self, session_id: str) -> LoginSession | None:
+        if self._shared_store is None:
+            return None
+        try:
+            data = await self._shared_store.get(KEY_PREFIX + session_id)
+        except Exception as err:  # pylint: disable=broad-exception-caught
+            self._shared_error('read', session_id, err)
+            return None
+        if not data:
+            return None
+
+        session = LoginSession.model_validate(json.loads(data))
+        if self._seconds_left(session) <= 0:
+            return None
+        return session
+
+    async def _set_shared(self, session: LoginSession) -> bool:
+        """Store `session` in the shared tier unless it is already there,
+        and return False if it holds a tombstone for it instead."""
+        if self._shared_store is None:
+            return True
+        ttl_seconds = min(
+            self._shared_ttl_seconds, self._seconds_left(session))
+        if ttl_seconds <= 0:
+            return True
+
+        key = KEY_PREFIX + session.id
+        try:
+            if await self._shared_store.add(
+                    key, to_json(session.model_dump()), ttl_seconds):
+                return True
+            return await self._shared_store.get(key) != TOMBSTONE
+        except Exception as err:  # pylint: disable=broad-exception-caught
+            self._shared_error('store', session.id, err)
+            return True
+
+    def _store_local(self, session: LoginSession) -> None:
+        ttl_seconds = min(self._local_ttl_seconds, self._seconds_left(session))
+        if ttl_seconds <= 0 or self._local_max_entries <= 0:
+            return
+
+        self._entries[session.id] = (session, self._clock() + ttl_seconds)
+        self._entries.move_to_end(session.id)
+        while len(self._entries) > self._local_max_entries:
+            self._entries.popitem(last=False)
+            self._metrics.increment('login_session_cache.local.evictions')
+        self._metrics.set_gauge('login_session_cache.size', len(self._entries))
+
+    def _seconds_left(self, session: LoginSession) -> float:
+        return (session.expires_at - self._get_now()).total_seconds()
+
+    def _shared_error(
+            self, action: str, session_id: str, err: Exception) -> None:
+        self._metrics.increment('login_session_cache.shared.errors')
+        # Log a prefix only, the session ID is a credential.
+        logger.error(
+            'Failed to %s login session %s... in the shared cache: %s',
+            action, session_id[:8], err)
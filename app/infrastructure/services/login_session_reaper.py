@@ -0,0 +1,90 @@
+"""Login session reaper implementation."""
+import asyncio
+import time
+from contextlib import suppress
+from logging import getLogger
+from typing import AsyncContextManager, Callable
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.repositories.login_session import LoginSessionRepository
+from app.domain.services.auth.login_session import LoginSessionReaper
+from app.domain.services.metrics import MetricsRecorder
+
+logger = getLogger('uvicorn')
+
+
+# pylint: disable=too-many-instance-attributes
+class BatchedLoginSessionReaper(LoginSessionReaper):
+    """Deletes ended sessions in small batches, every `interval_seconds`.
+
+    Each batch of at most `batch_size` sessions is deleted in its own
+    transaction, with `batch_pause_seconds` between batches, so row locks
+    are held briefly and other writes of `login_sessions` are not starved.
+
+    `login_session_reaper.deleted` counts the deleted sessions and
+    `login_session_reaper.reap_ms` times the passes.
+    """
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def __init__(
+            self,
+            session_factory: Callable[[], AsyncContextManager[AsyncSession]],
+            login_session_repository_factory: Callable[
+                [AsyncSession], LoginSessionRepository],
+            interval_seconds: float,
+            batch_size: int,
+            batch_pause_seconds: float,
+            metrics: MetricsRecorder,
+    ) -> None:
+        self._session_factory = session_factory
+        self._login_session_repository_factory = \
+            login_session_repository_factory
+        self._interval_seconds = interval_seconds
+        self._batch_size = batch_size
+        self._batch_pause_seconds = batch_pause_seconds
+        self._metrics = metrics
+        self._task: asyncio.Task[None] | None = None
+
+    async def reap(self) -> int:
+        """Delete the ended sessions, one batch at a time."""
+        started = time.perf_counter()
+        total = 0
+        while True:
+            async with self._session_factory() as db_session:
+                async with db_session.begin():
+                    repository = self._login_session_repository_factory(
+                        db_session)
+                    deleted = await repository.delete_ended(self._batch_size)
+            total += deleted
+            self._metrics.increment('login_session_reaper.deleted', deleted)
+            if deleted < self._batch_size:
+                break
+            await asyncio.sleep(self._batch_pause_seconds)
+
+        self._metrics.observe(
+            'login_session_reaper.reap_ms',
+            (time.perf_counter() - started) * 1000)
+        return total
+
+    def start(self) -> None:
+        """Start reaping periodically on the running event loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop reaping periodically."""
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.reap()
+            except Exception:  # pylint: disable=broad-exception-caught
+                self._metrics.increment('login_session_reaper.errors')
+                logger.exception('Failed to reap login sessions.')
+            await asyncio.sleep(self._interval_seconds)
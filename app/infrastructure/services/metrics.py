@@ -0,0 +1,63 @@
+"""In-memory metrics recorder implementation."""
+import threading
+from typing import Any
+
+from pydantic import BaseModel
+
+from app.domain.services.metrics import MetricsRecorder
+
+
+class ObservationSummary(BaseModel):
+    """Aggregated observations of a single metric."""
+    count: int = 0
+    sum: float = 0.0
+    max: float = 0.0
+
+    @property
+    def avg(self) -> float:
+        """Average of the observed values."""
+        return self.sum / self.count if self.count else 0.0
+
+
+class InMemoryMetricsRecorder(MetricsRecorder):
+    """Process-local metrics recorder.
+
+    Values are kept per worker process; a scraper is expected to collect
+    them from every worker.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counters: dict[str, float] = {}
+        self._gauges: dict[str, float] = {}
+        self._summaries: dict[str, ObservationSummary] = {}
+
+    def increment(self, name: str, value: float = 1.0) -> None:
+        """Increment a counter."""
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0.0) + value
+
+    def set_gauge(self, name: str, value: float) -> None:
+        """Set a gauge to the given value."""
+        with self._lock:
+            self._gauges[name] = value
+
+    def observe(self, name: str, value: float) -> None:
+        """Record an observation."""
+        with self._lock:
+            summary = self._summaries.setdefault(name, ObservationSummary())
+            summary.count += 1
+            summary.sum += value
+            summary.max = max(summary.max, value)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return a point-in-time copy of all recorded metrics."""
+        with self._lock:
+            return {
+                'counters': dict(self._counters),
+                'gauges': dict(self._gauges),
+                'summaries': {
+                    name: summary.model_dump() | {'avg': summary.avg}
+                    for name, summary in self._summaries.items()
+                },
+            }
@@ -0,0 +1,62 @@
+"""Password hasher implementation."""
+from passlib.context import CryptContext
+from passlib.exc import MissingBackendError
+
+from app.domain.services.auth.password import PasswordHasher
+
+BCRYPT = 'bcrypt'
+ARGON2 = 'argon2'
+
+
+class PasslibPasswordHasher(PasswordHasher):
+    """Password hasher backed by a passlib `CryptContext`.
+
+    `scheme` is `bcrypt` or `argon2`, which needs `argon2-cffi`. Hashes of
+    the other scheme still verify when it is available, and any hash that
+    does not use `scheme` with exactly the given parameters is reported
+    for rehashing, so the cost can be lowered as well as raised.
+
+    Building the context parses its configuration, so a single instance is
+    shared by the application. It is built at startup, so that a scheme
+    without its library fails there rather than on the first login.
+    """
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def __init__(
+            self,
+            scheme: str = BCRYPT,
+            bcrypt_rounds: int = 12,
+            argon2_time_cost: int = 3,
+            argon2_memory_cost_kib: int = 65536,
+            argon2_parallelism: int = 4,
+    ) -> None:
+        if scheme not in (BCRYPT, ARGON2):
+            raise ValueError(f'Unsupported password hash scheme: {scheme}')
+        self._context = CryptContext(
+            schemes=[scheme] + [BCRYPT] * (scheme != BCRYPT),
+            deprecated='auto',
+            bcrypt__default_rounds=bcrypt_rounds,
+            bcrypt__min_rounds=bcrypt_rounds,
+            bcrypt__max_rounds=bcrypt_rounds,
+            argon2__time_cost=argon2_time_cost,
+            argon2__memory_cost=argon2_memory_cost_kib,
+            argon2__parallelism=argon2_parallelism,
+        )
+        try:
+            self._context.handler(scheme).get_backend()
+        except MissingBackendError as err:
+            raise ValueError(
+                f'Password hash scheme {scheme} is not available: {err}'
+            ) from err
+
+    def hash(self, password: str) -> str:
+        """Hash a password."""
+        return self._context.hash(password)
+
+    def verify_and_update(
+            self,
+            password: str,
+            password_hash: str,
+    ) -> tuple[bool, str | None]:
+        """Verify a password and rehash it if its hash is outdated."""
+        return self._context.verify_and_update(password, password_hash)
@@ -0,0 +1,40 @@
+"""Query cost estimator implementations."""
+import json
+from typing import Any, Callable
+
+from sqlalchemy import Select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.services.query_cost import QueryCostEstimator
+
+
+class PostgresQueryCostEstimator(QueryCostEstimator):
+    """Reads the estimated total cost from PostgreSQL's `EXPLAIN`.
+
+    Only plans the statement, it is never executed.
+    """
+
+    def __init__(self, db_session: AsyncSession) -> None:
+        """Constructor."""
+        self._db_session = db_session
+
+    @staticmethod
+    def factory() -> Callable[[AsyncSession], 'PostgresQueryCostEstimator']:
+        """Factory method."""
+        return PostgresQueryCostEstimator
+
+    async def estimate(self, stmt: Select[Any]) -> float:
+        """Return the planner's estimated total cost of `stmt`."""
+        connection = await self._db_session.connection()
+        compiled = stmt.compile(dialect=connection.dialect)
+        params = compiled.construct_params()
+        positional = tuple(
+            params[name] for name in compiled.positiontup or ())
+        result = await connection.exec_driver_sql(
+            f'EXPLAIN (FORMAT JSON) {compiled.string}',
+            positional if compiled.positional else params,
+        )
+        plan = result.scalar_one()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return float(plan[0]['Plan']['Total Cost'])
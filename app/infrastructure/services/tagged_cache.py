@@ -0,0 +1,167 @@
+"""In-memory tagged cache implementation."""
+import asyncio
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Iterable, cast
+
+from app.domain.services.cache import TaggedCache, ValueT
+from app.domain.services.metrics import MetricsRecorder
+
+
+@dataclass
+class _Entry:
+    """Cached value with its expiry and tags."""
+    value: Any
+    expires_at: float
+    tags: frozenset[str]
+
+
+# pylint: disable=too-many-instance-attributes
+class InMemoryTaggedCache(TaggedCache):
+    """Process-local LRU cache with TTL, tags and stampede protection.
+
+    A `ttl_seconds` of 0 disables caching; every call goes to the loader.
+    """
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def __init__(
+            self,
+            name: str,
+            ttl_seconds: float,
+            max_entries: int,
+            metrics: MetricsRecorder,
+            clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._name = name
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._metrics = metrics
+        self._clock = clock
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._keys_by_tag: dict[str, set[str]] = {}
+        self._tag_versions: dict[str, int] = {}
+        self._inflight: dict[str, asyncio.Future[Any]] = {}
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether entries are stored at all."""
+        return self._ttl_seconds > 0 and self._max_entries > 0
+
+    async def get_or_load(
+            self,
+            key: str,
+            tags: Iterable[str],
+            loader: Callable[[], Awaitable[ValueT]],
+    ) -> ValueT:
+        """Return the cached value for `key`, loading it on a miss.
+
+        Exceptions raised by `loader` are not cached. Callers that were
+        waiting on a failed load retry it themselves.
+        """
+        if not self.enabled:
+            return await loader()
+
+        entry = self._entries.get(key)
+        if entry is not None and entry.expires_at > self._clock():
+            self._entries.move_to_end(key)
+            self._record(hit=True)
+            return cast(ValueT, entry.value)
+        if entry is not None:
+            self._remove(key)
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            # Another request is already loading this key; share its result
+            # instead of sending the same query to the database again.
+            self._metrics.increment(f'{self._name}.coalesced')
+            try:
+                return cast(ValueT, await asyncio.shield(inflight))
+            except Exception:  # pylint: disable=broad-exception-caught
+                # The leader's failure may be specific to its own request,
+                # so load again rather than sharing its exception.
+                return await self.get_or_load(key, tags, loader)
+
+        self._record(hit=False)
+        tags = frozenset(tags)
+        versions = self._versions_of(tags)
+        future: asyncio.Future[Any] = \
+            asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await loader()
+        except Exception as err:
+            future.set_exception(err)
+            # Mark the exception as retrieved when nobody else is waiting.
+            future.exception()
+            raise
+        except BaseException:
+            future.cancel()
+            raise
+        finally:
+            del self._inflight[key]
+
+        future.set_result(value)
+        # Skip storing a value loaded while one of its tags was invalidated,
+        # it may already be stale.
+        if versions == self._versions_of(tags):
+            self._store(key, value, tags)
+        return value
+
+    def invalidate_tags(self, tags: Iterable[str]) -> None:
+        """Drop every entry carrying any of the given tags."""
+        for tag in tags:
+            self._tag_versions[tag] = self._tag_versions.get(tag, 0) + 1
+            for key in list(self._keys_by_tag.get(tag, ())):
+                self._remove(key)
+            self._metrics.increment(f'{self._name}.invalidations')
+        self._metrics.set_gauge(f'{self._name}.size', len(self._entries))
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self.invalidate_tags(list(self._keys_by_tag))
+        self._entries.clear()
+        self._metrics.set_gauge(f'{self._name}.size', 0)
+
+    def _versions_of(self, tags: frozenset[str]) -> dict[str, int]:
+        return {tag: self._tag_versions.get(tag, 0) for tag in tags}
+
+    def _store(self, key: str, value: Any, tags: frozenset[str]) -> None:
+        self._entries[key] = _Entry(
+            value=value,
+            expires_at=self._clock() + self._ttl_seconds,
+            tags=tags,
+        )
+        for tag in tags:
+            self._keys_by_tag.setdefault(tag, set()).add(key)
+
+        while len(self._entries) > self._max_entries:
+            oldest_key = next(iter(self._entries))
+            self._remove(oldest_key)
+            self._metrics.increment(f'{self._name}.evictions')
+        self._metrics.set_gauge(f'{self._name}.size', len(self._entries))
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for tag in entry.tags:
+            keys = self._keys_by_tag.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_tag[tag]
+
+    def _record(self, hit: bool) -> None:
+        if hit:
+            self._hits += 1
+            self._metrics.increment(f'{self._name}.hits')
+        else:
+            self._misses += 1
+            self._metrics.increment(f'{self._name}.misses')
+        self._metrics.set_gauge(
+            f'{self._name}.hit_ratio',
+            self._hits / (self._hits + self._misses),
+        )
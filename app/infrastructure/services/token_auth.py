@@ -6,94 +6,147 @@ from datetime import datetime
 from logging import getLogger
 from typing import Callable
 
-from jose import jwt
-from jose.exceptions import JWTError
-from passlib.context import CryptContext
-
 from app.application.exc import Unauthorized
 from app.domain.entities.user import User
 from app.domain.repositories.user import UserByEmailRepository
 from app.domain.services.auth.token import JwtTokenService, JwtPayload
 from app.domain.services.auth.base import UserAuthService
+from app.domain.services.auth.last_login import LastLoginRecorder
+from app.domain.services.auth.password import PasswordHasher
+from app.infrastructure.services.jwt_backends import JwtBackend, JwtError, \
+    unverified_kid
+from app.infrastructure.services.token_keys import ASYMMETRIC_ALGORITHMS, \
+    TokenKeyRing
+from app.infrastructure.services.worker_pool import BoundedWorkerPool
 
 logger = getLogger('uvicorn')
 
 
 class InDBUserTokenAuthService(UserAuthService):
-    """In DB user auth service."""
+    """In DB user auth service.
+
+    `password_hasher` runs on `password_hashing_pool`, so a login does not
+    block the event loop for the duration of a hash. `last_login` is left
+    to `last_login_recorder`, outside of the login transaction.
+    """
 
     @staticmethod
     def create_factory(
             get_now: Callable[[], datetime],
+            password_hasher: PasswordHasher,
+            password_hashing_pool: BoundedWorkerPool,
+            last_login_recorder: LastLoginRecorder,
     ) -> 'Callable[[UserByEmailRepository], UserAuthService]':
         """Create factory."""
         return lambda user_repository: InDBUserTokenAuthService(
-            user_repository, get_now
+            user_repository, get_now, password_hasher, password_hashing_pool,
+            last_login_recorder,
         )
 
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
     def __init__(
             self,
             user_repository: UserByEmailRepository,
             get_now: Callable[[], datetime],
+            password_hasher: PasswordHasher,
+            password_hashing_pool: BoundedWorkerPool,
+            last_login_recorder: LastLoginRecorder,
     ) -> None:
         """Initialize."""
         self._get_now = get_now
         self._user_repository = user_repository
-        self._pwd_context = CryptContext(
-            schemes=['bcrypt'], deprecated='auto')
+        self._password_hasher = password_hasher
+        self._password_hashing_pool = password_hashing_pool
+        self._last_login_recorder = last_login_recorder
 
     async def authenticate(self, username: str, password: str) -> User | None:
-        """Authenticate user."""
+        """Authenticate user.
+
+        A stored hash with an outdated scheme or cost is replaced by a
+        current one, so the hashing parameters can be retuned without a
+        migration.
+
+        Raises:
+            ServiceBusy: If no password hashing worker is free in time.
+        """
         user = await self._user_repository.get_by_id(username)
         if user is None:
             return None
 
-        if not self._verify_password(password, user.password_hash):
+        valid, new_password_hash = await self._password_hashing_pool.run(
+            self._password_hasher.verify_and_update,
+            password, user.password_hash)
+        if not valid:
             return None
 
-        await self._user_repository.update(
-            str(user.email),
-            {'last_login': self._get_now()}
-        )
+        if new_password_hash is not None:
+            await self._user_repository.update(
+                str(user.email), {'password_hash': new_password_hash})
+        self._last_login_recorder.record(
+            getattr(user, 'id'), self._get_now())
 
         return user
 
-    def hash_password(self, password: str) -> str:
-        """Hash password."""
-        return self._pwd_context.hash(password)
+    async def hash_password(self, password: str) -> str:
+        """Hash password.
 
-    def _verify_password(
-            self, plain_password: str, hashed_password: str) -> bool:
-        return self._pwd_context.verify(
-            plain_password, hashed_password)
+        Raises:
+            ServiceBusy: If no password hashing worker is free in time.
+        """
+        return await self._password_hashing_pool.run(
+            self._password_hasher.hash, password)
 
 
 class JwtTokenServiceImpl(JwtTokenService):
-    """JWT token service implementation."""
+    """JWT token service implementation.
+
+    Tokens are encoded and verified by `backend`, see `jwt_backends`.
+    With an asymmetric `token_algorithm` (RS256, EdDSA), tokens are signed
+    with the signing key of `key_ring` and carry its `kid`, and are
+    verified with the public key of their `kid`; `token_secret_key` is not
+    used.
+    """
 
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
     def __init__(
             self,
             token_secret_key: str,
             token_algorithm: str,
             audience: str,
             issuer: str,
+            backend: JwtBackend,
+            key_ring: TokenKeyRing | None = None,
     ) -> None:
         """Initialize."""
-        self._pwd_context = CryptContext(
-            schemes=['bcrypt'], deprecated='auto')
+        if token_algorithm not in backend.algorithms:
+            raise ValueError(
+                f'{type(backend).__name__} does not support '
+                f'{token_algorithm}.')
+        if token_algorithm in ASYMMETRIC_ALGORITHMS and (
+                key_ring is None or key_ring.signing_key is None):
+            raise ValueError(f'No signing key for {token_algorithm}.')
         self._token_secret_key = token_secret_key
         self._token_algorithm = token_algorithm
         self._audience = audience
         self._issuer = issuer
+        self._backend = backend
+        self._key_ring = key_ring \
+            if token_algorithm in ASYMMETRIC_ALGORITHMS else None
 
     def create_token(self, data: JwtPayload) -> str:
         """Create access token."""
-        encoded_jwt: str = jwt.encode(
+        if self._key_ring is None:
+            return self._backend.encode(
+                data.model_dump(exclude_none=True),
+                self._token_secret_key,
+                self._token_algorithm)
+        signing_key = self._key_ring.signing_key
+        assert signing_key is not None and signing_key.private_pem
+        return self._backend.encode(
             data.model_dump(exclude_none=True),
-            self._token_secret_key,
-            algorithm=self._token_algorithm)
-
-        return encoded_jwt
+            signing_key.private_pem,
+            self._token_algorithm,
+            kid=signing_key.kid)
 
     def verify_token(self, token: str) -> JwtPayload:
         """Verify token.
@@ -108,19 +161,25 @@ class JwtTokenServiceImpl(JwtTokenService):
             Unauthorized: Invalid token.
         """
         try:
-            payload_dict = jwt.decode(
+            payload_dict = self._backend.decode(
                 token,
-                self._token_secret_key,
-                algorithms=[self._token_algorithm],
+                self._verification_key(token),
+                self._token_algorithm,
                 audience=self._audience,
                 issuer=self._issuer,
             )
-
-            payload = JwtPayload.model_validate(payload_dict)
-            return payload
-
-        except JWTError as err:
+        except JwtError as err:
             logger.warning('Could not validate credentials: %s', err)
             raise Unauthorized(
                 'Could not validate credentials'
             ) from err
+
+        return JwtPayload.model_validate(payload_dict)
+
+    def _verification_key(self, token: str) -> str:
+        if self._key_ring is None:
+            return self._token_secret_key
+        key = self._key_ring.verification_key(unverified_kid(token))
+        if key is None:
+            raise JwtError('Unknown signing key.')
+        return key
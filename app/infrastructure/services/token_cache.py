@@ -0,0 +1,69 @@
+"""Verified token cache implementation."""
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Callable
+
+from app.domain.services.auth.token import JwtPayload, JwtTokenService
+from app.domain.services.metrics import MetricsRecorder
+
+
+class CachingJwtTokenService(JwtTokenService):
+    """Remembers the payloads of verified tokens.
+
+    A token verified by `jwt_token_service` is kept, by its SHA-256 digest,
+    in an LRU of `max_entries` payloads until its `exp`. Hits skip the
+    signature and claim verification, but `exp` and `nbf` are checked
+    against the clock on every hit; a token failing them is verified again
+    by `jwt_token_service`, which rejects it. A `max_entries` of 0 disables
+    the cache.
+    """
+
+    def __init__(
+            self,
+            jwt_token_service: JwtTokenService,
+            max_entries: int,
+            metrics: MetricsRecorder,
+            clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._jwt_token_service = jwt_token_service
+        self._max_entries = max_entries
+        self._metrics = metrics
+        self._clock = clock
+        self._payloads: OrderedDict[bytes, JwtPayload] = OrderedDict()
+
+    def create_token(self, data: JwtPayload) -> str:
+        """Create access token."""
+        return self._jwt_token_service.create_token(data)
+
+    def verify_token(self, token: str) -> JwtPayload:
+        """Verify token, or return its cached payload.
+
+        Exceptions:
+            Unauthorized: Invalid token.
+        """
+        if self._max_entries <= 0:
+            return self._jwt_token_service.verify_token(token)
+
+        key = hashlib.sha256(token.encode()).digest()
+        payload = self._payloads.get(key)
+        if payload is not None:
+            if self._is_current(payload):
+                self._payloads.move_to_end(key)
+                self._metrics.increment('access_token_cache.hits')
+                return payload
+            del self._payloads[key]
+
+        self._metrics.increment('access_token_cache.misses')
+        payload = self._jwt_token_service.verify_token(token)
+        if self._is_current(payload):
+            self._payloads[key] = payload
+            while len(self._payloads) > self._max_entries:
+                self._payloads.popitem(last=False)
+        self._metrics.set_gauge('access_token_cache.size', len(self._payloads))
+        return payload
+
+    def _is_current(self, payload: JwtPayload) -> bool:
+        # Whole seconds, as the claims are compared on verification.
+        now = int(self._clock())
+        return payload.nbf <= now <= payload.exp
@@ -0,0 +1,121 @@
+"""Asymmetric token signing keys."""
+import base64
+from pathlib import Path
+from typing import Any, Mapping, Sequence
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ed25519, rsa
+from pydantic import BaseModel
+
+# Algorithms signed with a private key: RSA for RS256, Ed25519 for EdDSA.
+ASYMMETRIC_ALGORITHMS = frozenset({'RS256', 'EdDSA'})
+
+
+def _b64(number_or_bytes: int | bytes) -> str:
+    data = number_or_bytes if isinstance(number_or_bytes, bytes) \
+        else number_or_bytes.to_bytes(
+            (number_or_bytes.bit_length() + 7) // 8, 'big')
+    return base64.urlsafe_b64encode(data).rstrip(b'=').decode()
+
+
+class TokenKey(BaseModel):
+    """Key pair of one `kid`, as PEM text.
+
+    Keys of which only the public half is known verify tokens but cannot
+    sign them.
+    """
+    kid: str
+    algorithm: str
+    private_pem: str | None
+    public_pem: str
+    jwk: dict[str, Any]
+
+    @classmethod
+    def from_pem(cls, kid: str, algorithm: str, pem: bytes) -> 'TokenKey':
+        """Load a private or public PEM key.
+
+        Raises:
+            ValueError: If the key does not suit `algorithm`.
+        """
+        private_pem: str | None = None
+        if b'PRIVATE KEY' in pem:
+            private_key = serialization.load_pem_private_key(pem, None)
+            private_pem = pem.decode()
+            public_key: Any = private_key.public_key()
+        else:
+            public_key = serialization.load_pem_public_key(pem)
+
+        if algorithm not in ASYMMETRIC_ALGORITHMS:
+            raise ValueError(f'Unsupported token algorithm: {algorithm}')
+        if isinstance(public_key, rsa.RSAPublicKey) and algorithm == 'RS256':
+            numbers = public_key.public_numbers()
+            jwk = {'kty': 'RSA', 'n': _b64(numbers.n), 'e': _b64(numbers.e)}
+        elif isinstance(public_key, ed25519.Ed25519PublicKey) \
+                and algorithm == 'EdDSA':
+            jwk = {'kty': 'OKP', 'crv': 'Ed25519', 'x': _b64(
+                public_key.public_bytes(
+                    serialization.Encoding.Raw,
+                    serialization.PublicFormat.Raw,
+                ))}
+        else:
+            raise ValueError(f'Key {kid} is not a {algorithm} key.')
+        return cls(
+            kid=kid,
+            algorithm=algorithm,
+            private_pem=private_pem,
+            public_pem=public_key.public_bytes(
+                serialization.Encoding.PEM,
+                serialization.PublicFormat.SubjectPublicKeyInfo,
+            ).decode(),
+            jwk=jwk | {'kid': kid, 'alg': algorithm, 'use': 'sig'},
+        )
+
+
+class TokenKeyRing:
+    """Keys that sign and verify tokens, by `kid`.
+
+    Tokens are signed with the key of `signing_key_id` only, and verified
+    with any key of the ring. Keeping the previous key in the ring, with
+    only its public half, lets the tokens it signed verify until they
+    expire.
+    """
+
+    def __init__(self, keys: Sequence[TokenKey], signing_key_id: str) -> None:
+        self._keys = {key.kid: key for key in keys}
+        if keys and (signing_key_id not in self._keys
+                     or self._keys[signing_key_id].private_pem is None):
+            raise ValueError(
+                f'No private key for the signing key {signing_key_id!r}.')
+        self._signing_key_id = signing_key_id
+
+    @classmethod
+    def from_files(
+            cls,
+            algorithm: str,
+            key_files: Mapping[str, str],
+            signing_key_id: str,
+    ) -> 'TokenKeyRing':
+        """Load the PEM key files of `key_files`, by `kid`.
+
+        No keys are loaded for symmetric algorithms.
+        """
+        if algorithm not in ASYMMETRIC_ALGORITHMS:
+            return cls([], signing_key_id)
+        return cls([
+            TokenKey.from_pem(kid, algorithm, Path(path).read_bytes())
+            for kid, path in key_files.items()
+        ], signing_key_id)
+
+    @property
+    def signing_key(self) -> TokenKey | None:
+        """The key new tokens are signed with, if any."""
+        return self._keys.get(self._signing_key_id)
+
+    def verification_key(self, kid: str | None) -> str | None:
+        """The public PEM key of `kid`, or None if it is not in the ring."""
+        key = self._keys.get(kid) if kid is not None else None
+        return key.public_pem if key is not None else None
+
+    def jwks(self) -> dict[str, Any]:
+        """The public keys of the ring as a JSON Web Key Set."""
+        return {'keys': [key.jwk for key in self._keys.values()]}
@@ -0,0 +1,87 @@
+"""Bounded worker pool for blocking, CPU-bound calls."""
+import asyncio
+import functools
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, ParamSpec, TypeVar
+
+from app.application.exc import ServiceBusy
+from app.domain.services.metrics import MetricsRecorder
+
+P = ParamSpec('P')
+T = TypeVar('T')
+
+
+class BoundedWorkerPool:
+    """Runs blocking calls on a fixed number of threads.
+
+    At most `max_workers` calls run at once; the others wait in line for at
+    most `queue_timeout_seconds` before `ServiceBusy` is raised, so a burst
+    is shed instead of queueing without bound. The event loop is never
+    blocked, as long as the calls release the GIL as bcrypt and argon2 do.
+
+    `{name}.queue_depth` is the number of calls waiting for a worker,
+    `{name}.wait_ms` and `{name}.run_ms` the time they waited and ran, and
+    `{name}.rejected` counts the calls that timed out in the queue.
+    """
+
+    def __init__(
+            self,
+            name: str,
+            max_workers: int,
+            queue_timeout_seconds: float,
+            metrics: MetricsRecorder,
+    ) -> None:
+        self._name = name
+        self._queue_timeout_seconds = queue_timeout_seconds
+        self._metrics = metrics
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=name)
+        self._slots = asyncio.Semaphore(max_workers)
+        self._waiting = 0
+
+    async def run(
+            self,
+            fn: Callable[P, T],
+            *args: P.args,
+            **kwargs: P.kwargs,
+    ) -> T:
+        """Run `fn` on a worker thread and return its result.
+
+        Raises:
+            ServiceBusy: If no worker was free within the queue timeout.
+        """
+        queued_at = time.perf_counter()
+        self._set_waiting(self._waiting + 1)
+        try:
+            await asyncio.wait_for(
+                self._slots.acquire(), self._queue_timeout_seconds)
+        except TimeoutError as err:
+            self._metrics.increment(f'{self._name}.rejected')
+            raise ServiceBusy(
+                'Server is busy, please retry later.',
+                detail=f'No {self._name} worker was free in '
+                       f'{self._queue_timeout_seconds} seconds.',
+            ) from err
+        finally:
+            self._set_waiting(self._waiting - 1)
+
+        started_at = time.perf_counter()
+        self._metrics.observe(
+            f'{self._name}.wait_ms', (started_at - queued_at) * 1000)
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                self._executor, functools.partial(fn, *args, **kwargs))
+        finally:
+            self._slots.release()
+            self._metrics.observe(
+                f'{self._name}.run_ms',
+                (time.perf_counter() - started_at) * 1000)
+
+    def shutdown(self) -> None:
+        """Stop the worker threads once the running calls are done."""
+        self._executor.shutdown(wait=True)
+
+    def _set_waiting(self, waiting: int) -> None:
+        self._waiting = waiting
+        self._metrics.set_gauge(f'{self._name}.queue_depth', waiting)
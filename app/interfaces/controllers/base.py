@@ -1,8 +1,12 @@
 """Base router"""
-from fastapi import APIRouter
+from typing import Any
 
+from dependency_injector.wiring import inject, Provide
+from fastapi import APIRouter, Depends
+
+from app.domain.services.metrics import MetricsRecorder
 from app.interfaces.controllers.path import API_BASE_PATH, V1_PREFIX, \
-    HEALTH_CHECK_ENDPOINT
+    HEALTH_CHECK_ENDPOINT, METRICS_ENDPOINT
 from app.interfaces.controllers.v1.base import v1_router
 
 router = APIRouter(prefix=API_BASE_PATH)
@@ -14,3 +18,12 @@ router.include_router(v1_router, prefix=V1_PREFIX)
 async def root() -> dict[str, str]:
     """Health check."""
     return {'status': 'Healthy.'}
+
+
+@router.get(METRICS_ENDPOINT)
+@inject
+async def metrics(
+        metrics_recorder: MetricsRecorder = Depends(Provide['metrics']),
+) -> dict[str, Any]:
+    """Runtime metrics of this worker process."""
+    return metrics_recorder.snapshot()
@@ -0,0 +1,101 @@
+"""OpenAPI document and API documentation controllers."""
+import json
+from logging import getLogger
+from pathlib import Path
+from typing import Any
+
+from fastapi import FastAPI, Request
+from fastapi.openapi.docs import get_redoc_html, get_swagger_ui_html, \
+    get_swagger_ui_oauth2_redirect_html
+from fastapi.openapi.utils import get_openapi
+from fastapi.responses import HTMLResponse, Response
+
+from app.interfaces.controllers.base import router
+from app.interfaces.controllers.path import DOCS_URL, OPENAPI_URL, \
+    REDOC_URL
+from app.interfaces.views.openapi_document import OpenApiDocument
+
+logger = getLogger('uvicorn')
+
+
+def build_openapi_schema(app_name: str) -> dict[str, Any]:
+    """Generate the OpenAPI schema of the API routes."""
+    openapi_schema: dict[str, Any] = get_openapi(
+        title=f"{app_name} API",
+        version='0.0.1',
+        description=f"{app_name} API",
+        routes=router.routes,
+    )
+    # openapi_schema["components"]["securitySchemes"] = {
+    #     "BearerAuth": {
+    #         "type": "http",
+    #         "scheme": "bearer",
+    #         "bearerFormat": "JWT",
+    #     }
+    # }
+    # openapi_schema["security"] = [{"BearerAuth": []}]
+    return openapi_schema
+
+
+def include_openapi_routes(
+        app_: FastAPI,
+        app_name: str,
+        schema_path: str,
+        runtime_fallback: bool,
+) -> None:
+    """Serve the OpenAPI document and the documentation pages.
+
+    The document generated by `app/generate_openapi.py` is loaded from
+    `schema_path` once and served as static, precompressed bytes with an
+    ETag. Without it, the document is generated on the first request when
+    `runtime_fallback` is enabled, as in development.
+
+    Raises:
+        FileNotFoundError: If there is no document and `runtime_fallback` is
+            disabled.
+    """
+    document = OpenApiDocument.load(Path(schema_path)) \
+        if schema_path else None
+    if document is None:
+        if not runtime_fallback:
+            raise FileNotFoundError(
+                f'OpenAPI document not found: {schema_path!r}')
+        logger.info('OpenAPI document is generated at runtime.')
+
+    def get_document() -> OpenApiDocument:
+        nonlocal document
+        if document is None:
+            document = OpenApiDocument.from_schema(
+                build_openapi_schema(app_name))
+        return document
+
+    @app_.get(OPENAPI_URL, include_in_schema=False)
+    async def openapi(request: Request) -> Response:
+        return get_document().response(
+            request.headers.get('accept-encoding'),
+            request.headers.get('if-none-match'),
+        )
+
+    @app_.get(DOCS_URL, include_in_schema=False)
+    async def swagger_ui_html() -> HTMLResponse:
+        return get_swagger_ui_html(
+            openapi_url=OPENAPI_URL,
+            title=f'{app_.title} - Swagger UI',
+            oauth2_redirect_url=f'{DOCS_URL}/oauth2-redirect',
+            swagger_ui_parameters=app_.swagger_ui_parameters,
+        )
+
+    @app_.get(f'{DOCS_URL}/oauth2-redirect', include_in_schema=False)
+    async def swagger_ui_redirect() -> HTMLResponse:
+        return get_swagger_ui_oauth2_redirect_html()
+
+    @app_.get(REDOC_URL, include_in_schema=False)
+    async def redoc_html() -> HTMLResponse:
+        return get_redoc_html(
+            openapi_url=OPENAPI_URL, title=f'{app_.title} - ReDoc')
+
+    def app_openapi() -> dict[str, Any]:
+        schema: dict[str, Any] = json.loads(get_document().body)
+        return schema
+
+    app_.openapi = app_openapi  # type: ignore
@@ -1,6 +1,12 @@
 """Path constants."""
 API_BASE_PATH = '/api'
 HEALTH_CHECK_ENDPOINT = '/health-check'
+METRICS_ENDPOINT = '/metrics'
+JWKS_URL = '/.well-known/jwks.json'
+
+OPENAPI_URL = '/openapi.json'
+DOCS_URL = '/docs'
+REDOC_URL = '/redoc'
 
 V1_PREFIX = '/v1'
 API_V1_PATH = f'{API_BASE_PATH}{V1_PREFIX}'
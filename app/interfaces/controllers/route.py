@@ -0,0 +1,57 @@
+"""Route class of the API controllers."""
+from typing import Any, Callable, Coroutine
+
+import msgpack
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+from starlette.types import Receive, Scope
+
+from app.interfaces.views.negotiated_response import JSON_MEDIA_TYPE, \
+    is_msgpack, negotiate_media_type, negotiated_media_type
+
+
+class MsgPackRequest(Request):
+    """Request with a MessagePack body.
+
+    FastAPI only parses bodies declared as JSON, so the body is declared as
+    JSON and `json()` unpacks MessagePack instead.
+    """
+
+    def __init__(self, scope: Scope, receive: Receive) -> None:
+        headers = [
+            (key, value) for key, value in scope['headers']
+            if key != b'content-type'
+        ]
+        headers.append((b'content-type', JSON_MEDIA_TYPE.encode()))
+        super().__init__({**scope, 'headers': headers}, receive)
+
+    async def json(self) -> Any:
+        if not hasattr(self, '_json'):
+            # pylint: disable=attribute-defined-outside-init
+            self._json = msgpack.unpackb(await self.body())
+        return self._json
+
+
+class NegotiatedRoute(APIRoute):
+    """Route that speaks JSON and MessagePack.
+
+    Request bodies sent with `Content-Type: application/msgpack` are
+    validated against the same models as JSON ones, and the media type
+    negotiated from `Accept` is used by `NegotiatedResponse`.
+    """
+
+    def get_route_handler(
+            self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        handler = super().get_route_handler()
+
+        async def route_handler(request: Request) -> Response:
+            if is_msgpack(request.headers.get('content-type')):
+                request = MsgPackRequest(request.scope, request.receive)
+            token = negotiated_media_type.set(
+                negotiate_media_type(request.headers.get('accept')))
+            try:
+                return await handler(request)
+            finally:
+                negotiated_media_type.reset(token)
+
+        return route_handler
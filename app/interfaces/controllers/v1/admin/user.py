@@ -8,29 +8,41 @@ from fastapi_pagination.ext.sqlalchemy import paginate
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.application.dto.user import UserApiListQueryDto, UserReadDto, \
-    UserCreate
-from app.application.use_cases.user.common import user_list_transformer
+    UserCreate, UserIncludeQueryDto, UserReadDtoWithRelated, \
+    UserReadDtoWithPermissions
+from app.application.queries.list_query_guard import ListQueryGuard
+from app.application.use_cases.user.common import user_list_transformer_for
 from app.application.use_cases.user.create import UserCreateUseCase
+from app.application.use_cases.user.get_by_uuid import \
+    UserWithRelatedGetByUUIDUseCase
 from app.application.use_cases.user.list import UserListUseCase
 from app.domain.repositories.user import UserQueryFactory, UserByUUIDRepository
 from app.domain.services.auth.base import UserAuthService
+from app.domain.services.query_cost import QueryCostEstimator
 from app.domain.value_objects.role_permision import PermissionName
+from app.interfaces.controllers.route import NegotiatedRoute
 from app.interfaces.middlewares.auth_middleware import get_user_uuid
 from app.interfaces.middlewares.permission_checker import PermissionChecker, \
     permission_required
 from app.interfaces.views.json_response import ErrorJsonResponse
+from app.interfaces.views.negotiated_response import ModelResponse
 
 router = APIRouter(
     prefix='/admin/users',
     tags=['admin-users'],
+    route_class=NegotiatedRoute,
 )
 
 
-@router.get('/', responses={400: {'model': ErrorJsonResponse}})
+# pylint: disable=too-many-arguments,too-many-positional-arguments
+@router.get('/', response_model=Page[UserReadDtoWithPermissions]
+            | Page[UserReadDtoWithRelated] | Page[UserReadDto],
+            responses={400: {'model': ErrorJsonResponse}})
 @inject
 @permission_required([PermissionName.ADMIN_READ])
 async def users(
         query: UserApiListQueryDto = Depends(),
+        include: UserIncludeQueryDto = Depends(),
         params: Params = Depends(),
         session_factory: Callable[[], AsyncSession] = Depends(
             Provide['db_session_factory']),
@@ -39,13 +51,21 @@ async def users(
         _user_uuid: str = Depends(get_user_uuid),
         _permission_checker: PermissionChecker = Depends(
             Provide['permission_checker']),
-) -> Page[UserReadDto]:
+        list_query_guard: ListQueryGuard = Depends(
+            Provide['list_query_guard']),
+        cost_estimator_factory: Callable[
+            [AsyncSession], QueryCostEstimator] = Depends(
+            Provide['query_cost_estimator_factory']),
+) -> ModelResponse:
     """
     Retrieves a paginated list of users based on the query parameters provided.
 
     Args:
         query (UserApiListQueryDto): The query data transfer object for
             filtering users.
+        include (UserIncludeQueryDto): Related entities to read with the
+            users. They are loaded with one extra query per relationship,
+            whatever the page size.
         params (Params): Pagination parameters such as page size and number.
         session_factory (Callable[[], AsyncSession]): A factory function to
             create an asynchronous SQLAlchemy session.
@@ -55,22 +75,84 @@ async def users(
         _permission_checker (PermissionChecker): A dependency for checking
             permissions. This is injected automatically by FastAPI's
             dependency injection system.
+        list_query_guard (ListQueryGuard): Cost guard for the query and
+            pagination.
+        cost_estimator_factory (Callable[[AsyncSession], QueryCostEstimator]):
+            Factory to create the planner cost estimator for a session.
 
     Returns:
-        Page[UserReadDto]: A paginated list of users represented as
-            UserReadDto instances.
+        ModelResponse: A paginated list of users represented as
+            UserReadDto instances, or their variants with the included
+            related entities, validated once and serialized directly.
     """
-    use_case = UserListUseCase(user_query_factory)
-    stmt = use_case(query)
+    use_case = UserListUseCase(user_query_factory, list_query_guard)
+    stmt = use_case(query, page=params.page, size=params.size,
+                    includes=include.includes)
 
     async with session_factory() as db_session:
         async with db_session.begin():
-            return await paginate(  # type: ignore
+            await list_query_guard.check_cost(
+                stmt, cost_estimator_factory(db_session))
+            page = await paginate(
                 db_session,
                 stmt,
-                transformer=user_list_transformer,
+                transformer=user_list_transformer_for(include.includes),
                 params=params,
             )
+    return ModelResponse(page)
+
+
+# pylint: disable=too-many-arguments,too-many-positional-arguments
+@router.get('/{user_uuid}',
+            responses={404: {'model': ErrorJsonResponse}})
+@inject
+@permission_required([PermissionName.ADMIN_READ])
+async def user_by_uuid(
+        user_uuid: str,
+        include: UserIncludeQueryDto = Depends(),
+        session_factory: Callable[[], AsyncSession] = Depends(
+            Provide['db_session_factory']),
+        repository_factory: Callable[
+            [AsyncSession], UserByUUIDRepository] = Depends(
+            Provide['user_by_uuid_repository']),
+        user_query_factory: UserQueryFactory = Depends(
+            Provide['user_query_factory']),
+        _user_uuid: str = Depends(get_user_uuid),
+        _permission_checker: PermissionChecker = Depends(
+            Provide['permission_checker']),
+) -> UserReadDtoWithPermissions | UserReadDtoWithRelated | UserReadDto:
+    """
+    Fetch a specific user by its UUID.
+
+    Args:
+        user_uuid (str): The UUID of the user to fetch.
+        include (UserIncludeQueryDto): Related entities to read with the
+            user.
+        session_factory (Callable[[], AsyncSession]): Factory function to
+            create an async SQLAlchemy session.
+        repository_factory (Callable[[AsyncSession], UserByUUIDRepository]):
+            Factory to obtain the user repository.
+        user_query_factory (UserQueryFactory): Factory for the loader
+            options of the included related entities.
+        _user_uuid (str): The UUID of the user making the request.
+        _permission_checker (PermissionChecker): A dependency for checking
+            permissions. This is injected automatically by FastAPI's
+            dependency injection system.
+
+    Returns:
+        UserReadDtoWithPermissions | UserReadDtoWithRelated | UserReadDto:
+            The user data, with the included related entities.
+    """
+    async with session_factory() as db_session:
+        async with db_session.begin():
+            repository = repository_factory(db_session)
+
+            use_case = UserWithRelatedGetByUUIDUseCase(repository)
+            return await use_case(
+                user_uuid, include, None,
+                load_options=user_query_factory.load_options(
+                    include.includes),
+            )
 
 
 @router.post('/', status_code=201,
@@ -11,3 +11,6 @@ PUBLIC_PATH = '/public'
 
 SAMPLE_ITEMS_PREFIX = '/sample-items'
 SAMPLE_ITEMS_BY_UUID_PREFIX = '/sample-items-by-uuid'
+SAMPLE_ITEMS_SEARCH_PREFIX = '/sample-items-search'
+SAMPLE_ITEMS_SYNC_PREFIX = '/sample-items-sync'
+BATCH_GET_ENDPOINT = '/batch-get'
@@ -1,17 +1,27 @@
 """SampleItem controller."""
-from typing import Callable
+from typing import Any, Callable, cast
 
 from dependency_injector.wiring import inject, Provide
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header, Response
 from fastapi_pagination import Page, Params
-from fastapi_pagination.ext.sqlalchemy import paginate
+from fastapi_pagination.api import create_page
+from fastapi_pagination.ext.sqlalchemy import create_count_query, \
+    create_paginate_query
+from sqlalchemy import Select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.application.dto.sample_item import SampleItemUpdateDto, \
     SampleItemCreate, SampleItemReadDto, SampleItemReadDtoWithMeta, \
-    SampleItemGetQuery, SampleItemApiListQueryDto
+    SampleItemGetQuery, SampleItemApiListQueryDto, SampleItemBatchDto, \
+    SampleItemBatchGetByIdDto
+from app.application.exc import NotModified
+from app.application.queries.list_query_guard import ListQueryGuard
+from app.application.use_cases.base import ETagPageTransformer
+from app.application.use_cases.sample_item.batch_get import \
+    SampleItemGetManyByIdsUseCase
 from app.application.use_cases.sample_item.common import \
-    sample_item_list_transformer, sample_item_with_meta_list_transformer
+    SAMPLE_ITEMS_CACHE_TAG, sample_item_list_transformer, \
+    sample_item_with_meta_list_transformer, sample_item_batch_to_read
 from app.application.use_cases.sample_item.create import \
     SampleItemCreateUseCase
 from app.application.use_cases.sample_item.get import SampleItemGetByIdUseCase
@@ -23,70 +33,138 @@ from app.application.use_cases.sample_item.physical_delete import \
     SampleItemPhysicalDeleteUseCase
 from app.application.use_cases.sample_item.update import \
     SampleItemUpdateUseCase
+from app.domain.entities.sample_item import SampleItem
 from app.domain.repositories.sample_item import SampleItemRepository, \
     SampleItemQueryFactory
-from app.interfaces.controllers.v1.path import SAMPLE_ITEMS_PREFIX, PUBLIC_PATH
+from app.domain.services.cache import TaggedCache
+from app.domain.services.etag import etag_matches
+from app.domain.services.query_cost import QueryCostEstimator
+from app.interfaces.controllers.route import NegotiatedRoute
+from app.interfaces.controllers.v1.path import SAMPLE_ITEMS_PREFIX, \
+    PUBLIC_PATH, BATCH_GET_ENDPOINT
 from app.interfaces.views.json_response import ErrorJsonResponse
+from app.interfaces.views.negotiated_response import ModelResponse
 
 router = APIRouter(
     prefix=f'{PUBLIC_PATH}',
     tags=['sample-items'],
+    route_class=NegotiatedRoute,
 )
 
 
+# pylint: disable=too-many-arguments,too-many-positional-arguments
+# pylint: disable=too-many-locals
 @router.get(f'{SAMPLE_ITEMS_PREFIX}',
+            response_model=Page[SampleItemReadDtoWithMeta]
+            | Page[SampleItemReadDto],
             responses={400: {'model': ErrorJsonResponse}})
 @inject
 async def sample_item(
         with_meta: bool = False,
         query: SampleItemApiListQueryDto = Depends(),
         params: Params = Depends(),
+        if_none_match: str | None = Header(default=None),
         session_factory: Callable[[], AsyncSession] = Depends(
             Provide['db_session_factory']),
         sample_item_query_factory: SampleItemQueryFactory = Depends(
             Provide['sample_item_query_factory']),
-) -> Page[SampleItemReadDtoWithMeta] | Page[SampleItemReadDto]:
+        list_cache: TaggedCache = Depends(
+            Provide['sample_item_list_cache']),
+        list_query_guard: ListQueryGuard = Depends(
+            Provide['list_query_guard']),
+        cost_estimator_factory: Callable[
+            [AsyncSession], QueryCostEstimator] = Depends(
+            Provide['query_cost_estimator_factory']),
+) -> ModelResponse:
     """
     Retrieve a paginated list of SampleItem entities.
 
     This GET endpoint returns a paginated list of SampleItem entities,
-    optionally including metadata.
+    optionally including metadata. Pages are served from `list_cache` until
+    they expire or a write to SampleItem entities invalidates them.
+
+    Every page carries an ETag derived from its ids, latest `updated_at`
+    and total. A matching `If-None-Match` is answered with 304 before the
+    rows are converted to DTOs, on a cache miss as on a hit. The DTOs are
+    validated once by the transformer and serialized straight to the
+    response body.
+
+    This endpoint is public, so `list_query_guard` rejects expensive
+    filters and pagination with 400 before a connection is taken, and checks
+    the planner's estimate on a cache miss before the page query runs.
 
     Args:
         with_meta (bool): Whether to include metadata in the response.
         query (SampleItemApiListQueryDto): Query parameters for filtering and
             sorting the SampleItem entities. Injected as a dependency.
         params (Params): Pagination parameters. Injected as a dependency.
+        if_none_match (str | None): ETags of the representations the client
+            already holds.
         session_factory (Callable[[], AsyncSession]): Factory to create
             database sessions. Injected as a dependency.
         sample_item_query_factory (SampleItemQueryFactory): Factory to
             create SampleItemQuery instances. Injected as a dependency.
+        list_cache (TaggedCache): Cache of list pages keyed by the
+            normalized query, pagination and `with_meta`. Injected as a
+            dependency.
+        list_query_guard (ListQueryGuard): Cost guard for the query and
+            pagination. Injected as a dependency.
+        cost_estimator_factory (Callable[[AsyncSession], QueryCostEstimator]):
+            Factory to create the planner cost estimator for a session.
+            Injected as a dependency.
 
     Returns:
-        Page[SampleItem] | Page[SampleItemReadDtoWithMeta]: A paginated list of
-            SampleItem entities, with or without metadata.
+        ModelResponse: A paginated list of SampleItem entities, with or
+            without metadata, and its ETag header.
     """
-    use_case = SampleItemListUseCase(sample_item_query_factory)
-    stmt = use_case(query)
-
-    transformer = sample_item_with_meta_list_transformer \
-        if with_meta else sample_item_list_transformer
-
-    async with session_factory() as db_session:
-        async with db_session.begin():
-            return await paginate(  # type: ignore
-                db_session,
-                stmt,
-                transformer=transformer,
-                params=params,
-            )
+    use_case = SampleItemListUseCase(
+        sample_item_query_factory, list_query_guard)
+    stmt = use_case(query, page=params.page, size=params.size)
+    page_stmt: Select[Any] = sample_item_query_factory.with_meta(stmt) \
+        if with_meta else stmt
+
+    cache_key = query.cache_key(
+        page=params.page, size=params.size, with_meta=with_meta)
+
+    async def load_page() -> tuple[str, Page[SampleItemReadDto]]:
+        async with session_factory() as db_session:
+            async with db_session.begin():
+                await list_query_guard.check_cost(
+                    page_stmt, cost_estimator_factory(db_session))
+                # Counted before the page query, so that the transformer
+                # answers a matching `If-None-Match` before building DTOs.
+                total = await db_session.scalar(
+                    create_count_query(page_stmt))
+                result = await db_session.execute(
+                    create_paginate_query(page_stmt, params))
+                rows = result.all() if with_meta else result.scalars().all()
+                transformer: ETagPageTransformer[SampleItem] = \
+                    ETagPageTransformer(
+                        sample_item_with_meta_list_transformer
+                        if with_meta else sample_item_list_transformer,
+                        total, params.page, params.size,
+                        variant=cache_key, if_none_match=if_none_match,
+                    )
+                items = transformer(rows)
+        page = create_page(items, total=total, params=params)
+        return cast(str, transformer.etag), \
+            cast(Page[SampleItemReadDto], page)
+
+    etag, page = await list_cache.get_or_load(
+        cache_key, [SAMPLE_ITEMS_CACHE_TAG], load_page)
+    if etag_matches(if_none_match, etag):
+        raise NotModified('Page has not been modified.', etag)
+
+    return ModelResponse(page, headers={'ETag': etag})
 
 
 @router.get(f'{SAMPLE_ITEMS_PREFIX}/{{entity_id}}')
 @inject
 async def sample_item_by_id(
         entity_id: int,
+        response: Response,
         query: SampleItemGetQuery = Depends(),
+        if_none_match: str | None = Header(default=None),
         session_factory: Callable[[], AsyncSession] = Depends(
             Provide['db_session_factory']),
         repository_factory: Callable[
@@ -95,11 +173,17 @@ async def sample_item_by_id(
 ) -> SampleItemReadDtoWithMeta | SampleItemReadDto:
     """
     Fetch a specific SampleItem entity by its ID.
+
+    The response carries a strong ETag derived from the entity's `id` and
+    `updated_at`; a matching `If-None-Match` is answered with 304.
     
     Args:
         entity_id (int): The ID of the SampleItem to retrieve.
+        response (Response): The response used to set the ETag header.
         query (SampleItemGetQuery): Query parameters for the SampleItem
             entity. Injected as a dependency.
+        if_none_match (str | None): ETags of the representations the client
+            already holds.
         session_factory (Callable[[], AsyncSession]): Factory to create
             database sessions. Injected as a dependency.
         repository_factory (Callable[[AsyncSession], SampleItemRepository]):
@@ -116,9 +200,54 @@ async def sample_item_by_id(
             repository = repository_factory(db_session)
 
             use_case = SampleItemGetByIdUseCase(repository)
-            read_data = await use_case(entity_id, query, None)
+            read_data = await use_case(
+                entity_id, query, None, if_none_match=if_none_match)
+
+    response.headers['ETag'] = cast(str, use_case.etag)
+    return read_data
+
+
+@router.post(f'{SAMPLE_ITEMS_PREFIX}{BATCH_GET_ENDPOINT}',
+             response_model=SampleItemBatchDto)
+@inject
+async def sample_items_by_ids(
+        data: SampleItemBatchGetByIdDto,
+        query: SampleItemGetQuery = Depends(),
+        session_factory: Callable[[], AsyncSession] = Depends(
+            Provide['db_session_factory']),
+        repository_factory: Callable[
+            [AsyncSession], SampleItemRepository] = Depends(
+            Provide['sample_item_repository'])
+) -> ModelResponse:
+    """
+    Fetch many SampleItem entities by their IDs in a single query.
+
+    Results come back in the order of the requested IDs, with
+    `found: false` and no `item` for those without an entity. Logically
+    deleted entities are not found.
+
+    Args:
+        data (SampleItemBatchGetByIdDto): The requested IDs.
+        query (SampleItemGetQuery): Query parameters for the SampleItem
+            entities. Injected as a dependency.
+        session_factory (Callable[[], AsyncSession]): Factory to create
+            database sessions. Injected as a dependency.
+        repository_factory
+            (Callable[[AsyncSession], SampleItemRepository]):
+            Factory to create a SampleItemRepository instance. Injected as a
+            dependency.
+
+    Returns:
+        ModelResponse: A SampleItemBatchDto, optionally including metadata.
+    """
+    async with session_factory() as db_session:
+        async with db_session.begin():
+            repository = repository_factory(db_session)
+
+            use_case = SampleItemGetManyByIdsUseCase(repository)
+            results = await use_case(data.ids, query)
 
-            return read_data
+    return ModelResponse(sample_item_batch_to_read(data.ids, results))
 
 
 @router.post(f'{SAMPLE_ITEMS_PREFIX}', response_model=SampleItemReadDto,
@@ -130,7 +259,9 @@ async def create_sample_item(
             Provide['db_session_factory']),
         repository_factory: Callable[
             [AsyncSession], SampleItemRepository] = Depends(
-            Provide['sample_item_repository'])
+            Provide['sample_item_repository']),
+        list_cache: TaggedCache = Depends(
+            Provide['sample_item_list_cache']),
 ) -> SampleItemReadDto:
     """
     Create a new SampleItem entity.
@@ -147,6 +278,8 @@ async def create_sample_item(
         repository_factory (Callable[[AsyncSession], SampleItemRepository]):
             A callable that initializes a SampleItemRepository instance
             using the provided database session. Injected as a dependency.
+        list_cache (TaggedCache): Cache of list pages, invalidated by the
+            use case once the transaction commits. Injected as a dependency.
 
     Returns:
         SampleItemReadDto: The created SampleItem entity serialized into a
@@ -156,10 +289,10 @@ async def create_sample_item(
         async with db_session.begin():
             repository = repository_factory(db_session)
 
-            use_case = SampleItemCreateUseCase(repository)
+            use_case = SampleItemCreateUseCase(repository, list_cache)
             read_data = await use_case(data, None)
 
-            return read_data
+    return read_data
 
 
 @router.put(f'{SAMPLE_ITEMS_PREFIX}/{{entity_id}}',
@@ -172,7 +305,9 @@ async def update_sample_item(
             Provide['db_session_factory']),
         repository_factory: Callable[
             [AsyncSession], SampleItemRepository] = Depends(
-            Provide['sample_item_repository'])
+            Provide['sample_item_repository']),
+        list_cache: TaggedCache = Depends(
+            Provide['sample_item_list_cache']),
 ) -> SampleItemReadDto:
     """
     Update an existing SampleItem entity by its ID.
@@ -191,6 +326,8 @@ async def update_sample_item(
         repository_factory (Callable[[AsyncSession], SampleItemRepository]):
             A callable that initializes a SampleItemRepository instance
             using the provided database session. Injected as a dependency.
+        list_cache (TaggedCache): Cache of list pages, invalidated by the
+            use case once the transaction commits. Injected as a dependency.
 
     Returns:
         SampleItemReadDto: The updated SampleItem entity serialized into
@@ -199,12 +336,10 @@ async def update_sample_item(
     async with session_factory() as db_session:
         async with db_session.begin():
             repository = repository_factory(db_session)
-            use_case = SampleItemUpdateUseCase(
-                repository
-            )
+            use_case = SampleItemUpdateUseCase(repository, list_cache)
             read_data = await use_case(entity_id, data, None)
 
-            return read_data
+    return read_data
 
 
 @router.delete(f'{SAMPLE_ITEMS_PREFIX}/{{entity_id}}', status_code=204, )
@@ -215,7 +350,9 @@ async def logical_delete_sample_item(
             Provide['db_session_factory']),
         repository_factory: Callable[
             [AsyncSession], SampleItemRepository] = Depends(
-            Provide['sample_item_repository'])
+            Provide['sample_item_repository']),
+        list_cache: TaggedCache = Depends(
+            Provide['sample_item_list_cache']),
 ) -> None:
     """
     Logically delete a specific SampleItem entity by its ID.
@@ -233,6 +370,8 @@ async def logical_delete_sample_item(
         repository_factory (Callable[[AsyncSession], SampleItemRepository]):
             A callable that initializes a SampleItemRepository instance
             using the provided database session. Injected as a dependency.
+        list_cache (TaggedCache): Cache of list pages, invalidated by the
+            use case once the transaction commits. Injected as a dependency.
 
     Returns:
         None: No content is returned from this endpoint.
@@ -241,7 +380,7 @@ async def logical_delete_sample_item(
         async with db_session.begin():
             repository = repository_factory(db_session)
             await SampleItemLogicalDeleteUseCase(
-                repository
+                repository, list_cache
             )(entity_id)
 
 
@@ -254,7 +393,9 @@ async def physical_delete_sample_item(
             Provide['db_session_factory']),
         repository_factory: Callable[
             [AsyncSession], SampleItemRepository] = Depends(
-            Provide['sample_item_repository'])
+            Provide['sample_item_repository']),
+        list_cache: TaggedCache = Depends(
+            Provide['sample_item_list_cache']),
 ) -> None:
     """
     Physically delete a specific SampleItem entity by its ID.
@@ -283,6 +424,8 @@ async def physical_delete_sample_item(
         repository_factory (Callable[[AsyncSession], SampleItemRepository]):
             A callable that initializes a SampleItemRepository instance
             using the provided database session. Injected as a dependency.
+        list_cache (TaggedCache): Cache of list pages, invalidated by the
+            use case once the transaction commits. Injected as a dependency.
 
     Returns:
         None: No content is returned from this endpoint.
@@ -291,5 +434,5 @@ async def physical_delete_sample_item(
         async with db_session.begin():
             repository = repository_factory(db_session)
             await SampleItemPhysicalDeleteUseCase(
-                repository
+                repository, list_cache
             )(entity_id)
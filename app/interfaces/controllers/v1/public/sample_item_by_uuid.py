@@ -1,29 +1,40 @@
 """SampleItem by UUID controller"""
-from typing import Callable
+from typing import Callable, cast
 
 from dependency_injector.wiring import inject, Provide
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.application.dto.sample_item import SampleItemGetQuery, \
-    SampleItemReadDtoWithMeta, SampleItemReadDto
+    SampleItemReadDtoWithMeta, SampleItemReadDto, SampleItemBatchDto, \
+    SampleItemBatchGetByUUIDDto
+from app.application.use_cases.sample_item.by_uuid.batch_get import \
+    SampleItemGetManyByUUIDsUseCase
 from app.application.use_cases.sample_item.by_uuid.get import \
     SampleItemGetByUUIDUseCase
+from app.application.use_cases.sample_item.common import \
+    sample_item_batch_to_read
 from app.domain.repositories.sample_item import SampleItemByUUIDRepository
+from app.interfaces.controllers.route import NegotiatedRoute
 from app.interfaces.controllers.v1.path import SAMPLE_ITEMS_BY_UUID_PREFIX, \
-    PUBLIC_PATH
+    PUBLIC_PATH, BATCH_GET_ENDPOINT
+from app.interfaces.views.negotiated_response import ModelResponse
 
 router = APIRouter(
     prefix=f'{PUBLIC_PATH}{SAMPLE_ITEMS_BY_UUID_PREFIX}',
     tags=['sample-items-by-uuid'],
+    route_class=NegotiatedRoute,
 )
 
 
+# pylint: disable=too-many-arguments,too-many-positional-arguments
 @router.get('/{entity_id}')
 @inject
 async def sample_item_by_uuid(
         entity_id: str,
+        response: Response,
         query: SampleItemGetQuery = Depends(),
+        if_none_match: str | None = Header(default=None),
         session_factory: Callable[[], AsyncSession] = Depends(
             Provide['db_session_factory']),
         repository_factory: Callable[
@@ -32,11 +43,17 @@ async def sample_item_by_uuid(
 ) -> SampleItemReadDtoWithMeta | SampleItemReadDto:
     """
     Fetch a specific SampleItem entity by its UUID.
+
+    The response carries a strong ETag derived from the entity's `id` and
+    `updated_at`; a matching `If-None-Match` is answered with 304.
     
     Args:
         entity_id (str): The UUID of the SampleItem entity to fetch.
+        response (Response): The response used to set the ETag header.
         query (SampleItemGetQuery): Query parameters for retrieving the item,
             provided by FastAPI's dependency injection.
+        if_none_match (str | None): ETags of the representations the client
+            already holds.
         session_factory (Callable[[], AsyncSession]): A factory function to
             create a new database session, injected via DI.
         repository_factory
@@ -54,6 +71,50 @@ async def sample_item_by_uuid(
             repository = repository_factory(db_session)
 
             use_case = SampleItemGetByUUIDUseCase(repository)
-            read_data = await use_case(entity_id, query, None)
+            read_data = await use_case(
+                entity_id, query, None, if_none_match=if_none_match)
+
+    response.headers['ETag'] = cast(str, use_case.etag)
+    return read_data
+
+
+@router.post(BATCH_GET_ENDPOINT, response_model=SampleItemBatchDto)
+@inject
+async def sample_items_by_uuids(
+        data: SampleItemBatchGetByUUIDDto,
+        query: SampleItemGetQuery = Depends(),
+        session_factory: Callable[[], AsyncSession] = Depends(
+            Provide['db_session_factory']),
+        repository_factory: Callable[
+            [AsyncSession], SampleItemByUUIDRepository] = Depends(
+            Provide['sample_item_by_uuid_repository'])
+) -> ModelResponse:
+    """
+    Fetch many SampleItem entities by their UUIDs in a single query.
+
+    Results come back in the order of the requested UUIDs, with
+    `found: false` and no `item` for those without an entity. Logically
+    deleted entities are not found.
+
+    Args:
+        data (SampleItemBatchGetByUUIDDto): The requested UUIDs.
+        query (SampleItemGetQuery): Query parameters for the SampleItem
+            entities. Injected as a dependency.
+        session_factory (Callable[[], AsyncSession]): Factory to create
+            database sessions. Injected as a dependency.
+        repository_factory
+            (Callable[[AsyncSession], SampleItemByUUIDRepository]):
+            Factory to create a SampleItemByUUIDRepository instance.
+            Injected as a dependency.
+
+    Returns:
+        ModelResponse: A SampleItemBatchDto, optionally including metadata.
+    """
+    async with session_factory() as db_session:
+        async with db_session.begin():
+            repository = repository_factory(db_session)
+
+            use_case = SampleItemGetManyByUUIDsUseCase(repository)
+            results = await use_case(data.ids, query)
 
-            return read_data
+    return ModelResponse(sample_item_batch_to_read(data.ids, results))
@@ -0,0 +1,93 @@
+"""SampleItem search controller."""
+from typing import Any, Callable
+
+from dependency_injector.wiring import inject, Provide
+from fastapi import APIRouter, Depends
+from fastapi_pagination import Page, Params
+from fastapi_pagination.ext.sqlalchemy import paginate
+from sqlalchemy import Select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.application.dto.sample_item import SampleItemReadDto, \
+    SampleItemReadDtoWithMeta, SampleItemSearchQuery
+from app.application.queries.list_query_guard import ListQueryGuard
+from app.application.use_cases.sample_item.common import \
+    sample_item_list_transformer, sample_item_with_meta_list_transformer
+from app.application.use_cases.sample_item.search import \
+    SampleItemSearchUseCase
+from app.domain.repositories.sample_item import SampleItemQueryFactory
+from app.domain.services.query_cost import QueryCostEstimator
+from app.interfaces.controllers.route import NegotiatedRoute
+from app.interfaces.controllers.v1.path import SAMPLE_ITEMS_SEARCH_PREFIX, \
+    PUBLIC_PATH
+from app.interfaces.views.json_response import ErrorJsonResponse
+from app.interfaces.views.negotiated_response import ModelResponse
+
+router = APIRouter(
+    prefix=f'{PUBLIC_PATH}{SAMPLE_ITEMS_SEARCH_PREFIX}',
+    tags=['sample-items'],
+    route_class=NegotiatedRoute,
+)
+
+
+# pylint: disable=too-many-arguments,too-many-positional-arguments
+@router.get('',
+            response_model=Page[SampleItemReadDtoWithMeta]
+            | Page[SampleItemReadDto],
+            responses={400: {'model': ErrorJsonResponse}})
+@inject
+async def search_sample_items(
+        query: SampleItemSearchQuery = Depends(),
+        params: Params = Depends(),
+        session_factory: Callable[[], AsyncSession] = Depends(
+            Provide['db_session_factory']),
+        sample_item_query_factory: SampleItemQueryFactory = Depends(
+            Provide['sample_item_query_factory']),
+        list_query_guard: ListQueryGuard = Depends(
+            Provide['list_query_guard']),
+        cost_estimator_factory: Callable[
+            [AsyncSession], QueryCostEstimator] = Depends(
+            Provide['query_cost_estimator_factory']),
+) -> ModelResponse:
+    """
+    Full-text search over SampleItem names and descriptions.
+
+    Matches are ranked with `ts_rank`, name matches above description
+    matches, and logically deleted entities are never returned.
+
+    Args:
+        query (SampleItemSearchQuery): The search text and whether to include
+            metadata. Injected as a dependency.
+        params (Params): Pagination parameters. Injected as a dependency.
+        session_factory (Callable[[], AsyncSession]): Factory to create
+            database sessions. Injected as a dependency.
+        sample_item_query_factory (SampleItemQueryFactory): Factory to
+            create SampleItem queries. Injected as a dependency.
+        list_query_guard (ListQueryGuard): Cost guard for the pagination.
+            Injected as a dependency.
+        cost_estimator_factory (Callable[[AsyncSession], QueryCostEstimator]):
+            Factory to create the planner cost estimator for a session.
+            Injected as a dependency.
+
+    Returns:
+        ModelResponse: A page of matching SampleItem entities, best
+            matches first.
+    """
+    use_case = SampleItemSearchUseCase(
+        sample_item_query_factory, list_query_guard)
+    stmt = use_case(query, page=params.page, size=params.size)
+    page_stmt: Select[Any] = sample_item_query_factory.with_meta(stmt) \
+        if query.with_meta else stmt
+
+    async with session_factory() as db_session:
+        async with db_session.begin():
+            await list_query_guard.check_cost(
+                page_stmt, cost_estimator_factory(db_session))
+            page = await paginate(
+                db_session,
+                page_stmt,
+                transformer=sample_item_with_meta_list_transformer
+                if query.with_meta else sample_item_list_transformer,
+                params=params,
+            )
+    return ModelResponse(page)
@@ -0,0 +1,63 @@
+"""SampleItem delta sync controller."""
+from datetime import timedelta
+from typing import Callable
+
+from dependency_injector.wiring import inject, Provide
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.application.dto.sample_item import SampleItemSyncDto, \
+    SampleItemSyncQuery
+from app.application.use_cases.sample_item.sync import SampleItemSyncUseCase
+from app.domain.repositories.sample_item import SampleItemRepository
+from app.interfaces.controllers.route import NegotiatedRoute
+from app.interfaces.controllers.v1.path import SAMPLE_ITEMS_SYNC_PREFIX, \
+    PUBLIC_PATH
+from app.interfaces.views.json_response import ErrorJsonResponse
+
+router = APIRouter(
+    prefix=f'{PUBLIC_PATH}{SAMPLE_ITEMS_SYNC_PREFIX}',
+    tags=['sample-items'],
+    route_class=NegotiatedRoute,
+)
+
+
+@router.get('', responses={400: {'model': ErrorJsonResponse}})
+@inject
+async def sync_sample_items(
+        query: SampleItemSyncQuery = Depends(),
+        session_factory: Callable[[], AsyncSession] = Depends(
+            Provide['db_session_factory']),
+        repository_factory: Callable[
+            [AsyncSession], SampleItemRepository] = Depends(
+            Provide['sample_item_repository']),
+        overlap: timedelta = Depends(Provide['sync_watermark_overlap']),
+) -> SampleItemSyncDto:
+    """
+    Fetch the SampleItem changes after a watermark.
+
+    Returns the created or updated entities and the tombstones of logically
+    deleted ones, oldest change first, with a new watermark. Clients call it
+    again with `since=<watermark>` right away while `has_more` is true, and
+    periodically after that. Physically deleted entities are not reported.
+
+    Args:
+        query (SampleItemSyncQuery): The watermark and page limit. Injected
+            as a dependency.
+        session_factory (Callable[[], AsyncSession]): Factory to create
+            database sessions. Injected as a dependency.
+        repository_factory (Callable[[AsyncSession], SampleItemRepository]):
+            Factory to create a SampleItemRepository instance. Injected as a
+            dependency.
+        overlap (timedelta): How far the caught-up watermark lags the
+            database clock. Injected as a dependency.
+
+    Returns:
+        SampleItemSyncDto: The changes, the new watermark and whether more
+            changes are available.
+    """
+    async with session_factory() as db_session:
+        async with db_session.begin():
+            repository = repository_factory(db_session)
+            use_case = SampleItemSyncUseCase(repository, overlap)
+            return await use_case(query)
@@ -12,7 +12,9 @@ from app.domain.entities.login_session import LoginSession
 from app.domain.repositories.login_session import LoginSessionRepository
 from app.domain.repositories.user import UserByEmailRepository
 from app.domain.services.auth.base import UserAuthService
-from app.domain.services.auth.login_session import LoginSessionService
+from app.domain.services.auth.login_session import LoginSessionCache, \
+    LoginSessionService
+from app.interfaces.controllers.route import NegotiatedRoute
 from app.interfaces.controllers.v1.path import AUTH_SESSION_PREFIX, \
     SESSION_LOGIN_ENDPOINT
 from app.interfaces.middlewares.auth_middleware import get_session
@@ -20,6 +22,7 @@ from app.interfaces.middlewares.auth_middleware import get_session
 router = APIRouter(
     prefix=AUTH_SESSION_PREFIX,
     tags=['auth-session'],
+    route_class=NegotiatedRoute,
 )
 
 
@@ -44,6 +47,8 @@ async def login(
             Provide['login_session_repository_factory']),
         session_cookie_config: SessionCookieConfig = Depends(
             Provide['session_cookie_config']),
+        signed_session_cookie: bool = Depends(
+            Provide['signed_session_cookie']),
 ) -> None:
     """
     Handles user login by validating the provided username and password and
@@ -73,6 +78,8 @@ async def login(
             Factory function for login session repository.
         session_cookie_config (SessionCookieConfig): Configuration for session
             cookies.
+        signed_session_cookie (bool): Whether the cookie carries the signed
+            session rather than its ID.
     
     Returns:
         None: This function does not return a value but sets the session
@@ -86,7 +93,7 @@ async def login(
                 db_session)
             use_case = LoginUseCase(
                 user_auth_service, login_session_service,
-                login_session_repository
+                login_session_repository, signed_session_cookie,
             )
             session_cookie = await use_case(
                 data.username,
@@ -118,6 +125,7 @@ async def verify(
     return session
 
 
+# pylint: disable=too-many-arguments,too-many-positional-arguments
 @router.post('/logout')
 @inject
 async def logout(
@@ -130,13 +138,20 @@ async def logout(
             Provide['login_session_repository_factory']),
         login_session_cookie_name: str = Depends(
             Provide['login_session_cookie_name']
-        )
+        ),
+        login_session_cache: LoginSessionCache = Depends(
+            Provide['login_session_cache']),
+        login_session_service: LoginSessionService = Depends(
+            Provide['login_session_service']),
+        signed_session_cookie: bool = Depends(
+            Provide['signed_session_cookie']),
 ) -> None:
     """
     Handles user logout by clearing the user's session.
 
     This endpoint extracts the session ID from the request's cookies, removes
-    the session from the database, and deletes the session cookie.
+    the session from the database and the session cache, and deletes the
+    session cookie.
 
     Args:
         request (Request): The HTTP request object used to extract the session 
@@ -150,6 +165,11 @@ async def logout(
             Factory function for login session repository.
         login_session_cookie_name (str): Name of the cookie that stores the 
             session ID.
+        login_session_cache (LoginSessionCache): Cache of login sessions.
+        login_session_service (LoginSessionService): Service for login session
+            management.
+        signed_session_cookie (bool): Whether the cookie carries the signed
+            session rather than its ID.
 
     Returns:
         None: This function does not return a value but deletes the user's 
@@ -159,10 +179,15 @@ async def logout(
         async with db_session.begin():
             login_session_repository = login_session_repository_factory(
                 db_session)
-            use_case = LogoutUseCase(login_session_repository)
+            use_case = LogoutUseCase(
+                login_session_repository, login_session_cache)
             session_id = request.cookies.get(
                 login_session_cookie_name,
             )
+            if session_id is not None and signed_session_cookie:
+                session = login_session_service.load_signed_session(
+                    session_id)
+                session_id = session.id if session is not None else None
             await use_case(session_id)
 
         response.delete_cookie(login_session_cookie_name)
@@ -19,6 +19,7 @@ from app.domain.repositories.user import UserByEmailRepository, \
     UserByUUIDRepository
 from app.domain.services.auth.base import UserAuthService
 from app.domain.services.auth.token import Token, JwtTokenService, JwtPayload
+from app.interfaces.controllers.route import NegotiatedRoute
 from app.interfaces.controllers.v1.path import AUTH_TOKEN_PREFIX, \
     TOKEN_ENDPOINT, \
     REFRESH_ENDPOINT, EXPLICIT_TOKEN_ME_ENDPOINT
@@ -28,6 +29,7 @@ from app.interfaces.middlewares.auth_middleware import \
 router = APIRouter(
     prefix=AUTH_TOKEN_PREFIX,
     tags=['auth-token'],
+    route_class=NegotiatedRoute,
 )
 
 
@@ -0,0 +1,37 @@
+"""Well-known URI controllers, outside of the API base path."""
+import hashlib
+
+from dependency_injector.wiring import inject, Provide
+from fastapi import APIRouter, Depends, Header
+from fastapi.responses import Response
+from pydantic_core import to_json
+
+from app.domain.services.etag import etag_matches
+from app.infrastructure.services.token_keys import TokenKeyRing
+from app.interfaces.controllers.path import JWKS_URL
+
+router = APIRouter()
+
+
+@router.get(JWKS_URL, include_in_schema=False)
+@inject
+async def jwks(
+        if_none_match: str | None = Header(default=None),
+        token_key_ring: TokenKeyRing = Depends(Provide['token_key_ring']),
+        max_age_seconds: int = Depends(Provide['jwks_max_age_seconds']),
+) -> Response:
+    """Public keys that verify the access tokens, as a JSON Web Key Set.
+
+    Other services verify the tokens with them instead of calling back into
+    this app. The set is public and cached for `max_age_seconds`, so a new
+    key must be in the set for that long before tokens are signed with it.
+    """
+    body = to_json(token_key_ring.jwks())
+    etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    headers = {
+        'ETag': etag,
+        'Cache-Control': f'public, max-age={max_age_seconds}',
+    }
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type='application/json', headers=headers)
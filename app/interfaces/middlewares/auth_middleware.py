@@ -13,13 +13,14 @@ from app.application.exc import Unauthorized
 from app.domain.entities.login_session import LoginSession
 from app.domain.services.auth.token import JwtPayload
 from app.interfaces.controllers.path import API_BASE_PATH, API_V1_PATH, \
-    HEALTH_CHECK_ENDPOINT
+    DOCS_URL, HEALTH_CHECK_ENDPOINT, JWKS_URL, METRICS_ENDPOINT, OPENAPI_URL, \
+    REDOC_URL
 from app.interfaces.controllers.v1.path import AUTH_TOKEN_PREFIX, \
     REFRESH_ENDPOINT, EXPLICIT_TOKEN_ME_ENDPOINT, AUTH_SESSION_PREFIX, \
     SESSION_LOGIN_ENDPOINT, \
     PUBLIC_PATH
 from app.interfaces.middlewares.authorizer import AccessTokenAuthorizer, \
-    SessionCookieAuthorizer, AuthMethod
+    SessionCookieAuthorizer, AuthMethod, SignedSessionCookieAuthorizer
 from app.interfaces.middlewares.error_handlers import \
     return_error_json_response
 
@@ -32,7 +33,10 @@ class AuthorizationMiddleware(BaseHTTPMiddleware):
     """Authorization Middleware."""
     _verification_excluded_paths: list[str] = [
         # API documentation
-        '/docs', '/redoc', '/openapi.json',
+        DOCS_URL, f'{DOCS_URL}/oauth2-redirect', REDOC_URL, OPENAPI_URL,
+
+        # public keys of the token signing keys
+        JWKS_URL,
 
         # session auth login
         f'{API_V1_PATH}{AUTH_SESSION_PREFIX}{SESSION_LOGIN_ENDPOINT}',
@@ -48,20 +52,28 @@ class AuthorizationMiddleware(BaseHTTPMiddleware):
         # For health check
         f'{API_BASE_PATH}{HEALTH_CHECK_ENDPOINT}',
 
+        # For metrics scraping, blocked for external clients by nginx
+        f'{API_BASE_PATH}{METRICS_ENDPOINT}',
+
         # Add paths to exclude from verification
         f'{API_V1_PATH}{PUBLIC_PATH}/*',
         # '/some/public/paths/*',
     ]
 
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
     def __init__(self,
                  app: ASGIApp,
                  access_token_authorizer: AccessTokenAuthorizer,
                  session_cookie_authorizer: SessionCookieAuthorizer,
+                 signed_session_cookie_authorizer:
+                 SignedSessionCookieAuthorizer,
                  auth_method: AuthMethod,
                  ):
         super().__init__(app)
         self._access_token_authorizer = access_token_authorizer
         self._session_cookie_authorizer = session_cookie_authorizer
+        self._signed_session_cookie_authorizer = \
+            signed_session_cookie_authorizer
         self._auth_method_value = auth_method
 
     async def dispatch(
@@ -79,6 +91,10 @@ class AuthorizationMiddleware(BaseHTTPMiddleware):
             if self._auth_method == AuthMethod.SESSION_COOKIE:
                 request = await self._session_cookie_authorizer.authorize(
                     request)
+            elif self._auth_method == AuthMethod.SIGNED_SESSION_COOKIE:
+                request = \
+                    await self._signed_session_cookie_authorizer.authorize(
+                        request)
             elif self._auth_method == AuthMethod.BEARER_ACCESS_TOKEN:
                 request = await self._access_token_authorizer.authorize(
                     request)
@@ -89,7 +105,7 @@ class AuthorizationMiddleware(BaseHTTPMiddleware):
             return await call_next(request)
         except Unauthorized as exc:
             return return_error_json_response(
-                exc, exc.status_code, exc.detail)
+                exc, exc.status_code, exc.detail, request)
 
     def is_excluded_path(self, path: str) -> bool:
         """excluded path check"""
@@ -1,5 +1,7 @@
 """Access token authorizer."""
+import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from enum import Enum
 from logging import getLogger
 from typing import Callable
@@ -10,8 +12,10 @@ from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.application.exc import Unauthorized
+from app.domain.entities.login_session import LoginSession
 from app.domain.repositories.login_session import LoginSessionRepository
-from app.domain.services.auth.login_session import LoginSessionService
+from app.domain.services.auth.login_session import LoginSessionCache, \
+    LoginSessionService
 from app.domain.services.auth.token import JwtTokenService
 
 logger = getLogger('uvicorn')
@@ -23,6 +27,7 @@ class AuthMethod(str, Enum):
     """Auth method."""
     BEARER_ACCESS_TOKEN = 'bearer_access_token'
     SESSION_COOKIE = 'session_cookie'
+    SIGNED_SESSION_COOKIE = 'signed_session_cookie'
 
 
 class AuthorizerBase(ABC):
@@ -73,6 +78,7 @@ class SessionCookieAuthorizer(AuthorizerBase):
                 [AsyncSession], LoginSessionRepository],
             login_session_service: LoginSessionService,
             login_session_cookie_name: str,
+            login_session_cache: LoginSessionCache,
     ) -> Callable[[Callable[[], AsyncSession]], 'SessionCookieAuthorizer']:
         """Create factory."""
         return lambda session_factory: SessionCookieAuthorizer(
@@ -80,8 +86,10 @@ class SessionCookieAuthorizer(AuthorizerBase):
             login_session_repository_factory,
             login_session_service,
             login_session_cookie_name,
+            login_session_cache,
         )
 
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
     def __init__(
             self,
             session_factory: Callable[[], AsyncSession],
@@ -89,12 +97,14 @@ class SessionCookieAuthorizer(AuthorizerBase):
                 [AsyncSession], LoginSessionRepository],
             login_session_service: LoginSessionService,
             login_session_cookie_name: str,
+            login_session_cache: LoginSessionCache,
     ):
         self._login_session_repository_factory = \
             login_session_repository_factory
         self._session_factory = session_factory
         self._login_session_service = login_session_service
         self._login_session_cookie_name = login_session_cookie_name
+        self._login_session_cache = login_session_cache
 
     async def authorize(self, request: Request) -> Request:
         """Authorize."""
@@ -105,6 +115,18 @@ class SessionCookieAuthorizer(AuthorizerBase):
             logger.warning('Failed to extract session_id from cookies.')
             raise Unauthorized('Invalid or missing session.')
 
+        session = await self._login_session_cache.get(session_id)
+        if session is None:
+            session = await self._get_session_from_db(session_id)
+            await self._login_session_cache.set(session)
+
+        request.state.user_id = session.user_id
+        request.state.user_uuid = session.user_uuid
+        request.state.session = session
+
+        return request
+
+    async def _get_session_from_db(self, session_id: str) -> LoginSession:
         async with self._session_factory() as db_session:
             async with db_session.begin():
                 login_session_repository = \
@@ -117,8 +139,119 @@ class SessionCookieAuthorizer(AuthorizerBase):
                         'Failed to get session from DB by session_id.')
                     raise Unauthorized('Invalid or missing session.')
 
-            request.state.user_id = session.user_id
-            request.state.user_uuid = session.user_uuid
-            request.state.session = session
+        return session
+
+
+# pylint: disable=too-many-instance-attributes
+class SignedSessionCookieAuthorizer(AuthorizerBase):
+    """Signed session cookie authorizer.
+
+    The cookie carries the session signed by `LoginSessionService`, so
+    requests are authorized without reading the database. Whether the
+    session was revoked, i.e. deleted by a logout, is checked in the
+    database at most once per `revocation_check_interval_seconds` for each
+    session, in each process. A revoked session may be accepted until its
+    next check.
+    """
+    # Sessions whose last check is remembered. Forgotten ones are checked
+    # again on their next request.
+    max_tracked_sessions = 100_000
+
+    @staticmethod
+    def create_factory(
+            login_session_repository_factory: Callable[
+                [AsyncSession], LoginSessionRepository],
+            login_session_service: LoginSessionService,
+            login_session_cookie_name: str,
+            revocation_check_interval_seconds: float,
+    ) -> Callable[
+        [Callable[[], AsyncSession]], 'SignedSessionCookieAuthorizer'
+    ]:
+        """Create factory."""
+        return lambda session_factory: SignedSessionCookieAuthorizer(
+            session_factory,
+            login_session_repository_factory,
+            login_session_service,
+            login_session_cookie_name,
+            revocation_check_interval_seconds,
+        )
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def __init__(
+            self,
+            session_factory: Callable[[], AsyncSession],
+            login_session_repository_factory: Callable[
+                [AsyncSession], LoginSessionRepository],
+            login_session_service: LoginSessionService,
+            login_session_cookie_name: str,
+            revocation_check_interval_seconds: float,
+            clock: Callable[[], float] = time.monotonic,
+    ):
+        self._session_factory = session_factory
+        self._login_session_repository_factory = \
+            login_session_repository_factory
+        self._login_session_service = login_session_service
+        self._login_session_cookie_name = login_session_cookie_name
+        self._revocation_check_interval_seconds = \
+            revocation_check_interval_seconds
+        self._clock = clock
+        # Session ID -> (time of the next check, whether it was revoked).
+        self._checks: OrderedDict[str, tuple[float, bool]] = OrderedDict()
+
+    async def authorize(self, request: Request) -> Request:
+        """Authorize."""
+        cookie = request.cookies.get(self._login_session_cookie_name)
+        if cookie is None:
+            logger.warning('Failed to extract session from cookies.')
+            raise Unauthorized('Invalid or missing session.')
+
+        session = self._login_session_service.load_signed_session(cookie)
+        if session is None:
+            logger.warning('Invalid or expired signed session cookie.')
+            raise Unauthorized('Invalid or missing session.')
+
+        if await self._is_revoked(session.id):
+            logger.warning('Session was revoked.')
+            raise Unauthorized('Invalid or missing session.')
+
+        request.state.user_id = session.user_id
+        request.state.user_uuid = session.user_uuid
+        request.state.session = session
+
+        return request
+
+    async def _is_revoked(self, session_id: str) -> bool:
+        now = self._clock()
+        check = self._checks.get(session_id)
+        if check is not None:
+            next_check_at, revoked = check
+            if revoked or next_check_at > now:
+                self._checks.move_to_end(session_id)
+                return revoked
+
+        # Concurrent requests of the session skip the check meanwhile.
+        self._remember(
+            session_id, now + self._revocation_check_interval_seconds, False)
+        try:
+            async with self._session_factory() as db_session:
+                async with db_session.begin():
+                    login_session_repository = \
+                        self._login_session_repository_factory(db_session)
+                    revoked = await login_session_repository.get_by_id(
+                        session_id) is None
+        except BaseException:
+            self._checks.pop(session_id, None)
+            raise
+
+        if revoked:
+            # Session IDs are never reused, so a revoked one stays revoked.
+            self._remember(session_id, now, True)
+        return revoked
 
-            return request
+    def _remember(
+            self, session_id: str, next_check_at: float, revoked: bool,
+    ) -> None:
+        self._checks[session_id] = (next_check_at, revoked)
+        self._checks.move_to_end(session_id)
+        while len(self._checks) > self.max_tracked_sessions:
+            self._checks.popitem(last=False)
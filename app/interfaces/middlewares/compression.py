@@ -0,0 +1,366 @@
+"""Response compression middleware."""
+import gzip
+import importlib
+import time
+import zlib
+from logging import getLogger
+from types import ModuleType
+from typing import Callable, Protocol, Sequence
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.domain.services.metrics import MetricsRecorder
+
+logger = getLogger('uvicorn')
+
+# Streaming responses are only compressed when they set this header. It is
+# removed before the response is sent.
+COMPRESS_STREAM_HEADER = 'x-compress-stream'
+# Subtypes, or structured syntax suffixes, of compressible content types.
+COMPRESSIBLE_SUBTYPES = frozenset({'json', 'xml', 'javascript', 'msgpack'})
+
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 4
+ZSTD_LEVEL = 3
+
+
+def _optional_module(*names: str) -> ModuleType | None:
+    for name in names:
+        try:
+            return importlib.import_module(name)
+        except ImportError:
+            continue
+    return None
+
+
+brotli = _optional_module('brotli', 'brotlicffi')
+zstandard = _optional_module('zstandard')
+
+
+class Compressor(Protocol):
+    """Incremental compressor of a single response body."""
+
+    def compress(self, data: bytes) -> bytes:
+        """Compress a chunk, possibly buffering part of it."""
+
+    def flush(self) -> bytes:
+        """Emit everything buffered so far, keeping the stream open."""
+
+    def finish(self) -> bytes:
+        """Emit the remaining data and end the stream."""
+
+
+class GzipCompressor:
+    """gzip compressor backed by zlib."""
+
+    def __init__(self) -> None:
+        self._compressor = zlib.compressobj(
+            GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        """Compress a chunk."""
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        """Emit everything buffered so far."""
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        """End the stream."""
+        return self._compressor.flush()
+
+
+class BrotliCompressor:
+    """Brotli compressor backed by `brotli` or `brotlicffi`."""
+
+    def __init__(self) -> None:
+        assert brotli is not None
+        self._compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+
+    def compress(self, data: bytes) -> bytes:
+        """Compress a chunk."""
+        return bytes(self._compressor.process(data))
+
+    def flush(self) -> bytes:
+        """Emit everything buffered so far."""
+        return bytes(self._compressor.flush())
+
+    def finish(self) -> bytes:
+        """End the stream."""
+        return bytes(self._compressor.finish())
+
+
+class ZstdCompressor:
+    """Zstandard compressor backed by `zstandard`."""
+
+    def __init__(self) -> None:
+        assert zstandard is not None
+        self._compressor = zstandard.ZstdCompressor(
+            level=ZSTD_LEVEL).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        """Compress a chunk."""
+        return bytes(self._compressor.compress(data))
+
+    def flush(self) -> bytes:
+        """Emit everything buffered so far."""
+        assert zstandard is not None
+        return bytes(self._compressor.flush(
+            zstandard.COMPRESSOBJ_FLUSH_BLOCK))
+
+    def finish(self) -> bytes:
+        """End the stream."""
+        return bytes(self._compressor.flush())
+
+
+def available_compressors() -> dict[str, Callable[[], Compressor]]:
+    """Compressors by content coding, for the installed modules."""
+    compressors: dict[str, Callable[[], Compressor]] = {
+        'gzip': GzipCompressor}
+    if brotli is not None:
+        compressors['br'] = BrotliCompressor
+    if zstandard is not None:
+        compressors['zstd'] = ZstdCompressor
+    return compressors
+
+
+def compress_static(data: bytes, encoding: str) -> bytes:
+    """Compress a body once, ahead of time, at the highest level.
+
+    Args:
+        data (bytes): The body to compress.
+        encoding (str): `gzip`, or `br` when `brotli` is installed.
+
+    Returns:
+        bytes: The compressed body, identical for identical input.
+    """
+    if encoding == 'gzip':
+        return gzip.compress(data, compresslevel=9, mtime=0)
+    if encoding == 'br' and brotli is not None:
+        return bytes(brotli.compress(data, quality=11))
+    raise ValueError(f'Unsupported static encoding: {encoding}')
+
+
+def negotiate_encoding(
+        accept_encoding: str,
+        encodings: Sequence[str],
+) -> str | None:
+    """Pick the first of `encodings` the client accepts.
+
+    Args:
+        accept_encoding (str): The `Accept-Encoding` request header.
+        encodings (Sequence[str]): Supported content codings, in order of
+            preference.
+
+    Returns:
+        str | None: The content coding to use, or None to send the body as
+            it is.
+    """
+    qualities: dict[str, float] = {}
+    for item in accept_encoding.split(','):
+        name, *params = item.split(';')
+        quality = 1.0
+        for param in params:
+            key, _, value = param.strip().partition('=')
+            if key == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if name.strip():
+            qualities[name.strip().lower()] = quality
+
+    for encoding in encodings:
+        if qualities.get(encoding, qualities.get('*', 0.0)) > 0:
+            return encoding
+    return None
+
+
+def is_compressible(content_type: str | None) -> bool:
+    """Whether a body of `content_type` is worth compressing."""
+    if not content_type:
+        return False
+    main_type, _, subtype = \
+        content_type.split(';')[0].strip().lower().partition('/')
+    return main_type == 'text' \
+        or subtype.rsplit('+', 1)[-1] in COMPRESSIBLE_SUBTYPES
+
+
+# pylint: disable=too-few-public-methods
+class CompressionMiddleware:
+    """Compresses responses in the best encoding the client accepts.
+
+    Bodies smaller than `minimum_size`, bodies that are not text-like, and
+    responses that already have a `Content-Encoding` or ask for
+    `Cache-Control: no-transform` are sent as they are. Streaming responses,
+    whose body spans several messages, are only compressed when they set
+    the `X-Compress-Stream` header.
+
+    The compression ratio and the CPU time spent compressing every response
+    are recorded in `metrics` per encoding.
+    """
+
+    def __init__(
+            self,
+            app: ASGIApp,
+            metrics: MetricsRecorder,
+            minimum_size: int = 1024,
+            encodings: Sequence[str] = ('br', 'zstd', 'gzip'),
+    ) -> None:
+        self._app = app
+        self._metrics = metrics
+        self._minimum_size = minimum_size
+
+        compressors = available_compressors()
+        for encoding in encodings:
+            if encoding not in compressors:
+                logger.warning(
+                    'Compression encoding %s is not available.', encoding)
+        self._encodings = [
+            encoding for encoding in encodings if encoding in compressors]
+        self._compressors = compressors
+
+    async def __call__(
+            self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self._app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(
+            Headers(scope=scope).get('accept-encoding', ''),
+            self._encodings,
+        )
+        responder = _CompressionResponder(
+            send,
+            self._metrics,
+            self._minimum_size,
+            encoding,
+            self._compressors[encoding] if encoding else None,
+        )
+        await self._app(scope, receive, responder.send)
+
+
+# pylint: disable=too-few-public-methods,too-many-instance-attributes
+class _CompressionResponder:
+    """Compresses the messages of a single response."""
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def __init__(
+            self,
+            send: Send,
+            metrics: MetricsRecorder,
+            minimum_size: int,
+            encoding: str | None,
+            compressor_factory: Callable[[], Compressor] | None,
+    ) -> None:
+        self._send = send
+        self._metrics = metrics
+        self._minimum_size = minimum_size
+        self._encoding = encoding
+        self._compressor_factory = compressor_factory
+        self._start: Message | None = None
+        self._compressor: Compressor | None = None
+        self._passthrough = False
+        self._bytes_in = 0
+        self._bytes_out = 0
+        self._cpu_seconds = 0.0
+
+    async def send(self, message: Message) -> None:
+        """Receive a message of the wrapped app."""
+        if message['type'] == 'http.response.start':
+            self._start = message
+            return
+        if message['type'] != 'http.response.body' or self._passthrough:
+            await self._send(message)
+            return
+
+        if self._start is not None:
+            await self._send_start(message)
+            self._start = None
+            return
+
+        await self._send_compressed(
+            message.get('body', b''), message.get('more_body', False))
+
+    async def _send_start(self, message: Message) -> None:
+        """Decide how to send the response on its first body message."""
+        assert self._start is not None
+        headers = MutableHeaders(raw=self._start['headers'])
+        body: bytes = message.get('body', b'')
+        streaming: bool = message.get('more_body', False)
+        stream_requested = COMPRESS_STREAM_HEADER in headers
+        if stream_requested:
+            del headers[COMPRESS_STREAM_HEADER]
+
+        eligible = is_compressible(headers.get('content-type')) \
+            and 'content-encoding' not in headers \
+            and 'no-transform' not in headers.get('cache-control', '') \
+            and (stream_requested if streaming
+                 else len(body) >= self._minimum_size)
+        if eligible:
+            headers.add_vary_header('Accept-Encoding')
+
+        if not eligible or self._compressor_factory is None:
+            self._passthrough = True
+            await self._send(self._start)
+            await self._send(message)
+            return
+
+        self._compressor = self._compressor_factory()
+        if not streaming:
+            compressed = self._compress(body, finish=True)
+            if len(compressed) >= len(body):
+                self._passthrough = True
+                await self._send(self._start)
+                await self._send(message)
+                return
+            self._set_encoding_headers(headers)
+            headers['Content-Length'] = str(len(compressed))
+            await self._send(self._start)
+            await self._send({
+                'type': 'http.response.body', 'body': compressed})
+            self._record()
+            return
+
+        self._set_encoding_headers(headers)
+        del headers['Content-Length']
+        await self._send(self._start)
+        await self._send_compressed(body, more_body=True)
+
+    def _set_encoding_headers(self, headers: MutableHeaders) -> None:
+        assert self._encoding is not None
+        headers['Content-Encoding'] = self._encoding
+        # The compressed representation is not byte-identical any more.
+        etag = headers.get('etag')
+        if etag is not None and not etag.startswith('W/'):
+            headers['ETag'] = f'W/{etag}'
+
+    async def _send_compressed(self, body: bytes, more_body: bool) -> None:
+        await self._send({
+            'type': 'http.response.body',
+            'body': self._compress(body, finish=not more_body),
+            'more_body': more_body,
+        })
+        if not more_body:
+            self._record()
+
+    def _compress(self, body: bytes, finish: bool) -> bytes:
+        assert self._compressor is not None
+        started = time.thread_time()
+        compressed = self._compressor.compress(body) + (
+            self._compressor.finish() if finish else self._compressor.flush())
+        self._cpu_seconds += time.thread_time() - started
+        self._bytes_in += len(body)
+        self._bytes_out += len(compressed)
+        return compressed
+
+    def _record(self) -> None:
+        prefix = f'compression.{self._encoding}'
+        self._metrics.increment(f'{prefix}.responses')
+        self._metrics.increment(f'{prefix}.bytes_in', self._bytes_in)
+        self._metrics.increment(f'{prefix}.bytes_out', self._bytes_out)
+        if self._bytes_in:
+            self._metrics.observe(
+                f'{prefix}.ratio', self._bytes_out / self._bytes_in)
+        self._metrics.observe(f'{prefix}.cpu_ms', self._cpu_seconds * 1000)
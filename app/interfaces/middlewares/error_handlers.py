@@ -2,12 +2,17 @@
 import logging
 
 from fastapi import FastAPI, Request
-from fastapi.exceptions import HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.encoders import jsonable_encoder
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import Response
+from starlette.exceptions import HTTPException
 
+from app.application.exc import NotModified
 from app.domain.exc import CustomBaseException
 from app.interfaces.views.json_response import ErrorJsonResponseDetail, \
     error_json_response
+from app.interfaces.views.negotiated_response import NegotiatedResponse, \
+    negotiate_media_type
 
 logger = logging.getLogger('uvicorn')
 
@@ -15,48 +20,80 @@ logger = logging.getLogger('uvicorn')
 def return_error_json_response(
         exc: Exception,
         status_code: int,
-        detail: str | None
-) -> JSONResponse:
-    """Return an error response."""
-    return JSONResponse(
+        detail: str | None,
+        request: Request | None = None,
+) -> NegotiatedResponse:
+    """Return an error response.
+
+    The body is MessagePack when `request` accepts it, JSON otherwise.
+    """
+    return NegotiatedResponse(
         status_code=status_code,
         content=error_json_response(
             detail=[ErrorJsonResponseDetail(
                 type=exc.__class__.__name__,
                 msg=f'{exc}',
                 detail=detail,
-            )])
+            )]),
+        media_type=_media_type(request),
     )
 
 
+def _media_type(request: Request | None) -> str | None:
+    if request is None:
+        return None
+    return negotiate_media_type(request.headers.get('accept'))
+
+
 def app_error_handlers(app_: FastAPI) -> None:
     """Add handlers to the application."""
 
+    @app_.exception_handler(NotModified)
+    async def not_modified_handler(
+            _request: Request,
+            exc: NotModified) -> Response:
+        # 304 is not an error, the client reuses its cached representation.
+        return Response(
+            status_code=exc.status_code,
+            headers={'ETag': exc.etag},
+        )
+
     @app_.exception_handler(CustomBaseException)
     async def custom_exception_handler(
-            _request: Request,
-            exc: CustomBaseException) -> JSONResponse:
+            request: Request,
+            exc: CustomBaseException) -> NegotiatedResponse:
         logger.error('%s', exc)
         return return_error_json_response(
-            exc, exc.status_code, exc.detail)
+            exc, exc.status_code, exc.detail, request)
 
     @app_.exception_handler(HTTPException)
     async def http_exception_handler(
-            _request: Request,
-            exc: HTTPException) -> JSONResponse:
+            request: Request,
+            exc: HTTPException) -> NegotiatedResponse:
         logger.error('%s', exc)
         return return_error_json_response(
-            exc, exc.status_code, None)
+            exc, exc.status_code, None, request)
+
+    @app_.exception_handler(RequestValidationError)
+    async def request_validation_error_handler(
+            request: Request,
+            exc: RequestValidationError) -> NegotiatedResponse:
+        # Same body as the FastAPI default, in the negotiated media type.
+        return NegotiatedResponse(
+            status_code=422,
+            content={'detail': jsonable_encoder(exc.errors())},
+            media_type=_media_type(request),
+        )
 
     # Final fall back case
     @app_.exception_handler(Exception)
     async def generic_error_handler(
-            _request: Request,
-            exc: Exception) -> JSONResponse:
+            request: Request,
+            exc: Exception) -> NegotiatedResponse:
         logger.exception(
             '%s, %s',
             exc.__class__.__name__, exc,
             exc_info=exc,
         )
         return return_error_json_response(
-            exc, 500, None)
+            exc, 500, None, request)
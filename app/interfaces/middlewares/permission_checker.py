@@ -1,71 +1,162 @@
 """Permission checker."""
 import functools
+import time
+from collections import OrderedDict
 from logging import getLogger
-from typing import Callable, Any
+from typing import AsyncContextManager, Callable, Any
 
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import selectinload
 
 from app.application.exc import Forbidden
-from app.domain.entities.user import User, Role
+from app.domain.entities.user import User, Role, Permission, \
+    RolePermissions
 from app.domain.repositories.user import UserByUUIDRepository
+from app.domain.services.metrics import MetricsRecorder
+from app.domain.value_objects.role_permision import ALL_PERMISSIONS_MASK, \
+    PERMISSION_BITS, PermissionName, permission_mask
 
 logger = getLogger('uvicorn')
 
 REQUIRED_PERMISSION_FIELD = '_required_permission'
 
 
+# pylint: disable=too-many-instance-attributes
 class PermissionChecker:
-    """Permission checker."""
+    """Permission checker.
+
+    The permissions of each role are loaded at once into a table of
+    bitmasks, see `PERMISSION_BITS`, and the mask of each user, the OR of
+    the masks of their roles, is kept in an LRU of `max_entries` users. Both
+    are reloaded after `ttl_seconds`, so that changes made by other
+    processes apply within that time; a TTL of 0 disables the caches.
+
+    The app has no endpoint that changes roles or the permissions of roles,
+    so cached masks only follow such changes after the TTL; code that makes
+    them should call `invalidate`. Unknown users are not cached, so a user
+    created after a failed check is found at once.
+    """
 
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
     def __init__(
             self,
-            session_factory: Callable[[], AsyncSession],
+            session_factory: Callable[[], AsyncContextManager[AsyncSession]],
             user_by_uuid_repository_factory: Callable[
                 [AsyncSession], UserByUUIDRepository],
+            ttl_seconds: float,
+            max_entries: int,
+            metrics: MetricsRecorder,
+            clock: Callable[[], float] = time.monotonic,
     ):
         self._session_factory = session_factory
         self._user_by_uuid_repository_factory = user_by_uuid_repository_factory
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._metrics = metrics
+        self._clock = clock
+        self._role_masks: dict[int, int] = {}
+        self._role_masks_expire_at = float('-inf')
+        self._user_masks: OrderedDict[str, tuple[int, float]] = \
+            OrderedDict()
 
     async def permitted(
             self,
             user_uuid: str,
-            required_permission_names: list[str],
+            required_mask: int,
     ) -> None:
-        """Check permission."""
-
+        """Check that the user has one of the permissions of a mask.
+
+        Raises:
+            Forbidden: If the user has none of them.
+        """
+        if not await self.user_mask(user_uuid) & required_mask:
+            logger.warning(
+                'Missing permission: %s', [
+                    name.value for name, bit in PERMISSION_BITS.items()
+                    if bit & required_mask])
+            raise Forbidden('Missing permission')
+
+    async def user_mask(self, user_uuid: str) -> int:
+        """Return the permission mask of a user, 0 if there is no user."""
+        entry = self._user_masks.get(user_uuid)
+        if entry is not None:
+            mask, expires_at = entry
+            if expires_at > self._clock():
+                self._user_masks.move_to_end(user_uuid)
+                self._metrics.increment('permission_cache.hits')
+                return mask
+            del self._user_masks[user_uuid]
+
+        self._metrics.increment('permission_cache.misses')
+        loaded_mask = await self._load_user_mask(user_uuid)
+        if loaded_mask is None:
+            return 0
+        if self._ttl_seconds > 0:
+            self._user_masks[user_uuid] = \
+                loaded_mask, self._clock() + self._ttl_seconds
+            while len(self._user_masks) > self._max_entries:
+                self._user_masks.popitem(last=False)
+        return loaded_mask
+
+    def invalidate(self, user_uuid: str | None = None) -> None:
+        """Drop the cached mask of a user, or everything if None."""
+        if user_uuid is not None:
+            self._user_masks.pop(user_uuid, None)
+            return
+        self._user_masks.clear()
+        self._role_masks_expire_at = float('-inf')
+
+    async def _load_user_mask(self, user_uuid: str) -> int | None:
         async with self._session_factory() as db_session:
             async with db_session.begin():
-
                 user_by_uuid_repository = \
                     self._user_by_uuid_repository_factory(db_session)
                 user = await user_by_uuid_repository.get_by_id(
                     user_uuid,
                     load_options=[
-                        joinedload(
+                        selectinload(
                             User.roles  # type: ignore
-                        ).joinedload(
-                            Role.permissions)]  # type: ignore
+                        ).load_only(Role.id)],  # type: ignore
                 )
                 if user is None:
                     logger.warning(
                         'User not found by UUID: %s', user_uuid)
-                    raise Forbidden('Missing permission')
+                    return None
 
                 # superuser has full access permission.
                 if user.is_superuser:
-                    return
-
-                roles = user.roles
-                user_permission_names = set(sum([
-                    [permission.name for permission in role.permissions
-                     ] for role in roles], []))
-
-                if not user_permission_names & set(required_permission_names):
-                    logger.warning(
-                        'Missing permission: %s',
-                        required_permission_names)
-                    raise Forbidden('Missing permission')
+                    return ALL_PERMISSIONS_MASK
+
+                role_masks = await self._get_role_masks(db_session)
+                mask = 0
+                for role in user.roles:
+                    mask |= role_masks.get(role.id, 0)
+                return mask
+
+    async def _get_role_masks(
+            self, db_session: AsyncSession) -> dict[int, int]:
+        if self._role_masks_expire_at > self._clock():
+            return self._role_masks
+
+        result = await db_session.execute(
+            select(
+                getattr(RolePermissions, 'role_id'),
+                getattr(Permission, 'name'),
+            ).join(
+                Permission,
+                getattr(Permission, 'id') ==
+                getattr(RolePermissions, 'permission_id'),
+            ))
+        role_masks: dict[int, int] = {}
+        for role_id, name in result.all():
+            # Permissions no code requires have no bit.
+            if name in PermissionName:
+                role_masks[role_id] = role_masks.get(role_id, 0) | \
+                    PERMISSION_BITS[PermissionName(name)]
+        self._role_masks = role_masks
+        self._role_masks_expire_at = self._clock() + self._ttl_seconds
+        return role_masks
 
 
 AnyCallable = Callable[[Any], Any]
@@ -80,17 +171,21 @@ def permission_required(
     This decorator ensures that the user associated with the provided
     `_user_uuid` in `kwargs` has the necessary permissions to access the
     decorated function. It interacts with a `PermissionChecker` object to
-    determine if the required permissions are satisfied.
+    determine if the required permissions are satisfied. The names are
+    turned into a bitmask once, when the function is decorated.
     
     Parameters:
         required_permission_names (list[str]): A list of permission names that are
             required to execute the decorated function.
     Raises:
+        ValueError: If a name is not a `PermissionName`.
         KeyError: If `_user_uuid` or `_permission_checker` is missing in the
             `kwargs` of the decorated function.
         Forbidden: If the user does not have the required permissions.
     """
 
+    required_mask = permission_mask(required_permission_names)
+
     def check_permission(original_func: AnyCallable) -> AnyCallable:
         @functools.wraps(original_func)
         async def wrapper(*args, **kwargs):
@@ -103,10 +198,7 @@ def permission_required(
                     'in kwargs: %s', err)
                 raise err
 
-            await permission_checker.permitted(
-                user_uuid,
-                required_permission_names,
-            )
+            await permission_checker.permitted(user_uuid, required_mask)
             return await original_func(*args, **kwargs)
 
         return wrapper
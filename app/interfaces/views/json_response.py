@@ -5,8 +5,9 @@ structure for better maintainability and user understanding.
 """
 from typing import Any
 
-from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel
+from pydantic_core import to_json
 
 
 class ErrorJsonResponseDetail(BaseModel):
@@ -22,6 +23,23 @@ class ErrorJsonResponse(BaseModel):
 
 
 def error_json_response(
-        detail: list[ErrorJsonResponseDetail]) -> Any:
+        detail: list[ErrorJsonResponseDetail]) -> ErrorJsonResponse:
     """Helper function to create an error JSON response."""
-    return jsonable_encoder(ErrorJsonResponse(detail=detail))
+    return ErrorJsonResponse(detail=detail)
+
+
+class FastJsonResponse(JSONResponse):
+    """Default JSON response of the application.
+
+    The content, pydantic models included, is serialized straight to bytes
+    by pydantic-core, without building an intermediate tree of dicts and
+    lists in Python.
+
+    Models, and the JSON-ready content FastAPI passes for a response model,
+    render to the same bytes as `JSONResponse`. Raw values outside a model
+    follow pydantic instead of `jsonable_encoder`: UTC datetimes end with
+    `Z`, `Decimal`s are strings and `timedelta`s are ISO 8601 durations.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content, by_alias=True)
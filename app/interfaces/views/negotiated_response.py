@@ -0,0 +1,106 @@
+"""
+This file defines the default response of the application, rendered as JSON
+or MessagePack depending on the `Accept` header of the request.
+"""
+from contextvars import ContextVar
+from typing import Any, Mapping
+
+import msgpack
+from pydantic import BaseModel
+from pydantic_core import to_jsonable_python
+from starlette.background import BackgroundTask
+
+from app.interfaces.views.json_response import FastJsonResponse
+
+JSON_MEDIA_TYPE = 'application/json'
+MSGPACK_MEDIA_TYPE = 'application/msgpack'
+MSGPACK_MEDIA_TYPES = frozenset({MSGPACK_MEDIA_TYPE, 'application/x-msgpack'})
+
+# Media type negotiated for the request being handled, set by
+# `NegotiatedRoute`.
+negotiated_media_type: ContextVar[str] = ContextVar(
+    'negotiated_media_type', default=JSON_MEDIA_TYPE)
+
+
+def is_msgpack(content_type: str | None) -> bool:
+    """Whether a `Content-Type` header denotes MessagePack."""
+    if not content_type:
+        return False
+    return content_type.split(';')[0].strip().lower() in MSGPACK_MEDIA_TYPES
+
+
+def negotiate_media_type(accept: str | None) -> str:
+    """Pick the response media type for an `Accept` header.
+
+    MessagePack is only sent to clients that name it explicitly, with a
+    quality at least as high as the one they give to JSON.
+    """
+    if not accept:
+        return JSON_MEDIA_TYPE
+
+    qualities: dict[str, float] = {}
+    for item in accept.split(','):
+        media_range, *params = item.split(';')
+        quality = 1.0
+        for param in params:
+            key, _, value = param.strip().partition('=')
+            if key == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[media_range.strip().lower()] = quality
+
+    msgpack_quality = max(
+        (qualities.get(media_type, 0.0) for media_type in MSGPACK_MEDIA_TYPES))
+    json_quality = qualities.get(
+        JSON_MEDIA_TYPE,
+        qualities.get('application/*', qualities.get('*/*', 0.0)))
+    if msgpack_quality > 0 and msgpack_quality >= json_quality:
+        return MSGPACK_MEDIA_TYPE
+    return JSON_MEDIA_TYPE
+
+
+class NegotiatedResponse(FastJsonResponse):
+    """Default response of the application.
+
+    Rendered as MessagePack when that is the negotiated media type, and as
+    JSON otherwise. MessagePack bodies are packed from the JSON-compatible
+    Python values pydantic-core produces, without encoding JSON text.
+    """
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def __init__(
+            self,
+            content: Any,
+            status_code: int = 200,
+            headers: Mapping[str, str] | None = None,
+            media_type: str | None = None,
+            background: BackgroundTask | None = None,
+    ) -> None:
+        super().__init__(
+            content,
+            status_code=status_code,
+            headers=headers,
+            media_type=media_type or negotiated_media_type.get(),
+            background=background,
+        )
+        self.headers.add_vary_header('Accept')
+
+    def render(self, content: Any) -> bytes:
+        if self.media_type == MSGPACK_MEDIA_TYPE:
+            return bytes(msgpack.packb(
+                to_jsonable_python(content, by_alias=True)))
+        return super().render(content)
+
+
+class ModelResponse(NegotiatedResponse):
+    """Response of an already validated model.
+
+    Returning it from an endpoint skips the dump, re-validation and encoding
+    FastAPI applies to the `response_model`, which then only documents the
+    schema.
+    """
+
+    def __init__(self, content: BaseModel, **kwargs: Any) -> None:
+        super().__init__(content, **kwargs)
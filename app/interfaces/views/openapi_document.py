@@ -0,0 +1,84 @@
+"""
+This file defines the OpenAPI document of the application, rendered once into
+JSON bytes and precompressed variants that are served as they are.
+"""
+import hashlib
+from functools import cached_property
+from pathlib import Path
+from typing import Any
+
+from fastapi.responses import Response
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+from app.domain.services.etag import etag_matches
+from app.interfaces.middlewares.compression import brotli, \
+    compress_static, negotiate_encoding
+
+# Precompressed variants, in order of preference.
+STATIC_ENCODINGS = ('br', 'gzip') if brotli is not None else ('gzip',)
+_SUFFIXES = {'br': '.br', 'gzip': '.gz'}
+
+
+class OpenApiDocument(BaseModel):
+    """OpenAPI document as JSON bytes with precompressed variants."""
+    body: bytes
+    encoded: dict[str, bytes] = {}
+
+    @cached_property
+    def etag(self) -> str:
+        """Strong ETag of the JSON body."""
+        digest = hashlib.blake2b(self.body, digest_size=16).hexdigest()
+        return f'"{digest}"'
+
+    @classmethod
+    def from_schema(cls, schema: dict[str, Any]) -> 'OpenApiDocument':
+        """Render a schema and compress it in every static encoding."""
+        body = to_json(schema)
+        return cls(body=body, encoded={
+            encoding: compress_static(body, encoding)
+            for encoding in STATIC_ENCODINGS
+        })
+
+    @classmethod
+    def load(cls, path: Path) -> 'OpenApiDocument | None':
+        """Read a document saved by `save`, or None if there is none."""
+        if not path.is_file():
+            return None
+        encoded = {}
+        for encoding in STATIC_ENCODINGS:
+            encoded_path = path.with_name(path.name + _SUFFIXES[encoding])
+            if encoded_path.is_file():
+                encoded[encoding] = encoded_path.read_bytes()
+        return cls(body=path.read_bytes(), encoded=encoded)
+
+    def save(self, path: Path) -> None:
+        """Write the JSON body to `path` and its variants next to it."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(self.body)
+        for encoding, data in self.encoded.items():
+            path.with_name(path.name + _SUFFIXES[encoding]).write_bytes(data)
+
+    def response(
+            self,
+            accept_encoding: str | None,
+            if_none_match: str | None,
+    ) -> Response:
+        """Serve the variant the client accepts, or 304 if it has it."""
+        etag = self.etag
+        encoding = negotiate_encoding(
+            accept_encoding or '', list(self.encoded))
+        headers = {
+            'ETag': f'W/{etag}' if encoding else etag,
+            'Vary': 'Accept-Encoding',
+        }
+        if etag_matches(if_none_match, etag):
+            return Response(status_code=304, headers=headers)
+        if encoding is None:
+            return Response(
+                self.body, media_type='application/json', headers=headers)
+        return Response(
+            self.encoded[encoding],
+            media_type='application/json',
+            headers=headers | {'Content-Encoding': encoding},
+        )
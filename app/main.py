@@ -2,18 +2,21 @@
 import logging
 from contextlib import asynccontextmanager
 from logging import getLogger
-from typing import Any
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.openapi.utils import get_openapi
 
 from app.config import get_settings
 from app.di_container import Container
 from app.interfaces.controllers.base import router
+from app.interfaces.controllers.openapi import include_openapi_routes
+from app.interfaces.controllers.well_known import \
+    router as well_known_router
 from app.interfaces.middlewares.auth_middleware import \
     AuthorizationMiddleware
+from app.interfaces.middlewares.compression import CompressionMiddleware
 from app.interfaces.middlewares.error_handlers import app_error_handlers
+from app.interfaces.views.negotiated_response import NegotiatedResponse
 
 logger = getLogger('uvicorn')
 
@@ -24,6 +27,8 @@ def create_app() -> FastAPI:
     config = get_settings()
 
     _db = container.db()
+    # Fails here if the password hash scheme is not installed.
+    container.password_hasher()
 
     # basicConfig() is always required for sqlalchemy
     logging.basicConfig(level=config.log_level)
@@ -32,11 +37,26 @@ def create_app() -> FastAPI:
     @asynccontextmanager
     async def lifespan(_app: FastAPI):  # type: ignore
         # do something before start
+        last_login_recorder = container.last_login_recorder()
+        last_login_recorder.start()
+        login_session_reaper = container.login_session_reaper()
+        login_session_reaper.start()
         yield
         # do something before end
+        await login_session_reaper.stop()
+        await last_login_recorder.stop()
+        container.password_hashing_pool().shutdown()
+        shared_key_value_store = container.shared_key_value_store()
+        if shared_key_value_store is not None:
+            await shared_key_value_store.close()
 
     _app = FastAPI(
         lifespan=lifespan,
+        default_response_class=NegotiatedResponse,
+        # Served by `include_openapi_routes`.
+        openapi_url=None,
+        docs_url=None,
+        redoc_url=None,
         swagger_ui_parameters={
             # Can expand all sections by default by uncommenting the line below
             # 'docExpansion': 'full',
@@ -46,6 +66,7 @@ def create_app() -> FastAPI:
     )
     _app.container = container  # type: ignore
     _app.include_router(router)
+    _app.include_router(well_known_router)
 
     app_error_handlers(_app)
 
@@ -57,6 +78,7 @@ def create_app() -> FastAPI:
         allow_credentials=True,
         allow_methods=['*'],
         allow_headers=['*'],
+        expose_headers=['ETag'],
     )
 
     _app.add_middleware(
@@ -65,33 +87,28 @@ def create_app() -> FastAPI:
         session_cookie_authorizer= \
             container.session_cookie_authorizer_factory(
             )(_db.session),  # type: ignore
+        signed_session_cookie_authorizer= \
+            container.signed_session_cookie_authorizer_factory(
+            )(_db.session),  # type: ignore
         auth_method=config.auth_method,
     )
 
+    # Outermost, so error responses of the middlewares above are compressed.
+    _app.add_middleware(
+        CompressionMiddleware,
+        metrics=container.metrics(),
+        minimum_size=config.compression_minimum_size,
+        encodings=config.compression_encodings,
+    )
+
     # _app.mount('/admin', admin_app)
 
-    def custom_openapi() -> dict[str, Any]:
-        if _app.openapi_schema:
-            return _app.openapi_schema
-
-        openapi_schema: dict[str, Any] = get_openapi(
-            title=f"{config.app_name} API",
-            version='0.0.1',
-            description=f"{config.app_name} API",
-            routes=app.routes,
-        )
-        # openapi_schema["components"]["securitySchemes"] = {
-        #     "BearerAuth": {
-        #         "type": "http",
-        #         "scheme": "bearer",
-        #         "bearerFormat": "JWT",
-        #     }
-        # }
-        # openapi_schema["security"] = [{"BearerAuth": []}]
-        _app.openapi_schema = openapi_schema
-        return _app.openapi_schema
-
-    _app.openapi = custom_openapi  # type: ignore
+    include_openapi_routes(
+        _app,
+        config.app_name,
+        schema_path=config.openapi_schema_path,
+        runtime_fallback=config.openapi_runtime_fallback,
+    )
 
     logger.info('Application created')
     return _app
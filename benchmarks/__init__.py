@@ -0,0 +1,5 @@
+"""Benchmarks.
+
+Run a benchmark module from the repository root, e.g.
+`python -m benchmarks.like_filters --test`.
+"""
@@ -0,0 +1,169 @@
+"""Benchmark of `__like` and `__prefix` list filters.
+
+Fills `sample_items` and `users` with generated rows, then compares the plans
+and timings of the list and count queries built by the query factories, with
+and without index scans allowed.
+
+    python -m benchmarks.like_filters --test --rows 10000000
+
+Generated rows carry a `bench-` uuid prefix and are deleted afterwards unless
+`--keep` is given.
+"""
+import asyncio
+import time
+from typing import Any, Iterator
+
+import click
+from sqlalchemy import Select, func, select, text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.config import get_settings, get_settings_for_testing
+from app.domain.value_objects.api_query import ApiListQuery
+from app.infrastructure.database.database import Database
+from app.infrastructure.repositories.sample_item_in_db import \
+    InDBSampleItemQueryFactory
+from app.infrastructure.repositories.user_in_db import InDBUserQueryFactory
+
+UUID_PREFIX = 'bench-'
+PAGE_SIZE = 50
+
+_FILL_SAMPLE_ITEMS = text("""
+INSERT INTO sample_items (uuid, name, description)
+SELECT :prefix || 's' || i,
+       'Sample item ' || i || ' ' || md5(i::text),
+       md5((-i)::text)
+FROM generate_series(1, :rows) AS i
+""")
+_FILL_USERS = text("""
+INSERT INTO users (uuid, email, first_name, last_name, password_hash,
+                   is_active, is_superuser)
+SELECT :prefix || 'u' || i,
+       'user' || i || '.' || substr(md5(i::text), 1, 6) || '@example.com',
+       initcap(substr(md5((i * 7)::text), 1, 8)),
+       initcap(substr(md5((i * 13)::text), 1, 10)),
+       'not-a-hash', true, false
+FROM generate_series(1, :rows) AS i
+""")
+
+
+def scenarios(rows: int) -> Iterator[tuple[str, Select[Any]]]:
+    """Yield the list statements to benchmark."""
+    probe = rows // 2
+    sample_items = InDBSampleItemQueryFactory()
+    users = InDBUserQueryFactory()
+
+    def sample_item_query(**queries: Any) -> Select[Any]:
+        return sample_items.list_query(ApiListQuery(queries=queries))
+
+    def user_query(**queries: Any) -> Select[Any]:
+        return users.list_query(ApiListQuery(queries=queries))
+
+    yield ('sample_items.name__like',
+           sample_item_query(name__like=f'%item {probe} %'))
+    yield ('sample_items.name__prefix',
+           sample_item_query(name__prefix=f'Sample item {probe} '))
+    yield ('users.email__like', user_query(email__like=f'%user{probe}.%'))
+    yield ('users.email__prefix', user_query(email__prefix=f'user{probe}.'))
+    yield ('users.last_name__like', user_query(last_name__like='%abcd%'))
+
+
+def _plan_nodes(plan: dict[str, Any]) -> Iterator[str]:
+    name = plan['Node Type']
+    if 'Index Name' in plan:
+        name = f"{name} on {plan['Index Name']}"
+    yield name
+    for child in plan.get('Plans', []):
+        yield from _plan_nodes(child)
+
+
+async def explain(
+        connection: AsyncConnection,
+        stmt: Select[Any],
+) -> tuple[float, list[str]]:
+    """Run `EXPLAIN ANALYZE` and return the execution time and plan nodes."""
+    sql = stmt.compile(
+        dialect=connection.dialect,
+        compile_kwargs={'literal_binds': True},
+    )
+    result = await connection.exec_driver_sql(
+        f'EXPLAIN (ANALYZE, FORMAT JSON) {sql}')
+    plan = result.scalar_one()[0]
+    return plan['Execution Time'], list(_plan_nodes(plan['Plan']))
+
+
+async def fill(connection: AsyncConnection, rows: int) -> float:
+    """Insert the generated rows and refresh the planner statistics."""
+    started = time.perf_counter()
+    for stmt in (_FILL_SAMPLE_ITEMS, _FILL_USERS):
+        await connection.execute(stmt, {'prefix': UUID_PREFIX, 'rows': rows})
+    await connection.commit()
+    await connection.exec_driver_sql('ANALYZE sample_items')
+    await connection.exec_driver_sql('ANALYZE users')
+    await connection.commit()
+    return time.perf_counter() - started
+
+
+async def cleanup(connection: AsyncConnection) -> None:
+    """Delete the generated rows."""
+    for table in ('sample_items', 'users'):
+        await connection.execute(
+            text(f'DELETE FROM {table} WHERE uuid LIKE :pattern'),
+            {'pattern': f'{UUID_PREFIX}%'},
+        )
+    await connection.commit()
+
+
+async def report(
+        connection: AsyncConnection,
+        name: str,
+        stmt: Select[Any],
+) -> None:
+    """Print the page and count plans of `stmt` with and without indexes."""
+    page = stmt.limit(PAGE_SIZE)
+    # pylint: disable=not-callable
+    count = select(func.count()).select_from(stmt.subquery())
+    for label, query in (('page', page), ('count', count)):
+        for index_scans in (True, False):
+            await connection.exec_driver_sql(
+                f'SET enable_indexscan = {index_scans}')
+            await connection.exec_driver_sql(
+                f'SET enable_bitmapscan = {index_scans}')
+            ms, nodes = await explain(connection, query)
+            mode = 'index' if index_scans else 'seq  '
+            click.echo(
+                f'{name:28} {label:5} {mode} {ms:10.2f} ms  '
+                f'{" > ".join(nodes)}')
+    # The settings are rolled back with the transaction.
+    await connection.rollback()
+
+
+async def run(test: bool, rows: int, keep: bool) -> None:
+    """Fill the tables, print the plans and timings, and clean up."""
+    config = get_settings_for_testing() if test else get_settings()
+    db = Database(db_url=config.db_dsn)
+    try:
+        async with db.get_engine().connect() as connection:
+            elapsed = await fill(connection, rows)
+            click.echo(f'Inserted {rows} rows per table in {elapsed:.1f}s')
+
+            for name, stmt in scenarios(rows):
+                await report(connection, name, stmt)
+
+            if not keep:
+                await cleanup(connection)
+    finally:
+        await db.get_engine().dispose()
+
+
+@click.command()
+@click.option('--test', is_flag=True, help="Run against the test database.")
+@click.option('--rows', default=10_000_000, show_default=True,
+              help="Rows generated per table.")
+@click.option('--keep', is_flag=True, help="Keep the generated rows.")
+def main(test: bool, rows: int, keep: bool) -> None:
+    """Benchmark `__like` and `__prefix` filters."""
+    asyncio.run(run(test, rows, keep))
+
+
+if __name__ == '__main__':
+    main()  # pylint: disable=no-value-for-parameter
@@ -0,0 +1,36 @@
+"""Test cases for the index advisor."""
+import pytest
+
+from app.config import get_settings_for_testing
+from app.domain.value_objects.api_query import ApiListQueryOp
+from app.infrastructure.database.database import Database
+from app.infrastructure.database.index_advisor import advise, \
+    fetch_indexes, list_query_dto_classes
+
+
+@pytest.mark.asyncio
+async def test_index_advisor__migrated_db__covers_all_columns() -> None:
+    """Test that every filter and sort column has a supporting index."""
+    config = get_settings_for_testing()
+    db = Database(db_url=config.db_dsn)
+    try:
+        async with db.get_engine().connect() as connection:
+            indexes = await fetch_indexes(connection)
+    finally:
+        await db.get_engine().dispose()
+
+    advices = advise(list_query_dto_classes(), indexes)
+    by_column = {
+        (advice.table_name, advice.column_name, advice.op): advice
+        for advice in advices
+    }
+
+    assert [str(advice) for advice in advices if advice.missing] == []
+    created_at_sort = by_column[
+        ('sample_items', 'created_at', ApiListQueryOp.DESC)]
+    assert created_at_sort.index_name == 'ix_sample_items_created_at_active'
+    assert created_at_sort.soft_delete_aware
+    assert by_column[('users', 'email', ApiListQueryOp.LIKE)].index_name \
+        == 'ix_users_email_trgm_active'
+    assert by_column[('users', 'email', ApiListQueryOp.PREFIX)].index_name \
+        == 'ix_users_email_prefix_active'
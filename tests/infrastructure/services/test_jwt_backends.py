@@ -0,0 +1,64 @@
+"""Test cases for the JWT backends."""
+import base64
+import json
+
+import pytest
+from freezegun import freeze_time
+
+from app.infrastructure.services.jwt_backends import JWT_BACKENDS, JwtError, \
+    create_jwt_backend
+
+KEY = 'secret'
+AUD = ISS = 'https://fawapp.com'
+# 2025-01-02 00:00:00 UTC
+NOW = 1735776000
+CLAIMS = {
+    'iss': ISS, 'aud': AUD, 'sub': 'dummy', 'email': 'admin@fawapp.com',
+    'iat': NOW, 'nbf': NOW, 'exp': NOW + 1800, 'is_refresh_token': False,
+}
+
+
+def _unsigned(claims: dict[str, object]) -> str:
+    def encode(data: dict[str, object]) -> str:
+        return base64.urlsafe_b64encode(
+            json.dumps(data).encode()).rstrip(b'=').decode()
+    return f"{encode({'alg': 'none', 'typ': 'JWT'})}.{encode(claims)}."
+
+
+@freeze_time('2025-01-02 00:00:00')
+@pytest.mark.parametrize('encoder', sorted(JWT_BACKENDS))
+@pytest.mark.parametrize('decoder', sorted(JWT_BACKENDS))
+@pytest.mark.parametrize('algorithm', ['HS256', 'HS512'])
+def test_decode__token_of_any_backend__returns_claims(
+        encoder: str, decoder: str, algorithm: str,
+) -> None:
+    """Tokens of every backend verify with every other one."""
+    token = create_jwt_backend(encoder).encode(CLAIMS, KEY, algorithm)
+
+    assert create_jwt_backend(decoder).decode(
+        token, KEY, algorithm, AUD, ISS) == CLAIMS
+
+
+@pytest.mark.parametrize('name', sorted(JWT_BACKENDS))
+def test_decode__invalid_token__raises(name: str) -> None:
+    """Forged, unsigned, expired and foreign tokens are rejected."""
+    backend = create_jwt_backend(name)
+    with freeze_time('2025-01-02 00:00:00'):
+        token = backend.encode(CLAIMS, KEY, 'HS256')
+        invalid = [
+            (token, 'other', 'HS256', AUD, ISS),
+            (token, KEY, 'HS512', AUD, ISS),
+            (token, KEY, 'HS256', 'https://other.com', ISS),
+            (token, KEY, 'HS256', AUD, 'https://other.com'),
+            (token[:-2] + 'xx', KEY, 'HS256', AUD, ISS),
+            (_unsigned(CLAIMS), KEY, 'HS256', AUD, ISS),
+            ('not a token', KEY, 'HS256', AUD, ISS),
+        ]
+        for args in invalid:
+            with pytest.raises(JwtError):
+                backend.decode(*args)
+
+    with freeze_time('2025-01-01 23:59:59'), pytest.raises(JwtError):
+        backend.decode(token, KEY, 'HS256', AUD, ISS)
+    with freeze_time('2025-01-02 00:30:01'), pytest.raises(JwtError):
+        backend.decode(token, KEY, 'HS256', AUD, ISS)
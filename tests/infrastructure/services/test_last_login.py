@@ -0,0 +1,61 @@
+"""Test cases for the write-behind last login recorder."""
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.config import get_settings_for_testing
+from app.domain.entities.user import User
+from app.infrastructure.database.database import Database
+from app.infrastructure.repositories.user_in_db import InDBUserRepository
+from app.infrastructure.services.last_login import \
+    WriteBehindLastLoginRecorder
+from app.infrastructure.services.metrics import InMemoryMetricsRecorder
+from tests.libs.mocks import add_user
+from tests.libs.utils import init_and_autocommit_session, define_cleanup, \
+    db_engine
+
+
+def _at(hour: int) -> datetime:
+    return datetime(2025, 1, 1, hour, tzinfo=timezone.utc)
+
+
+@pytest.mark.asyncio
+async def test_flush__queued_logins__latest_written_in_one_batch(
+        request: pytest.FixtureRequest,
+) -> None:
+    """The latest queued login of each user is written, never an older
+    one than stored."""
+    config = get_settings_for_testing()
+    with init_and_autocommit_session(config) as db_session:
+        add_user(db_session, uuid='dummy1', email='user1@fawapp.com')
+        add_user(db_session, uuid='dummy2', email='user2@fawapp.com',
+                 last_login=_at(12))
+        add_user(db_session, uuid='dummy3', email='user3@fawapp.com')
+    request.addfinalizer(define_cleanup(config))
+
+    db = Database(db_url=config.db_dsn)
+    metrics = InMemoryMetricsRecorder()
+    recorder = WriteBehindLastLoginRecorder(
+        db.session, InDBUserRepository.factory(config.get_now),
+        flush_interval_seconds=60, batch_size=2, metrics=metrics,
+    )
+    try:
+        recorder.record(1, _at(3))
+        recorder.record(1, _at(5))
+        recorder.record(1, _at(4))
+        recorder.record(2, _at(6))
+        assert metrics.snapshot()['gauges']['last_login.pending'] == 2
+
+        assert await recorder.flush() == 2
+        assert await recorder.flush() == 0
+    finally:
+        await db.get_engine().dispose()
+
+    with Session(bind=db_engine(config)) as db_session:
+        last_logins = dict(db_session.execute(
+            select(getattr(User, 'id'), getattr(User, 'last_login'))
+        ).tuples().all())
+    assert last_logins == {1: _at(5), 2: _at(12), 3: None}
+    assert metrics.snapshot()['counters']['last_login.flushed'] == 2
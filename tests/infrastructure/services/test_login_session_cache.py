@@ -0,0 +1,140 @@
+"""Test cases for the two-tier login session cache."""
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.domain.entities.login_session import LoginSession
+from app.infrastructure.services.key_value_store import InMemoryKeyValueStore
+from app.infrastructure.services.login_session_cache import \
+    TwoTierLoginSessionCache
+from app.infrastructure.services.metrics import InMemoryMetricsRecorder
+
+NOW = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+class _Clock:
+    """Monotonic clock and wall clock moved by hand."""
+
+    def __init__(self) -> None:
+        self.seconds = 0.0
+
+    def monotonic(self) -> float:
+        """Seconds elapsed."""
+        return self.seconds
+
+    def now(self) -> datetime:
+        """Wall clock time."""
+        return NOW + timedelta(seconds=self.seconds)
+
+
+def _session(session_id: str, expires_in_seconds: float) -> LoginSession:
+    return LoginSession(
+        id=session_id, user_id=1, user_uuid='dummy',
+        expires_at=NOW + timedelta(seconds=expires_in_seconds),
+    )
+
+
+def _cache(
+        clock: _Clock,
+        store: InMemoryKeyValueStore | None,
+        metrics: InMemoryMetricsRecorder,
+) -> TwoTierLoginSessionCache:
+    return TwoTierLoginSessionCache(
+        local_ttl_seconds=5, local_max_entries=2,
+        shared_store=store, shared_ttl_seconds=300,
+        metrics=metrics, get_now=clock.now, clock=clock.monotonic,
+    )
+
+
+@pytest.mark.asyncio
+async def test_get__after_local_ttl__served_by_shared_tier() -> None:
+    """A process without the session locally reads it from the shared tier
+    and caches it locally."""
+    clock = _Clock()
+    store = InMemoryKeyValueStore(clock.monotonic)
+    metrics = InMemoryMetricsRecorder()
+    cache = _cache(clock, store, metrics)
+    other_cache = _cache(clock, store, metrics)
+
+    await cache.set(_session('s1', 3600))
+    assert (await cache.get('s1')) is not None
+    clock.seconds = 10
+    session = await cache.get('s1')
+    assert session is not None and session.user_uuid == 'dummy'
+    assert session.expires_at == NOW + timedelta(seconds=3600)
+    assert (await other_cache.get('s1')) is not None
+
+    counters = metrics.snapshot()['counters']
+    assert counters['login_session_cache.local.hits'] == 1
+    assert counters['login_session_cache.shared.hits'] == 2
+
+
+@pytest.mark.asyncio
+async def test_get__session_expiring__not_served_after_expires_at() -> None:
+    """Neither tier keeps a session past its `expires_at`."""
+    clock = _Clock()
+    cache = _cache(clock, InMemoryKeyValueStore(clock.monotonic),
+                   InMemoryMetricsRecorder())
+
+    await cache.set(_session('s1', 2))
+    await cache.set(_session('expired', -1))
+    assert (await cache.get('s1')) is not None
+    assert (await cache.get('expired')) is None
+    clock.seconds = 2
+    assert (await cache.get('s1')) is None
+
+
+@pytest.mark.asyncio
+async def test_invalidate__both_tiers__not_cached_again() -> None:
+    """An invalidated session is dropped from both tiers, and a copy read
+    from the database before it was deleted is not cached again."""
+    clock = _Clock()
+    store = InMemoryKeyValueStore(clock.monotonic)
+    cache = _cache(clock, store, InMemoryMetricsRecorder())
+    stale = _session('s1', 3600)
+
+    await cache.set(stale)
+    await cache.invalidate('s1')
+    assert (await cache.get('s1')) is None
+
+    await cache.set(stale)
+    assert (await cache.get('s1')) is None
+    other_cache = _cache(clock, store, InMemoryMetricsRecorder())
+    await other_cache.set(stale)
+    assert (await other_cache.get('s1')) is None
+    clock.seconds = 10
+    assert (await cache.get('s1')) is None
+
+
+@pytest.mark.asyncio
+async def test_invalidate_local__shared_tier_kept() -> None:
+    """Only the local tier of the cache is dropped."""
+    clock = _Clock()
+    store = InMemoryKeyValueStore(clock.monotonic)
+    metrics = InMemoryMetricsRecorder()
+    cache = _cache(clock, store, metrics)
+
+    await cache.set(_session('s1', 3600))
+    cache.invalidate_local('s1')
+    assert (await cache.get('s1')) is not None
+
+    counters = metrics.snapshot()['counters']
+    assert counters['login_session_cache.shared.hits'] == 1
+    assert 'login_session_cache.local.hits' not in counters
+
+
+@pytest.mark.asyncio
+async def test_set__local_tier_full__least_recently_used_evicted() -> None:
+    """Without a shared tier, the local tier keeps the most recently used
+    sessions."""
+    clock = _Clock()
+    cache = _cache(clock, None, InMemoryMetricsRecorder())
+
+    await cache.set(_session('s1', 3600))
+    await cache.set(_session('s2', 3600))
+    assert (await cache.get('s1')) is not None
+    await cache.set(_session('s3', 3600))
+
+    assert (await cache.get('s1')) is not None
+    assert (await cache.get('s2')) is None
+    assert (await cache.get('s3')) is not None
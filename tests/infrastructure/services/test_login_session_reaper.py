@@ -0,0 +1,67 @@
+"""Test cases for the login session reaper."""
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.config import get_settings_for_testing
+from app.domain.entities.login_session import LoginSession
+from app.infrastructure.database.database import Database
+from app.infrastructure.repositories.login_session_in_db import \
+    InDBLoginSessionRepository
+from app.infrastructure.services.login_session_reaper import \
+    BatchedLoginSessionReaper
+from app.infrastructure.services.metrics import InMemoryMetricsRecorder
+from tests.libs.mocks import add_login_session, add_user
+from tests.libs.utils import init_and_autocommit_session, define_cleanup, \
+    db_engine
+
+NOW = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.mark.asyncio
+async def test_reap__ended_sessions__deleted_in_batches(
+        request: pytest.FixtureRequest,
+) -> None:
+    """Expired and logically deleted sessions are deleted, live ones are
+    kept, and expired ones are not found any more."""
+    config = get_settings_for_testing()
+    with init_and_autocommit_session(config) as db_session:
+        add_user(db_session, uuid='dummy', email='user@fawapp.com')
+        add_login_session(
+            db_session, id='live', user_id=1, user_uuid='dummy',
+            expires_at=datetime(2025, 1, 2, tzinfo=timezone.utc))
+        add_login_session(
+            db_session, id='deleted', user_id=1, user_uuid='dummy',
+            deleted_at=datetime(2024, 12, 31, tzinfo=timezone.utc))
+        for i in range(4):
+            add_login_session(
+                db_session, id=f'expired{i}', user_id=1, user_uuid='dummy',
+                expires_at=datetime(2024, 12, 31, i, tzinfo=timezone.utc))
+    request.addfinalizer(define_cleanup(config))
+
+    db = Database(db_url=config.db_dsn)
+    repository_factory = InDBLoginSessionRepository.factory(lambda: NOW)
+    metrics = InMemoryMetricsRecorder()
+    reaper = BatchedLoginSessionReaper(
+        db.session, repository_factory,
+        interval_seconds=60, batch_size=2, batch_pause_seconds=0,
+        metrics=metrics,
+    )
+    try:
+        async with db.session() as db_session:
+            repository = repository_factory(db_session)
+            assert (await repository.get_by_id('live')) is not None
+            assert (await repository.get_by_id('expired0')) is None
+
+        assert await reaper.reap() == 5
+        assert await reaper.reap() == 0
+    finally:
+        await db.get_engine().dispose()
+
+    with Session(bind=db_engine(config)) as db_session:
+        remaining = db_session.execute(
+            select(getattr(LoginSession, 'id'))).scalars().all()
+    assert remaining == ['live']
+    assert metrics.snapshot()['counters']['login_session_reaper.deleted'] == 5
@@ -0,0 +1,39 @@
+"""Test cases for the password hasher."""
+import importlib.util
+
+import pytest
+
+from app.infrastructure.services.password_hasher import ARGON2, \
+    PasslibPasswordHasher
+
+
+def test_verify_and_update__current_hash__no_rehash() -> None:
+    """A hash with the current parameters is kept."""
+    hasher = PasslibPasswordHasher(bcrypt_rounds=4)
+    password_hash = hasher.hash('password')
+    assert password_hash.startswith('$2b$04$')
+
+    assert hasher.verify_and_update('password', password_hash) == \
+        (True, None)
+    assert hasher.verify_and_update('wrong', password_hash) == (False, None)
+
+
+def test_verify_and_update__other_cost__rehashes() -> None:
+    """A valid password with a hash of another cost gets a new hash."""
+    old_hash = PasslibPasswordHasher(bcrypt_rounds=5).hash('password')
+    hasher = PasslibPasswordHasher(bcrypt_rounds=4)
+
+    valid, new_hash = hasher.verify_and_update('password', old_hash)
+    assert valid
+    assert new_hash is not None and new_hash.startswith('$2b$04$')
+    assert hasher.verify_and_update('password', new_hash) == (True, None)
+    assert hasher.verify_and_update('wrong', old_hash) == (False, None)
+
+
+@pytest.mark.skipif(importlib.util.find_spec('argon2') is not None,
+                    reason='argon2-cffi is installed')
+def test_init__scheme_not_installed__raises() -> None:
+    """A scheme without its library fails on construction, not on the first
+    hash."""
+    with pytest.raises(ValueError):
+        PasslibPasswordHasher(scheme=ARGON2)
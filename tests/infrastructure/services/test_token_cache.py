@@ -0,0 +1,82 @@
+"""Test cases for the verified token cache."""
+import time
+from datetime import datetime, timezone
+
+import pytest
+from freezegun import freeze_time
+
+from app.application.exc import Unauthorized
+from app.domain.factories.token_auth import JwtPayloadFactory
+from app.infrastructure.services.jwt_backends import StdlibJwtBackend
+from app.infrastructure.services.metrics import InMemoryMetricsRecorder
+from app.infrastructure.services.token_auth import JwtTokenServiceImpl
+from app.infrastructure.services.token_cache import CachingJwtTokenService
+
+ISSUER = 'https://fawapp.com'
+
+
+def _services(
+        max_entries: int,
+) -> tuple[JwtTokenServiceImpl, CachingJwtTokenService,
+           InMemoryMetricsRecorder]:
+    jwt_token_service = JwtTokenServiceImpl(
+        'secret', 'HS256', ISSUER, ISSUER, StdlibJwtBackend())
+    metrics = InMemoryMetricsRecorder()
+    return jwt_token_service, CachingJwtTokenService(
+        jwt_token_service, max_entries, metrics,
+        # Looked up on each call, so that freezegun applies.
+        clock=lambda: time.time(),  # pylint: disable=unnecessary-lambda
+    ), metrics
+
+
+def _token(jwt_token_service: JwtTokenServiceImpl, sub: str) -> str:
+    payload_factory = JwtPayloadFactory(
+        ISSUER, ISSUER, 30, 60,
+        lambda: datetime.now(timezone.utc))
+    return jwt_token_service.create_token(
+        payload_factory(sub, f'{sub}@fawapp.com'))
+
+
+@freeze_time('2025-01-01 00:00:00')
+def test_verify_token__same_token__verified_once() -> None:
+    """A token is verified on its first use only."""
+    jwt_token_service, cache, metrics = _services(max_entries=10)
+    token = _token(jwt_token_service, 'dummy')
+
+    payloads = [cache.verify_token(token) for _ in range(3)]
+
+    assert {payload.sub for payload in payloads} == {'dummy'}
+    counters = metrics.snapshot()['counters']
+    assert counters['access_token_cache.misses'] == 1
+    assert counters['access_token_cache.hits'] == 2
+
+
+def test_verify_token__expired_on_hit__rejected() -> None:
+    """A cached token is rejected once its `exp` has passed."""
+    jwt_token_service, cache, _ = _services(max_entries=10)
+    with freeze_time('2025-01-01 00:00:00'):
+        token = _token(jwt_token_service, 'dummy')
+        cache.verify_token(token)
+    with freeze_time('2025-01-01 00:30:00'):
+        assert cache.verify_token(token).sub == 'dummy'
+    with freeze_time('2025-01-01 00:30:01'), pytest.raises(Unauthorized):
+        cache.verify_token(token)
+
+
+@freeze_time('2025-01-01 00:00:00')
+def test_verify_token__full__least_recently_used_evicted() -> None:
+    """The cache holds at most `max_entries` payloads, and forged tokens
+    are never cached."""
+    jwt_token_service, cache, metrics = _services(max_entries=1)
+    first = _token(jwt_token_service, 'first')
+    second = _token(jwt_token_service, 'second')
+
+    cache.verify_token(first)
+    cache.verify_token(second)
+    cache.verify_token(first)
+    with pytest.raises(Unauthorized):
+        cache.verify_token(first[:-2] + 'xx')
+
+    counters = metrics.snapshot()['counters']
+    assert counters['access_token_cache.misses'] == 4
+    assert 'access_token_cache.hits' not in counters
@@ -0,0 +1,118 @@
+"""Test cases for the asymmetric token signing keys."""
+from datetime import datetime, timezone
+from pathlib import Path
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ed25519, rsa
+from freezegun import freeze_time
+
+from app.application.exc import Unauthorized
+from app.domain.factories.token_auth import JwtPayloadFactory
+from app.infrastructure.services.jwt_backends import create_jwt_backend
+from app.infrastructure.services.token_auth import JwtTokenServiceImpl
+from app.infrastructure.services.token_keys import TokenKeyRing
+
+ISSUER = 'https://fawapp.com'
+
+
+def _key_file(tmp_path: Path, kid: str, algorithm: str,
+              public_only: bool = False) -> str:
+    private_key = rsa.generate_private_key(65537, 2048) \
+        if algorithm == 'RS256' else ed25519.Ed25519PrivateKey.generate()
+    if public_only:
+        pem = private_key.public_key().public_bytes(
+            serialization.Encoding.PEM,
+            serialization.PublicFormat.SubjectPublicKeyInfo)
+    else:
+        pem = private_key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption())
+    path = tmp_path / f'{kid}.pem'
+    path.write_bytes(pem)
+    return str(path)
+
+
+def _service(algorithm: str, backend: str,
+             key_ring: TokenKeyRing) -> JwtTokenServiceImpl:
+    return JwtTokenServiceImpl(
+        'unused', algorithm, ISSUER, ISSUER, create_jwt_backend(backend),
+        key_ring)
+
+
+def _token(service: JwtTokenServiceImpl) -> str:
+    payload_factory = JwtPayloadFactory(
+        ISSUER, ISSUER, 30, 60, lambda: datetime.now(timezone.utc))
+    return service.create_token(payload_factory('dummy', 'dummy@fawapp.com'))
+
+
+@freeze_time('2025-01-02 00:00:00')
+@pytest.mark.parametrize('algorithm,backend', [
+    ('RS256', 'pyjwt'), ('RS256', 'jose'), ('EdDSA', 'pyjwt'),
+])
+def test_verify_token__rotated_key__old_tokens_still_verify(
+        tmp_path: Path, algorithm: str, backend: str,
+) -> None:
+    """Tokens of the previous signing key verify until it is dropped."""
+    key_files = {'k1': _key_file(tmp_path, 'k1', algorithm)}
+    old_token = _token(_service(
+        algorithm, backend,
+        TokenKeyRing.from_files(algorithm, key_files, 'k1')))
+    assert jwt.get_unverified_header(old_token)['kid'] == 'k1'
+
+    key_files['k2'] = _key_file(tmp_path, 'k2', algorithm)
+    rotated = _service(
+        algorithm, backend,
+        TokenKeyRing.from_files(algorithm, key_files, 'k2'))
+    new_token = _token(rotated)
+
+    assert jwt.get_unverified_header(new_token)['kid'] == 'k2'
+    assert rotated.verify_token(old_token).sub == 'dummy'
+    assert rotated.verify_token(new_token).sub == 'dummy'
+
+    del key_files['k1']
+    dropped = _service(
+        algorithm, backend,
+        TokenKeyRing.from_files(algorithm, key_files, 'k2'))
+    with pytest.raises(Unauthorized):
+        dropped.verify_token(old_token)
+    assert dropped.verify_token(new_token).sub == 'dummy'
+
+
+@freeze_time('2025-01-02 00:00:00')
+@pytest.mark.parametrize('algorithm', ['RS256', 'EdDSA'])
+def test_jwks__public_keys__verify_tokens(
+        tmp_path: Path, algorithm: str) -> None:
+    """The JWKS holds every public key, and no private one."""
+    key_ring = TokenKeyRing.from_files(algorithm, {
+        'new': _key_file(tmp_path, 'new', algorithm),
+        'old': _key_file(tmp_path, 'old', algorithm, public_only=True),
+    }, 'new')
+    token = _token(_service(algorithm, 'pyjwt', key_ring))
+
+    jwks = key_ring.jwks()
+
+    assert [key['kid'] for key in jwks['keys']] == ['new', 'old']
+    assert all('d' not in key for key in jwks['keys'])
+    key = jwt.PyJWKSet.from_dict(jwks)['new']
+    assert jwt.decode(token, key.key, algorithms=[algorithm],
+                      audience=ISSUER)['sub'] == 'dummy'
+
+
+def test_token_key_ring__invalid_keys__raises(tmp_path: Path) -> None:
+    """Keys must suit the algorithm, and the signing key must be private."""
+    with pytest.raises(ValueError):
+        TokenKeyRing.from_files(
+            'RS256', {'k1': _key_file(tmp_path, 'k1', 'EdDSA')}, 'k1')
+    with pytest.raises(ValueError):
+        TokenKeyRing.from_files('RS256', {
+            'k1': _key_file(tmp_path, 'k1', 'RS256', public_only=True),
+        }, 'k1')
+    with pytest.raises(ValueError):
+        _service('RS256', 'pyjwt', TokenKeyRing([], ''))
+    with pytest.raises(ValueError):
+        _service('EdDSA', 'stdlib', TokenKeyRing([], ''))
+
+    assert TokenKeyRing.from_files('HS256', {}, '').jwks() == {'keys': []}
@@ -0,0 +1,57 @@
+"""Test cases for the bounded worker pool."""
+import asyncio
+import threading
+
+import pytest
+
+from app.application.exc import ServiceBusy
+from app.infrastructure.services.metrics import InMemoryMetricsRecorder
+from app.infrastructure.services.worker_pool import BoundedWorkerPool
+
+
+@pytest.mark.asyncio
+async def test_run__bounded_concurrency__runs_off_the_loop() -> None:
+    """Calls beyond `max_workers` wait, and none runs on the loop thread."""
+    metrics = InMemoryMetricsRecorder()
+    pool = BoundedWorkerPool('test_pool', 2, 5.0, metrics)
+    lock = threading.Lock()
+    running = [0, 0]  # current, max
+    loop_thread = threading.get_ident()
+
+    def work(value: int) -> int:
+        assert threading.get_ident() != loop_thread
+        with lock:
+            running[0] += 1
+            running[1] = max(running[1], running[0])
+        threading.Event().wait(0.05)
+        with lock:
+            running[0] -= 1
+        return value * 2
+
+    results = await asyncio.gather(*(pool.run(work, i) for i in range(6)))
+    pool.shutdown()
+
+    assert results == [0, 2, 4, 6, 8, 10]
+    assert running[1] == 2
+    snapshot = metrics.snapshot()
+    assert snapshot['gauges']['test_pool.queue_depth'] == 0
+    assert snapshot['summaries']['test_pool.wait_ms']['count'] == 6
+    assert snapshot['summaries']['test_pool.wait_ms']['max'] > 0
+
+
+@pytest.mark.asyncio
+async def test_run__queue_timeout__raises_service_busy() -> None:
+    """Calls that wait longer than the queue timeout are rejected."""
+    metrics = InMemoryMetricsRecorder()
+    pool = BoundedWorkerPool('test_pool', 1, 0.01, metrics)
+    release = threading.Event()
+
+    busy = asyncio.ensure_future(pool.run(release.wait, 5))
+    await asyncio.sleep(0.01)
+    with pytest.raises(ServiceBusy):
+        await pool.run(int, '1')
+    release.set()
+    assert await busy is True
+    pool.shutdown()
+
+    assert metrics.snapshot()['counters']['test_pool.rejected'] == 1
@@ -0,0 +1,80 @@
+"""Test cases for the OpenAPI document controllers."""
+import gzip
+import json
+from pathlib import Path
+from typing import AsyncGenerator
+
+import pytest
+import pytest_asyncio
+from fastapi import FastAPI
+from httpx import AsyncClient, ASGITransport
+
+from app.interfaces.controllers.openapi import include_openapi_routes
+from app.interfaces.views.openapi_document import OpenApiDocument
+
+
+@pytest_asyncio.fixture(scope='function')
+async def client(tmp_path: Path) -> AsyncGenerator[AsyncClient, None]:
+    """Test client fixture serving a prebuilt document."""
+    OpenApiDocument.from_schema({'openapi': '3.1.0', 'prebuilt': True}).save(
+        tmp_path / 'openapi.json')
+    app = FastAPI(openapi_url=None, docs_url=None, redoc_url=None)
+    include_openapi_routes(
+        app, 'test', schema_path=str(tmp_path / 'openapi.json'),
+        runtime_fallback=False,
+    )
+    async with AsyncClient(transport=ASGITransport(app=app),
+                           base_url='http://test') as client_:
+        yield client_
+
+
+@pytest.mark.asyncio
+async def test_openapi__prebuilt__served_precompressed(
+        client: AsyncClient,  # pylint: disable=redefined-outer-name
+) -> None:
+    """Test the prebuilt document, its gzip variant and revalidation."""
+    response = await client.get(
+        '/openapi.json', headers={'Accept-Encoding': 'identity'})
+    assert response.status_code == 200
+    assert response.json() == {'openapi': '3.1.0', 'prebuilt': True}
+    etag = response.headers['etag']
+
+    async with client.stream(
+            'GET', '/openapi.json',
+            headers={'Accept-Encoding': 'gzip'}) as response:
+        raw = b''.join([chunk async for chunk in response.aiter_raw()])
+    assert response.headers['content-encoding'] == 'gzip'
+    assert response.headers['etag'] == f'W/{etag}'
+    assert json.loads(gzip.decompress(raw)) == {
+        'openapi': '3.1.0', 'prebuilt': True}
+
+    response = await client.get(
+        '/openapi.json', headers={'If-None-Match': etag})
+    assert response.status_code == 304
+
+    response = await client.get('/docs')
+    assert response.status_code == 200
+    assert '/openapi.json' in response.text
+
+
+def test_openapi__missing_without_fallback__raises(tmp_path: Path) -> None:
+    """Test that a missing document fails when runtime generation is off."""
+    with pytest.raises(FileNotFoundError):
+        include_openapi_routes(
+            FastAPI(), 'test', schema_path=str(tmp_path / 'openapi.json'),
+            runtime_fallback=False,
+        )
+
+
+@pytest.mark.asyncio
+async def test_openapi__runtime_fallback__generates_schema() -> None:
+    """Test the runtime generation of the application document."""
+    app = FastAPI(openapi_url=None, docs_url=None, redoc_url=None)
+    include_openapi_routes(app, 'test', schema_path='', runtime_fallback=True)
+    async with AsyncClient(transport=ASGITransport(app=app),
+                           base_url='http://test') as client_:
+        response = await client_.get('/openapi.json')
+
+    assert response.status_code == 200
+    assert response.json()['info']['title'] == 'test API'
+    assert '/api/v1/public/sample-items' in response.json()['paths']
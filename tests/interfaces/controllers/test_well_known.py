@@ -0,0 +1,46 @@
+"""Test cases for the well-known URI controllers."""
+from typing import AsyncGenerator
+
+import pytest
+import pytest_asyncio
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ed25519
+from dependency_injector import providers
+from httpx import AsyncClient, ASGITransport
+
+from app.infrastructure.services.token_keys import TokenKey, TokenKeyRing
+from app.main import app
+
+
+@pytest_asyncio.fixture(scope='function')
+async def client() -> AsyncGenerator[AsyncClient, None]:
+    """Test client fixture with an EdDSA key ring."""
+    pem = ed25519.Ed25519PrivateKey.generate().private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption())
+    key_ring = TokenKeyRing([TokenKey.from_pem('k1', 'EdDSA', pem)], 'k1')
+    container = app.container  # type: ignore
+    with container.token_key_ring.override(providers.Object(key_ring)):
+        async with AsyncClient(transport=ASGITransport(app=app),
+                               base_url='http://test') as client_:
+            yield client_
+
+
+@pytest.mark.asyncio
+async def test_jwks__public_and_cacheable(
+        client: AsyncClient,  # pylint: disable=redefined-outer-name
+) -> None:
+    """The JWKS is served without credentials, cached and revalidated."""
+    response = await client.get('/.well-known/jwks.json')
+
+    assert response.status_code == 200
+    assert response.headers['cache-control'] == 'public, max-age=300'
+    [key] = response.json()['keys']
+    assert key['kid'] == 'k1'
+    assert key['kty'] == 'OKP'
+
+    response = await client.get(
+        '/.well-known/jwks.json',
+        headers={'If-None-Match': response.headers['etag']})
+    assert response.status_code == 304
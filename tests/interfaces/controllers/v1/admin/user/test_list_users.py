@@ -29,6 +29,9 @@ async def client(request: pytest.FixtureRequest) -> AsyncGenerator[
         )
 
     request.addfinalizer(define_cleanup(config))
+    # The session IDs are reused by every test, drop the cached sessions of
+    # the previous one.
+    app.container.login_session_cache().clear()  # type: ignore
 
     async with AsyncClient(transport=ASGITransport(app=app),
                            base_url='http://test') as client_:
@@ -0,0 +1,190 @@
+"""Test case for the related entities included with admin users."""
+from typing import Any, AsyncGenerator, Iterator
+
+import pytest
+import pytest_asyncio
+from fastapi_pagination import Page
+from httpx import AsyncClient, ASGITransport
+from sqlalchemy import Engine, event
+
+from app.application.dto.user import UserReadDto, UserReadDtoWithRelated, \
+    UserReadDtoWithPermissions
+from app.config import get_settings_for_testing
+from app.main import app
+from tests.libs.mocks import add_user, add_login_session, add_role, \
+    add_permission, add_user_role, add_role_permission, \
+    DUMMY_SESSION_ID1, add_default_super_user
+from tests.libs.utils import init_and_autocommit_session, define_cleanup, \
+    API_BASE, fastapi_json_body
+
+
+@pytest_asyncio.fixture(scope='function')
+async def client(request: pytest.FixtureRequest) -> AsyncGenerator[
+    AsyncClient, None]:
+    """Test client fixture."""
+    config = get_settings_for_testing()
+
+    with init_and_autocommit_session(config) as db_session:
+        add_default_super_user(db_session)
+        add_login_session(
+            db_session, id=DUMMY_SESSION_ID1,
+            user_id=1, user_uuid='dummy',
+        )
+        for i in range(2, 7):
+            add_user(db_session, uuid=f'dummy{i}',
+                     email=f'user{i}@fawapp.com')
+        add_role(db_session, name='admin')
+        add_role(db_session, name='user')
+        add_permission(db_session, name='admin:read')
+        add_permission(db_session, name='admin:write')
+        db_session.flush()
+        add_user_role(db_session, user_id=2, role_id=1)
+        for i in range(2, 7):
+            add_user_role(db_session, user_id=i, role_id=2)
+        add_role_permission(db_session, role_id=1, permission_id=1)
+        add_role_permission(db_session, role_id=1, permission_id=2)
+
+    request.addfinalizer(define_cleanup(config))
+    # The session IDs are reused by every test, drop the cached sessions of
+    # the previous one.
+    app.container.login_session_cache().clear()  # type: ignore
+
+    async with AsyncClient(transport=ASGITransport(app=app),
+                           base_url='http://test') as client_:
+        yield client_
+
+
+@pytest.fixture
+def statements() -> Iterator[list[str]]:
+    """Statements executed on the database while the test runs."""
+    executed: list[str] = []
+
+    def before_cursor_execute(*args: Any) -> None:
+        executed.append(args[2])
+
+    event.listen(Engine, 'before_cursor_execute', before_cursor_execute)
+    yield executed
+    event.remove(Engine, 'before_cursor_execute', before_cursor_execute)
+
+
+@pytest.mark.asyncio
+async def test_list_users__include_permissions__returns_nested(
+        client: AsyncClient,  # pylint: disable=redefined-outer-name
+) -> None:
+    """Roles and their permissions are read with each user."""
+    client.cookies.set('session', DUMMY_SESSION_ID1)
+    response = await client.get(
+        f'{API_BASE}/admin/users/',
+        params={'include': 'roles,permissions',
+                'email__eq': 'user2@fawapp.com'},
+    )
+    assert response.status_code == 200
+    [user] = response.json()['items']
+    roles = sorted(user['roles'], key=lambda role: role['id'])
+    assert [role['name'] for role in roles] == ['admin', 'user']
+    assert sorted(p['name'] for p in roles[0]['permissions']) == \
+        ['admin:read', 'admin:write']
+    assert roles[1]['permissions'] == []
+
+
+@pytest.mark.asyncio
+async def test_list_users__include_roles__omits_permissions(
+        client: AsyncClient,  # pylint: disable=redefined-outer-name
+) -> None:
+    """Roles are read without permissions, and nothing by default."""
+    client.cookies.set('session', DUMMY_SESSION_ID1)
+    response = await client.get(
+        f'{API_BASE}/admin/users/', params={'include': 'roles'})
+    assert response.status_code == 200
+    items = response.json()['items']
+    role_counts = {item['uuid']: len(item['roles']) for item in items}
+    assert role_counts == {
+        'dummy': 0, 'dummy2': 2, 'dummy3': 1, 'dummy4': 1, 'dummy5': 1,
+        'dummy6': 1,
+    }
+    assert all('permissions' not in role
+               for item in items for role in item['roles'])
+
+    response = await client.get(f'{API_BASE}/admin/users/')
+    assert all('roles' not in item for item in response.json()['items'])
+
+
+@pytest.mark.asyncio
+async def test_list_users__include__fixed_query_count(
+        client: AsyncClient,  # pylint: disable=redefined-outer-name
+        statements: list[str],  # pylint: disable=redefined-outer-name
+) -> None:
+    """A page issues the same number of queries whatever its size."""
+    client.cookies.set('session', DUMMY_SESSION_ID1)
+    # Cache the login session, only the page queries are counted.
+    await client.get(f'{API_BASE}/admin/users/')
+    counts = []
+    for size in (1, 5):
+        statements.clear()
+        response = await client.get(
+            f'{API_BASE}/admin/users/',
+            params={'include': 'roles,permissions', 'size': size,
+                    'email__like': 'user%'},
+        )
+        assert response.status_code == 200
+        assert len(response.json()['items']) == size
+        counts.append(len(statements))
+    assert counts[0] == counts[1]
+
+
+@pytest.mark.asyncio
+async def test_list_users__unknown_include__returns_422(
+        client: AsyncClient,  # pylint: disable=redefined-outer-name
+) -> None:
+    """Unsupported includes are rejected."""
+    client.cookies.set('session', DUMMY_SESSION_ID1)
+    response = await client.get(
+        f'{API_BASE}/admin/users/', params={'include': 'roles,sessions'})
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_get_user__include_permissions__returns_nested(
+        client: AsyncClient,  # pylint: disable=redefined-outer-name
+) -> None:
+    """A single user is read with its roles and permissions."""
+    client.cookies.set('session', DUMMY_SESSION_ID1)
+    response = await client.get(
+        f'{API_BASE}/admin/users/dummy2',
+        params={'include': 'permissions'},
+    )
+    assert response.status_code == 200
+    roles = sorted(response.json()['roles'], key=lambda role: role['id'])
+    assert [len(role['permissions']) for role in roles] == [2, 0]
+
+    response = await client.get(f'{API_BASE}/admin/users/dummy2')
+    assert response.status_code == 200
+    assert 'roles' not in response.json()
+
+    response = await client.get(f'{API_BASE}/admin/users/missing')
+    assert response.status_code == 404
+
+
+@pytest.mark.parametrize(
+    'include, response_model',
+    [
+        (None, Page[UserReadDto]),
+        ('roles', Page[UserReadDtoWithRelated]),
+        ('roles,permissions', Page[UserReadDtoWithPermissions]),
+    ],
+)
+@pytest.mark.asyncio
+async def test_list_users__body__same_as_response_model(
+        client: AsyncClient,  # pylint: disable=redefined-outer-name
+        include: str | None,
+        response_model: type,
+) -> None:
+    """Every include variant of the page is serialized to the same bytes
+    FastAPI renders through its response model."""
+    client.cookies.set('session', DUMMY_SESSION_ID1)
+    params = {'include': include} if include is not None else {}
+    response = await client.get(f'{API_BASE}/admin/users/', params=params)
+    assert response.status_code == 200
+    assert response.json()['total'] == 6
+    assert response.content == fastapi_json_body(
+        response_model, response.content)
@@ -0,0 +1,105 @@
+"""Test cases for fetching many sample items at once."""
+from datetime import datetime, timezone
+from typing import Any, AsyncGenerator, Iterator
+
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient, ASGITransport
+from sqlalchemy import Engine, event
+
+from app.application.dto.sample_item import BATCH_GET_MAX_IDS
+from app.config import get_settings_for_testing
+from app.main import app
+from tests.libs.mocks import add_sample_item
+from tests.libs.utils import API_BASE, init_and_autocommit_session, \
+    define_cleanup
+
+
+@pytest_asyncio.fixture(scope='function')
+async def client(request: pytest.FixtureRequest) -> AsyncGenerator[
+    AsyncClient, None]:
+    """Test client fixture."""
+    config = get_settings_for_testing()
+
+    with init_and_autocommit_session(config) as db_session:
+        add_sample_item(db_session, uuid='dummy1', name='Sample item 1',
+                        description='1')
+        add_sample_item(db_session, uuid='dummy2', name='Sample item 2',
+                        description='22')
+        add_sample_item(db_session, uuid='dummy3', name='Sample item 3',
+                        deleted_at=datetime(2025, 1, 1, tzinfo=timezone.utc))
+
+    request.addfinalizer(define_cleanup(config))
+
+    async with AsyncClient(transport=ASGITransport(app=app),
+                           base_url='http://test') as client_:
+        yield client_
+
+
+@pytest.fixture
+def statements() -> Iterator[list[str]]:
+    """Statements executed on the database while the test runs."""
+    executed: list[str] = []
+
+    def before_cursor_execute(*args: Any) -> None:
+        executed.append(args[2])
+
+    event.listen(Engine, 'before_cursor_execute', before_cursor_execute)
+    yield executed
+    event.remove(Engine, 'before_cursor_execute', before_cursor_execute)
+
+
+@pytest.mark.asyncio
+async def test_batch_get_by_uuid__returns_request_order(
+        client: AsyncClient,  # pylint: disable=redefined-outer-name
+        statements: list[str],  # pylint: disable=redefined-outer-name
+) -> None:
+    """Results follow the request, with markers for missing items."""
+    ids = ['dummy2', 'missing', 'dummy1', 'dummy3', 'dummy2']
+    response = await client.post(
+        f'{API_BASE}/public/sample-items-by-uuid/batch-get',
+        json={'ids': ids},
+    )
+    assert response.status_code == 200
+    items = response.json()['items']
+    assert [item['id'] for item in items] == ids
+    assert [item['found'] for item in items] == \
+        [True, False, True, False, True]
+    assert [(item['item'] or {}).get('name') for item in items] == [
+        'Sample item 2', None, 'Sample item 1', None, 'Sample item 2']
+    assert 'meta_data' not in items[0]['item']
+
+    selects = [s for s in statements if 'FROM sample_items' in s]
+    assert len(selects) == 1
+    assert '= ANY (' in selects[0]
+
+
+@pytest.mark.asyncio
+async def test_batch_get_by_id__with_meta__returns_meta(
+        client: AsyncClient,  # pylint: disable=redefined-outer-name
+) -> None:
+    """Batch get by ID supports `with_meta`."""
+    response = await client.post(
+        f'{API_BASE}/public/sample-items/batch-get',
+        params={'with_meta': True},
+        json={'ids': [2, 99, 1]},
+    )
+    assert response.status_code == 200
+    items = response.json()['items']
+    assert [item['id'] for item in items] == [2, 99, 1]
+    assert items[0]['item']['meta_data'] == {
+        'name_length': 13, 'description_length': 2}
+    assert items[1] == {'id': 99, 'found': False, 'item': None}
+    assert items[2]['item']['meta_data'] == {
+        'name_length': 13, 'description_length': 1}
+
+
+@pytest.mark.asyncio
+async def test_batch_get__too_many_or_no_ids__returns_422(
+        client: AsyncClient,  # pylint: disable=redefined-outer-name
+) -> None:
+    """The number of IDs is bounded."""
+    for ids in ([], list(range(1, BATCH_GET_MAX_IDS + 2))):
+        response = await client.post(
+            f'{API_BASE}/public/sample-items/batch-get', json={'ids': ids})
+        assert response.status_code == 422
@@ -0,0 +1,155 @@
+"""Test cases for ETag and conditional GET of sample items."""
+from typing import AsyncGenerator
+
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient, ASGITransport
+from sqlalchemy.orm import Session
+
+from app.config import get_settings_for_testing
+from app.main import app
+from tests.libs.mocks import add_sample_item
+from tests.libs.utils import API_BASE, init_and_autocommit_session, \
+    define_cleanup, db_engine
+
+
+@pytest_asyncio.fixture(scope='function')
+async def client(request: pytest.FixtureRequest) -> AsyncGenerator[
+    AsyncClient, None]:
+    """Test client fixture."""
+    config = get_settings_for_testing()
+
+    with init_and_autocommit_session(config) as db_session:
+        add_sample_item(
+            db_session,
+            uuid='dummy', name='Sample item 1', description='1',
+        )
+
+    request.addfinalizer(define_cleanup(config))
+
+    async with AsyncClient(transport=ASGITransport(app=app),
+                           base_url='http://test') as client_:
+        yield client_
+
+
+@pytest.mark.parametrize(
+    'url',
+    [
+        f'{API_BASE}/public/sample-items/1',
+        f'{API_BASE}/public/sample-items-by-uuid/dummy',
+    ],
+)
+@pytest.mark.asyncio
+async def test_get_sample_item__if_none_match__returns_not_modified(
+        client: AsyncClient,  # pylint: disable=redefined-outer-name
+        url: str,
+) -> None:
+    """Test conditional get of a single sample item."""
+    response = await client.get(url)
+    assert response.status_code == 200
+    etag = response.headers['etag']
+    assert etag.startswith('"')
+
+    response = await client.get(url, headers={'If-None-Match': etag})
+    assert response.status_code == 304
+    assert response.headers['etag'] == etag
+    assert response.content == b''
+
+    # Another representation of the same entity has another ETag.
+    response = await client.get(
+        url, params={'with_meta': True}, headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    assert response.headers['etag'] != etag
+
+    response = await client.put(
+        f'{API_BASE}/public/sample-items/1', json={'name': 'Updated'})
+    assert response.status_code == 200
+
+    response = await client.get(url, headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    assert response.headers['etag'] != etag
+
+
+@pytest.mark.asyncio
+async def test_list_sample_items__if_none_match__returns_not_modified(
+        client: AsyncClient,  # pylint: disable=redefined-outer-name
+) -> None:
+    """Test conditional get of a sample item list page."""
+    url = f'{API_BASE}/public/sample-items'
+    response = await client.get(url)
+    assert response.status_code == 200
+    etag = response.headers['etag']
+
+    response = await client.get(url, headers={'If-None-Match': etag})
+    assert response.status_code == 304
+    assert response.headers['etag'] == etag
+
+    response = await client.get(
+        url, headers={'If-None-Match': f'"other", W/{etag}'})
+    assert response.status_code == 304
+
+    response = await client.post(url, json={
+        'name': 'Sample item 2', 'description': '2'})
+    assert response.status_code == 201
+
+    response = await client.get(url, headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    assert response.json()['total'] == 2
+    assert response.headers['etag'] != etag
+
+
+@pytest.mark.asyncio
+async def test_list_sample_items__insert_on_other_page__etag_changes(
+        client: AsyncClient,  # pylint: disable=redefined-outer-name
+) -> None:
+    """The ETag of a page covers its total, which rows of other pages
+    change."""
+    url = f'{API_BASE}/public/sample-items'
+    params = {'id__asc': True, 'size': 1}
+    response = await client.get(url, params=params)
+    assert response.status_code == 200
+    etag = response.headers['etag']
+
+    with Session(bind=db_engine(get_settings_for_testing())) as db_session:
+        add_sample_item(
+            db_session,
+            uuid='dummy2', name='Sample item 2', description='2',
+        )
+        db_session.commit()
+
+    response = await client.get(
+        url, params=params, headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    assert [item['name'] for item in response.json()['items']] == [
+        'Sample item 1']
+    assert response.json()['total'] == 2
+    assert response.headers['etag'] != etag
+
+
+@pytest.mark.parametrize('with_meta', [False, True])
+@pytest.mark.asyncio
+async def test_list_sample_items__not_modified__rows_not_transformed(
+        client: AsyncClient,  # pylint: disable=redefined-outer-name
+        monkeypatch: pytest.MonkeyPatch,
+        with_meta: bool,
+) -> None:
+    """A matching page is answered with 304 before its rows are converted
+    to DTOs, with the list cache off."""
+    url = f'{API_BASE}/public/sample-items'
+    params = {'with_meta': with_meta}
+    response = await client.get(url, params=params)
+    assert response.status_code == 200
+    etag = response.headers['etag']
+
+    def fail(*args: object) -> None:
+        raise AssertionError('rows transformed')
+
+    for name in ('sample_item_list_transformer',
+                 'sample_item_with_meta_list_transformer'):
+        monkeypatch.setattr(
+            f'app.interfaces.controllers.v1.public.sample_item.{name}',
+            fail)
+    response = await client.get(
+        url, params=params, headers={'If-None-Match': etag})
+    assert response.status_code == 304
+    assert response.headers['etag'] == etag
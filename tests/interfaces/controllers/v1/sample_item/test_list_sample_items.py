@@ -5,13 +5,18 @@ from typing import AsyncGenerator
 
 import pytest
 import pytest_asyncio
+from fastapi_pagination import Page
 from httpx import AsyncClient, ASGITransport
+from sqlalchemy.orm import Session
 
+from app.application.dto.sample_item import SampleItemReadDto, \
+    SampleItemReadDtoWithMeta
 from app.config import get_settings_for_testing
 from app.main import app
 from tests.libs.mocks import add_sample_item
 from tests.libs.utils import API_BASE, mock_overwrite_datetime, \
-    init_and_autocommit_session, define_cleanup
+    init_and_autocommit_session, define_cleanup, db_engine, \
+    fastapi_json_body
 
 
 @pytest_asyncio.fixture(scope='function')
@@ -59,3 +64,74 @@ async def test_list_sample_items__verify_ok__returns_ok(
                'size': 50,
                'pages': 1
            }
+
+
+@pytest.mark.parametrize(
+    'params, total',
+    [
+        ({'name__prefix': 'Sample'}, 1),
+        ({'name__prefix': 'sample'}, 0),
+        ({'name__prefix': 'Sample%1'}, 0),
+        ({'name__like': '%ITEM%'}, 1),
+    ],
+)
+@pytest.mark.asyncio
+async def test_list_sample_items__name_filters__returns_ok(
+        client: AsyncClient,  # pylint: disable=redefined-outer-name
+        params: dict[str, str],
+        total: int,
+) -> None:
+    """Test the prefix and fuzzy name filters."""
+    response = await client.get(
+        f'{API_BASE}/public/sample-items', params=params)
+    assert response.status_code == 200
+    assert response.json()['total'] == total
+
+
+@pytest.mark.asyncio
+async def test_list_sample_items__with_meta__returns_ok(
+        client: AsyncClient,  # pylint: disable=redefined-outer-name
+) -> None:
+    """Test list sample items with the lengths computed by the query."""
+    response = await client.get(
+        f'{API_BASE}/public/sample-items', params={'with_meta': True})
+    assert response.status_code == 200
+    response_json = response.json()
+    assert response_json['total'] == 1
+    assert response_json['items'][0]['uuid'] == 'dummy'
+    assert response_json['items'][0]['meta_data'] == {
+        'name_length': 13,
+        'description_length': 1,
+    }
+
+
+@pytest.mark.parametrize(
+    'with_meta, response_model',
+    [
+        (False, Page[SampleItemReadDto]),
+        (True, Page[SampleItemReadDtoWithMeta]),
+    ],
+)
+@pytest.mark.asyncio
+async def test_list_sample_items__body__same_as_response_model(
+        client: AsyncClient,  # pylint: disable=redefined-outer-name
+        with_meta: bool,
+        response_model: type,
+) -> None:
+    """The page is serialized to the same bytes FastAPI renders through the
+    response model."""
+    with Session(bind=db_engine(get_settings_for_testing())) as db_session:
+        add_sample_item(
+            db_session, uuid='dummy2', name='Sample "2" \\ <&>',
+            description='2\n',
+        )
+        db_session.commit()
+
+    response = await client.get(
+        f'{API_BASE}/public/sample-items',
+        params={'with_meta': with_meta, 'id__asc': True})
+    assert response.status_code == 200
+    assert [item['name'] for item in response.json()['items']] == [
+        'Sample item 1', 'Sample "2" \\ <&>']
+    assert response.content == fastapi_json_body(
+        response_model, response.content)
@@ -0,0 +1,137 @@
+"""Test cases for the response cache of the list_sample_items endpoint."""
+from typing import AsyncGenerator
+
+import pytest
+import pytest_asyncio
+from dependency_injector import providers
+from httpx import AsyncClient, ASGITransport
+from sqlalchemy.orm import Session
+
+from app.application.dto.sample_item import SampleItemCreate
+from app.application.use_cases.sample_item.create import \
+    SampleItemCreateUseCase
+from app.application.use_cases.sample_item.logical_delete import \
+    SampleItemLogicalDeleteUseCase
+from app.config import get_settings_for_testing
+from app.infrastructure.services.tagged_cache import InMemoryTaggedCache
+from app.main import app
+from tests.libs.mocks import add_sample_item
+from tests.libs.utils import API_BASE, init_and_autocommit_session, \
+    define_cleanup, db_engine
+
+
+@pytest_asyncio.fixture(scope='function')
+async def client(request: pytest.FixtureRequest) -> AsyncGenerator[
+    AsyncClient, None]:
+    """Test client fixture with the list cache enabled."""
+    config = get_settings_for_testing()
+
+    with init_and_autocommit_session(config) as db_session:
+        add_sample_item(
+            db_session,
+            uuid='dummy', name='Sample item 1', description='1',
+        )
+
+    request.addfinalizer(define_cleanup(config))
+
+    container = app.container  # type: ignore
+    cache = InMemoryTaggedCache(
+        name='sample_item_list_cache',
+        ttl_seconds=60,
+        max_entries=16,
+        metrics=container.metrics(),
+    )
+    with container.sample_item_list_cache.override(providers.Object(cache)):
+        async with AsyncClient(transport=ASGITransport(app=app),
+                               base_url='http://test') as client_:
+            yield client_
+
+
+@pytest.mark.asyncio
+async def test_list_sample_items__cached_until_write__returns_ok(
+        client: AsyncClient,  # pylint: disable=redefined-outer-name
+) -> None:
+    """Test that list pages are cached and invalidated by writes."""
+    url = f'{API_BASE}/public/sample-items'
+
+    response = await client.get(url)
+    assert response.status_code == 200
+    assert response.json()['total'] == 1
+
+    # A row written behind the API's back is not visible while cached.
+    config = get_settings_for_testing()
+    with init_and_autocommit_session(config) as db_session:
+        add_sample_item(
+            db_session,
+            uuid='dummy', name='Sample item 1', description='1',
+        )
+        add_sample_item(
+            db_session,
+            uuid='dummy2', name='Sample item 2', description='2',
+        )
+    response = await client.get(url)
+    assert response.json()['total'] == 1
+
+    # Different pagination is a different cache entry.
+    response = await client.get(url, params={'size': 10})
+    assert response.json()['total'] == 2
+
+    # Writes through the API invalidate every sample_items page.
+    response = await client.post(url, json={
+        'name': 'Sample item 3', 'description': '3'})
+    assert response.status_code == 201
+
+    response = await client.get(url)
+    assert response.json()['total'] == 3
+
+    response = await client.get('/api/metrics')
+    assert response.status_code == 200
+    counters = response.json()['counters']
+    assert counters['sample_item_list_cache.hits'] >= 1
+    assert counters['sample_item_list_cache.misses'] >= 3
+
+
+@pytest.mark.asyncio
+async def test_write_use_cases__commit__invalidate_list_pages(
+        client: AsyncClient,  # pylint: disable=redefined-outer-name
+) -> None:
+    """The write use cases invalidate the list pages when their transaction
+    commits, whoever calls them, and not when it rolls back."""
+    url = f'{API_BASE}/public/sample-items'
+    container = app.container  # type: ignore
+    cache = container.sample_item_list_cache()
+    session_factory = container.db_session_factory()
+    repository_factory = container.sample_item_repository()
+
+    response = await client.get(url)
+    assert response.json()['total'] == 1
+
+    async with session_factory() as db_session:
+        with pytest.raises(ValueError):
+            SampleItemCreateUseCase(repository_factory(db_session))
+        async with db_session.begin():
+            await SampleItemCreateUseCase(
+                repository_factory(db_session), cache,
+            )(SampleItemCreate(name='Sample item 2', description='2'), None)
+            response = await client.get(url)
+            assert response.json()['total'] == 1
+
+    response = await client.get(url)
+    assert response.json()['total'] == 2
+
+    config = get_settings_for_testing()
+    with Session(bind=db_engine(config)) as db_session:
+        add_sample_item(
+            db_session,
+            uuid='dummy3', name='Sample item 3', description='3',
+        )
+        db_session.commit()
+    with pytest.raises(RuntimeError):
+        async with session_factory() as db_session:
+            async with db_session.begin():
+                await SampleItemLogicalDeleteUseCase(
+                    repository_factory(db_session), cache)(1)
+                raise RuntimeError('rolled back')
+
+    response = await client.get(url)
+    assert response.json()['total'] == 2
@@ -0,0 +1,93 @@
+"""Test cases for the query cost guard of the list_sample_items endpoint."""
+from typing import AsyncGenerator
+
+import pytest
+import pytest_asyncio
+from dependency_injector import providers
+from httpx import AsyncClient, ASGITransport
+
+from app.application.queries.list_query_guard import ListQueryGuard
+from app.config import get_settings_for_testing
+from app.domain.value_objects.api_query import ApiListQueryLimits
+from app.main import app
+from tests.libs.mocks import add_sample_item
+from tests.libs.utils import API_BASE, init_and_autocommit_session, \
+    define_cleanup
+
+
+@pytest_asyncio.fixture(scope='function')
+async def client(request: pytest.FixtureRequest) -> AsyncGenerator[
+    AsyncClient, None]:
+    """Test client fixture with strict list query limits."""
+    config = get_settings_for_testing()
+
+    with init_and_autocommit_session(config) as db_session:
+        add_sample_item(
+            db_session,
+            uuid='dummy', name='Sample item 1', description='1',
+        )
+
+    request.addfinalizer(define_cleanup(config))
+
+    guard = ListQueryGuard(ApiListQueryLimits(
+        allow_leading_wildcard=False,
+        max_page_size=20,
+        max_page_depth=5,
+        max_plan_cost=1e9,
+    ))
+    container = app.container  # type: ignore
+    with container.list_query_guard.override(providers.Object(guard)):
+        async with AsyncClient(transport=ASGITransport(app=app),
+                               base_url='http://test') as client_:
+            yield client_
+
+
+@pytest.mark.parametrize(
+    'params',
+    [
+        {'name__like': '%item'},
+        {'name__like': '_tem 1'},
+        {'size': 21},
+        {'page': 6},
+    ],
+)
+@pytest.mark.asyncio
+async def test_list_sample_items__too_expensive__returns_bad_request(
+        client: AsyncClient,  # pylint: disable=redefined-outer-name
+        params: dict[str, str | int],
+) -> None:
+    """Test that queries over the limits are rejected."""
+    response = await client.get(
+        f'{API_BASE}/public/sample-items', params=params)
+    assert response.status_code == 400
+    assert response.json()['detail'][0]['type'] == 'QueryTooExpensive'
+
+
+@pytest.mark.asyncio
+async def test_list_sample_items__within_limits__returns_ok(
+        client: AsyncClient,  # pylint: disable=redefined-outer-name
+) -> None:
+    """Test that queries within the limits, including the plan cost, pass."""
+    response = await client.get(
+        f'{API_BASE}/public/sample-items',
+        params={'name__like': 'Sample%', 'size': 20, 'page': 1,
+                'created_at__gte': '2000-01-01T00:00:00'},
+    )
+    assert response.status_code == 200
+    assert response.json()['total'] == 1
+
+
+@pytest.mark.asyncio
+async def test_list_sample_items__over_plan_cost__returns_bad_request(
+        client: AsyncClient,  # pylint: disable=redefined-outer-name
+) -> None:
+    """Test that the planner's estimated cost is checked against a budget."""
+    guard = ListQueryGuard(ApiListQueryLimits(max_plan_cost=0.01))
+    container = app.container  # type: ignore
+    with container.list_query_guard.override(providers.Object(guard)):
+        response = await client.get(
+            f'{API_BASE}/public/sample-items',
+            params={'name__like': 'Sample%'},
+        )
+    assert response.status_code == 400
+    assert response.json()['detail'][0]['type'] == 'QueryTooExpensive'
@@ -0,0 +1,104 @@
+"""Test cases for MessagePack requests and responses of sample items."""
+from typing import AsyncGenerator
+
+import msgpack
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient, ASGITransport
+
+from app.config import get_settings_for_testing
+from app.main import app
+from tests.libs.mocks import add_sample_item
+from tests.libs.utils import API_BASE, init_and_autocommit_session, \
+    define_cleanup
+
+MSGPACK = 'application/msgpack'
+
+
+@pytest_asyncio.fixture(scope='function')
+async def client(request: pytest.FixtureRequest) -> AsyncGenerator[
+    AsyncClient, None]:
+    """Test client fixture."""
+    config = get_settings_for_testing()
+
+    with init_and_autocommit_session(config) as db_session:
+        add_sample_item(
+            db_session,
+            uuid='dummy', name='Sample item 1', description='1',
+        )
+
+    request.addfinalizer(define_cleanup(config))
+
+    async with AsyncClient(transport=ASGITransport(app=app),
+                           base_url='http://test') as client_:
+        yield client_
+
+
+@pytest.mark.asyncio
+async def test_msgpack__list_and_get__returns_msgpack(
+        client: AsyncClient,  # pylint: disable=redefined-outer-name
+) -> None:
+    """Test Page envelopes and single DTOs in MessagePack."""
+    response = await client.get(
+        f'{API_BASE}/public/sample-items', headers={'Accept': MSGPACK})
+    assert response.status_code == 200
+    assert response.headers['content-type'] == MSGPACK
+    page = msgpack.unpackb(response.content)
+    assert page['total'] == 1
+    assert page['items'][0]['uuid'] == 'dummy'
+
+    response = await client.get(
+        f'{API_BASE}/public/sample-items-by-uuid/dummy',
+        headers={'Accept': MSGPACK})
+    assert response.status_code == 200
+    assert response.headers['content-type'] == MSGPACK
+    assert msgpack.unpackb(response.content)['name'] == 'Sample item 1'
+
+    response = await client.get(
+        f'{API_BASE}/public/sample-items-by-uuid/dummy')
+    assert response.headers['content-type'] == 'application/json'
+    assert response.json()['name'] == 'Sample item 1'
+
+
+@pytest.mark.asyncio
+async def test_msgpack__create__accepts_msgpack_body(
+        client: AsyncClient,  # pylint: disable=redefined-outer-name
+) -> None:
+    """Test request bodies in MessagePack."""
+    response = await client.post(
+        f'{API_BASE}/public/sample-items',
+        content=msgpack.packb({'name': 'Sample item 2', 'description': '2'}),
+        headers={'Content-Type': MSGPACK, 'Accept': MSGPACK},
+    )
+    assert response.status_code == 201
+    created = msgpack.unpackb(response.content)
+    assert created['name'] == 'Sample item 2'
+    assert created['description'] == '2'
+
+
+@pytest.mark.parametrize(
+    'method, path, body, status_code',
+    [
+        ('GET', '/public/sample-items/999', None, 404),
+        ('POST', '/public/sample-items', {'description': '2'}, 422),
+        ('POST', '/public/sample-items', b'\xc1', 400),
+    ],
+)
+@pytest.mark.asyncio
+async def test_msgpack__errors__returns_msgpack(
+        client: AsyncClient,  # pylint: disable=redefined-outer-name
+        method: str,
+        path: str,
+        body: dict[str, str] | bytes | None,
+        status_code: int,
+) -> None:
+    """Test error bodies in MessagePack."""
+    content = body if isinstance(body, bytes) or body is None \
+        else msgpack.packb(body)
+    response = await client.request(
+        method, f'{API_BASE}{path}', content=content,
+        headers={'Content-Type': MSGPACK, 'Accept': MSGPACK},
+    )
+    assert response.status_code == status_code
+    assert response.headers['content-type'] == MSGPACK
+    assert msgpack.unpackb(response.content)['detail']
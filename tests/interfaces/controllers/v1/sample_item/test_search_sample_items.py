@@ -0,0 +1,83 @@
+"""Test cases for the search_sample_items endpoint."""
+from typing import AsyncGenerator
+
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient, ASGITransport
+
+from app.config import get_settings_for_testing
+from app.main import app
+from tests.libs.mocks import add_sample_item
+from tests.libs.utils import API_BASE, init_and_autocommit_session, \
+    define_cleanup
+
+
+@pytest_asyncio.fixture(scope='function')
+async def client(request: pytest.FixtureRequest) -> AsyncGenerator[
+    AsyncClient, None]:
+    """Test client fixture."""
+    config = get_settings_for_testing()
+
+    with init_and_autocommit_session(config) as db_session:
+        add_sample_item(
+            db_session,
+            uuid='desc', name='Teapot', description='Brews green tea',
+        )
+        add_sample_item(
+            db_session,
+            uuid='name', name='Green tea', description='Loose leaves',
+        )
+        add_sample_item(
+            db_session,
+            uuid='other', name='Kettle', description='Boils water',
+        )
+
+    request.addfinalizer(define_cleanup(config))
+
+    async with AsyncClient(transport=ASGITransport(app=app),
+                           base_url='http://test') as client_:
+        yield client_
+
+
+@pytest.mark.asyncio
+async def test_search_sample_items__ranked__returns_ok(
+        client: AsyncClient,  # pylint: disable=redefined-outer-name
+) -> None:
+    """Test that name matches rank above description matches."""
+    url = f'{API_BASE}/public/sample-items-search'
+    response = await client.get(url, params={'q': 'green teas'})
+    assert response.status_code == 200
+    response_json = response.json()
+    assert response_json['total'] == 2
+    assert [item['uuid'] for item in response_json['items']] == [
+        'name', 'desc']
+
+    response = await client.get(
+        url, params={'q': 'green -leaves', 'with_meta': True})
+    assert [item['uuid'] for item in response.json()['items']] == ['desc']
+    assert response.json()['items'][0]['meta_data'] == {
+        'name_length': 6, 'description_length': 15}
+
+
+@pytest.mark.asyncio
+async def test_search_sample_items__logically_deleted__not_returned(
+        client: AsyncClient,  # pylint: disable=redefined-outer-name
+) -> None:
+    """Test that logically deleted items are not searched."""
+    response = await client.delete(f'{API_BASE}/public/sample-items/2')
+    assert response.status_code == 204
+
+    response = await client.get(
+        f'{API_BASE}/public/sample-items-search', params={'q': 'green'})
+    assert response.status_code == 200
+    assert [item['uuid'] for item in response.json()['items']] == ['desc']
+
+
+@pytest.mark.asyncio
+async def test_search_sample_items__empty_query__returns_unprocessable(
+        client: AsyncClient,  # pylint: disable=redefined-outer-name
+) -> None:
+    """Test that a search text is required."""
+    response = await client.get(
+        f'{API_BASE}/public/sample-items-search', params={'q': ''})
+    assert response.status_code == 422
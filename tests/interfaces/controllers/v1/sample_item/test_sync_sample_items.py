@@ -0,0 +1,120 @@
+"""Test cases for the sync_sample_items endpoint."""
+from datetime import timedelta
+from typing import AsyncGenerator
+
+import pytest
+import pytest_asyncio
+from dependency_injector import providers
+from httpx import AsyncClient, ASGITransport
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.config import get_settings_for_testing
+from app.domain.entities.sample_item import SampleItem
+from app.main import app
+from tests.libs.mocks import add_sample_item
+from tests.libs.utils import API_BASE, init_and_autocommit_session, \
+    define_cleanup, db_engine
+
+SYNC_URL = f'{API_BASE}/public/sample-items-sync'
+
+
+@pytest_asyncio.fixture(scope='function')
+async def client(request: pytest.FixtureRequest) -> AsyncGenerator[
+    AsyncClient, None]:
+    """Test client fixture without a watermark overlap."""
+    config = get_settings_for_testing()
+
+    with init_and_autocommit_session(config) as db_session:
+        for i in range(1, 4):
+            add_sample_item(
+                db_session,
+                uuid=f'dummy{i}', name=f'Sample item {i}', description=None,
+            )
+
+    request.addfinalizer(define_cleanup(config))
+
+    container = app.container  # type: ignore
+    with container.sync_watermark_overlap.override(
+            providers.Object(timedelta(0))):
+        async with AsyncClient(transport=ASGITransport(app=app),
+                               base_url='http://test') as client_:
+            yield client_
+
+
+@pytest.mark.asyncio
+async def test_sync_sample_items__changes_since_watermark__returns_ok(
+        client: AsyncClient,  # pylint: disable=redefined-outer-name
+) -> None:
+    """Test full sync in pages, then a delta with an update and a delete."""
+    response = await client.get(SYNC_URL, params={'limit': 2})
+    assert response.status_code == 200
+    first = response.json()
+    assert [item['uuid'] for item in first['items']] == ['dummy1', 'dummy2']
+    assert first['has_more'] is True
+
+    response = await client.get(
+        SYNC_URL, params={'limit': 2, 'since': first['watermark']})
+    second = response.json()
+    assert [item['uuid'] for item in second['items']] == ['dummy3']
+    assert second['has_more'] is False
+
+    response = await client.get(
+        SYNC_URL, params={'since': second['watermark']})
+    assert response.json()['items'] == []
+    assert response.json()['tombstones'] == []
+
+    await client.put(f'{API_BASE}/public/sample-items/1',
+                     json={'name': 'Updated'})
+    await client.delete(f'{API_BASE}/public/sample-items/2')
+
+    response = await client.get(
+        SYNC_URL, params={'since': second['watermark']})
+    delta = response.json()
+    assert [item['name'] for item in delta['items']] == ['Updated']
+    assert [tombstone['uuid'] for tombstone in delta['tombstones']] == [
+        'dummy2']
+    assert delta['has_more'] is False
+
+
+@pytest.mark.asyncio
+async def test_sync_sample_items__late_commit_in_overlap__returned(
+        client: AsyncClient,  # pylint: disable=redefined-outer-name
+) -> None:
+    """A change committed after a sync, but stamped before the changes it
+    returned, is returned by the next sync while within the overlap."""
+    container = app.container  # type: ignore
+    with container.sync_watermark_overlap.override(
+            providers.Object(timedelta(hours=1))):
+        response = await client.get(SYNC_URL, params={'limit': 2})
+        first = response.json()
+        assert [item['uuid'] for item in first['items']] == [
+            'dummy1', 'dummy2']
+        # Paging on would skip the late commit below.
+        assert first['has_more'] is False
+
+        config = get_settings_for_testing()
+        with Session(bind=db_engine(config)) as db_session:
+            stamped_at = db_session.scalars(
+                select(getattr(SampleItem, 'updated_at'))).first()
+            assert stamped_at is not None
+            add_sample_item(
+                db_session, uuid='late', name='Late',
+                updated_at=stamped_at - timedelta(seconds=1),
+            )
+            db_session.commit()
+
+        response = await client.get(
+            SYNC_URL, params={'since': first['watermark']})
+        assert [item['uuid'] for item in response.json()['items']] == [
+            'late', 'dummy1', 'dummy2', 'dummy3']
+
+
+@pytest.mark.asyncio
+async def test_sync_sample_items__invalid_watermark__returns_bad_request(
+        client: AsyncClient,  # pylint: disable=redefined-outer-name
+) -> None:
+    """Test that a malformed watermark is rejected."""
+    response = await client.get(SYNC_URL, params={'since': 'not-a-watermark'})
+    assert response.status_code == 400
+    assert response.json()['detail'][0]['type'] == 'InvalidSyncWatermark'
@@ -10,9 +10,12 @@ from httpx import AsyncClient, ASGITransport
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
+from app.application.use_cases.auth.login_session.logout import \
+    LogoutUseCase
 from app.config import get_settings_for_testing
 from app.domain.entities.login_session import LoginSession
 from app.main import app
+from tests.libs.mocks import add_login_session, DUMMY_SESSION_ID1
 from tests.libs.utils import API_BASE, init_and_autocommit_session, \
     define_cleanup, mock_overwrite_datetime, add_super_user, db_engine
 
@@ -27,6 +30,9 @@ async def client(request: pytest.FixtureRequest) -> typing.AsyncGenerator[
         add_super_user(db_session)
 
     request.addfinalizer(define_cleanup(config))
+    # The session IDs are reused by every test, drop the cached sessions of
+    # the previous one.
+    app.container.login_session_cache().clear()  # type: ignore
 
     async with AsyncClient(transport=ASGITransport(app=app),
                            base_url='http://test') as client_:
@@ -118,3 +124,44 @@ async def test_session_auth__verify_ok__return_ok(
         ).scalars().first()
 
         assert not_found_session is None
+
+    # The session was cached by the verification, logout must drop it.
+    response4 = await client.get(
+        f'{API_BASE}/auth/session/verify',
+        cookies={'session': session_id},
+    )
+    assert response4.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_logout__session_cached_before_commit__dropped(
+        client: AsyncClient,  # pylint: disable=redefined-outer-name
+) -> None:
+    """A session cached again by a request that read it before the logout
+    committed is dropped from the local tier once the logout commits."""
+    config = get_settings_for_testing()
+    with Session(bind=db_engine(config)) as db_session:
+        add_login_session(
+            db_session, id=DUMMY_SESSION_ID1, user_id=1, user_uuid='dummy')
+        db_session.commit()
+
+    container = app.container  # type: ignore
+    cache = container.login_session_cache()
+    session_factory = container.db_session_factory()
+    repository_factory = container.login_session_repository_factory()
+    async with session_factory() as db_session:
+        async with db_session.begin():
+            repository = repository_factory(db_session)
+            await LogoutUseCase(repository, cache)(DUMMY_SESSION_ID1)
+
+            async with session_factory() as other_db_session:
+                session = await repository_factory(
+                    other_db_session).get_by_id(DUMMY_SESSION_ID1)
+            assert session is not None
+            await cache.set(session)
+            assert (await cache.get(DUMMY_SESSION_ID1)) is not None
+
+    assert (await cache.get(DUMMY_SESSION_ID1)) is None
+    client.cookies.set('session', DUMMY_SESSION_ID1)
+    response = await client.get(f'{API_BASE}/auth/session/verify')
+    assert response.status_code == 401
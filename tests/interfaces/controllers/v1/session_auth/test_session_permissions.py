@@ -53,6 +53,9 @@ async def client(request: pytest.FixtureRequest) -> AsyncGenerator[
         add_role_permission(db_session, role_id=1, permission_id=1)
 
     request.addfinalizer(define_cleanup(config))
+    # The session IDs are reused by every test, drop the cached sessions of
+    # the previous one.
+    app.container.login_session_cache().clear()  # type: ignore
 
     async with AsyncClient(transport=ASGITransport(app=app),
                            base_url='http://test') as client_:
@@ -4,21 +4,24 @@ import typing
 
 import pytest
 import pytest_asyncio
+from dependency_injector import providers
 from freezegun import freeze_time
 from httpx import AsyncClient, ASGITransport
 from jose import jwt
 
 from app.config import get_settings_for_testing
+from app.infrastructure.services.jwt_backends import JWT_BACKENDS, \
+    create_jwt_backend
 from app.interfaces.middlewares.authorizer import AuthMethod
 from app.main import app
 from tests.libs.utils import API_BASE, init_and_autocommit_session, \
     define_cleanup, add_super_user
 
 
-@pytest_asyncio.fixture(scope='function')
+@pytest_asyncio.fixture(scope='function', params=sorted(JWT_BACKENDS))
 async def client(request: pytest.FixtureRequest) -> typing.AsyncGenerator[
     AsyncClient, None]:
-    """Test client fixture."""
+    """Test client fixture, once per JWT backend."""
     config = get_settings_for_testing()
 
     with init_and_autocommit_session(config) as db_session:
@@ -26,9 +29,12 @@ async def client(request: pytest.FixtureRequest) -> typing.AsyncGenerator[
 
     request.addfinalizer(define_cleanup(config))
 
-    async with AsyncClient(transport=ASGITransport(app=app),
-                           base_url='http://test') as client_:
-        yield client_
+    container = app.container  # type: ignore
+    backend = create_jwt_backend(request.param)
+    with container.jwt_backend.override(providers.Object(backend)):
+        async with AsyncClient(transport=ASGITransport(app=app),
+                               base_url='http://test') as client_:
+            yield client_
 
 
 @pytest.mark.asyncio
@@ -0,0 +1,160 @@
+"""Test cases for the compression middleware."""
+import gzip
+from typing import AsyncGenerator, AsyncIterator, Awaitable, Callable
+
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient, ASGITransport
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse, Response, \
+    StreamingResponse
+from starlette.routing import Route
+
+from app.infrastructure.services.metrics import InMemoryMetricsRecorder
+from app.interfaces.middlewares.compression import COMPRESS_STREAM_HEADER, \
+    CompressionMiddleware, negotiate_encoding
+
+LARGE_BODY = '{"items": [%s]}' % ', '.join(['"sample item"'] * 200)
+
+
+async def large(_request: Request) -> Response:
+    """A JSON body above the threshold."""
+    return Response(LARGE_BODY, media_type='application/json',
+                    headers={'ETag': '"v1"'})
+
+
+async def small(_request: Request) -> Response:
+    """A JSON body below the threshold."""
+    return Response('{}', media_type='application/json')
+
+
+async def text(_request: Request) -> Response:
+    """A large plain text body."""
+    return PlainTextResponse('sample item ' * 200)
+
+
+def stream(opt_in: bool) -> Callable[[Request], Awaitable[Response]]:
+    """Build a streaming endpoint."""
+
+    async def chunks() -> AsyncIterator[bytes]:
+        for _ in range(3):
+            yield LARGE_BODY.encode()
+
+    async def endpoint(_request: Request) -> Response:
+        headers = {COMPRESS_STREAM_HEADER: '1'} if opt_in else {}
+        return StreamingResponse(
+            chunks(), media_type='application/json', headers=headers)
+
+    return endpoint
+
+
+@pytest.fixture(scope='function')
+def metrics() -> InMemoryMetricsRecorder:
+    """Metrics recorder fixture."""
+    return InMemoryMetricsRecorder()
+
+
+@pytest_asyncio.fixture(scope='function')
+async def client(
+        metrics: InMemoryMetricsRecorder,  # pylint: disable=redefined-outer-name
+) -> AsyncGenerator[AsyncClient, None]:
+    """Test client fixture."""
+    app = Starlette(routes=[
+        Route('/large', large),
+        Route('/small', small),
+        Route('/text', text),
+        Route('/stream', stream(opt_in=False)),
+        Route('/stream-opt-in', stream(opt_in=True)),
+    ])
+    app.add_middleware(
+        CompressionMiddleware,
+        metrics=metrics,
+        minimum_size=1024,
+        encodings=['gzip'],
+    )
+    async with AsyncClient(transport=ASGITransport(app=app),
+                           base_url='http://test') as client_:
+        yield client_
+
+
+@pytest.mark.parametrize(
+    'accept_encoding, expected',
+    [
+        ('gzip', 'gzip'),
+        ('br, gzip', 'br'),
+        ('gzip, br;q=0', 'gzip'),
+        ('gzip;q=0', None),
+        ('*', 'br'),
+        ('*, br;q=0', 'gzip'),
+        ('identity', None),
+        ('', None),
+    ],
+)
+def test_negotiate_encoding(
+        accept_encoding: str,
+        expected: str | None,
+) -> None:
+    """Test the server preference among the accepted encodings."""
+    assert negotiate_encoding(accept_encoding, ['br', 'gzip']) == expected
+
+
+@pytest.mark.asyncio
+async def test_compression__large_body__compressed(
+        client: AsyncClient,  # pylint: disable=redefined-outer-name
+        metrics: InMemoryMetricsRecorder,  # pylint: disable=redefined-outer-name
+) -> None:
+    """Test that bodies above the threshold are compressed."""
+    response = await client.get(
+        '/large', headers={'Accept-Encoding': 'gzip'})
+
+    assert response.status_code == 200
+    assert response.headers['content-encoding'] == 'gzip'
+    assert response.headers['vary'] == 'Accept-Encoding'
+    assert response.headers['etag'] == 'W/"v1"'
+    assert response.text == LARGE_BODY
+
+    summaries = metrics.snapshot()['summaries']
+    assert summaries['compression.gzip.ratio']['count'] == 1
+    assert summaries['compression.gzip.ratio']['max'] < 0.5
+    assert summaries['compression.gzip.cpu_ms']['count'] == 1
+
+
+@pytest.mark.parametrize(
+    'path, accept_encoding',
+    [
+        ('/small', 'gzip'),
+        ('/large', 'identity'),
+        ('/stream', 'gzip'),
+    ],
+)
+@pytest.mark.asyncio
+async def test_compression__not_eligible__sent_as_is(
+        client: AsyncClient,  # pylint: disable=redefined-outer-name
+        path: str,
+        accept_encoding: str,
+) -> None:
+    """Test small bodies, unsupported encodings and plain streams."""
+    response = await client.get(
+        path, headers={'Accept-Encoding': accept_encoding})
+
+    assert response.status_code == 200
+    assert 'content-encoding' not in response.headers
+
+
+@pytest.mark.asyncio
+async def test_compression__text_and_opted_in_stream__compressed(
+        client: AsyncClient,  # pylint: disable=redefined-outer-name
+) -> None:
+    """Test text bodies and streams that ask for compression."""
+    response = await client.get('/text', headers={'Accept-Encoding': 'gzip'})
+    assert response.headers['content-encoding'] == 'gzip'
+
+    async with client.stream(
+            'GET', '/stream-opt-in',
+            headers={'Accept-Encoding': 'gzip'}) as response:
+        raw = b''.join([chunk async for chunk in response.aiter_raw()])
+
+    assert response.headers['content-encoding'] == 'gzip'
+    assert COMPRESS_STREAM_HEADER not in response.headers
+    assert gzip.decompress(raw) == LARGE_BODY.encode() * 3
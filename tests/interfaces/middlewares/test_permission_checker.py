@@ -0,0 +1,147 @@
+"""Test cases for the cached permission checker."""
+from datetime import datetime, timezone
+from typing import Any, Iterator
+
+import pytest
+from sqlalchemy import delete, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.application.exc import Forbidden
+from app.config import get_settings_for_testing
+from app.domain.entities.user import UserRoles
+from app.domain.value_objects.role_permision import PermissionName, \
+    RoleName, permission_mask
+from app.infrastructure.database.database import Database
+from app.infrastructure.repositories.user_in_db import \
+    InDBUserByUUIDRepository
+from app.infrastructure.services.metrics import InMemoryMetricsRecorder
+from app.interfaces.middlewares.permission_checker import PermissionChecker
+from tests.libs.mocks import add_default_super_user, add_user, add_role, \
+    add_permission, add_user_role, add_role_permission
+from tests.libs.utils import init_and_autocommit_session, define_cleanup, \
+    db_engine
+
+READ = permission_mask([PermissionName.ADMIN_READ])
+WRITE = permission_mask([PermissionName.ADMIN_WRITE])
+
+
+@pytest.fixture
+def statements() -> Iterator[list[str]]:
+    """Statements executed on the database while the test runs."""
+    executed: list[str] = []
+
+    def before_cursor_execute(*args: Any) -> None:
+        executed.append(args[2])
+
+    event.listen(Engine, 'before_cursor_execute', before_cursor_execute)
+    yield executed
+    event.remove(Engine, 'before_cursor_execute', before_cursor_execute)
+
+
+@pytest.mark.asyncio
+async def test_permitted__cached_masks__checked_without_queries(
+        request: pytest.FixtureRequest,
+        statements: list[str],  # pylint: disable=redefined-outer-name
+) -> None:
+    """Masks are loaded once per TTL, and reloaded on invalidation."""
+    config = get_settings_for_testing()
+    with init_and_autocommit_session(config) as db_session:
+        add_default_super_user(db_session)
+        add_user(db_session, uuid='dummy2', email='admin@fawapp.com')
+        add_user(db_session, uuid='dummy3', email='user@fawapp.com')
+        add_role(db_session, name=RoleName.ADMIN)
+        add_role(db_session, name=RoleName.USER)
+        add_permission(db_session, name=PermissionName.ADMIN_READ)
+        add_permission(db_session, name='unused')
+        db_session.flush()
+        add_user_role(db_session, user_id=2, role_id=1)
+        add_user_role(db_session, user_id=3, role_id=2)
+        add_role_permission(db_session, role_id=1, permission_id=1)
+        add_role_permission(db_session, role_id=1, permission_id=2)
+    request.addfinalizer(define_cleanup(config))
+    statements.clear()
+
+    now = [0.0]
+    db = Database(db_url=config.db_dsn)
+    metrics = InMemoryMetricsRecorder()
+    checker = PermissionChecker(
+        db.session,
+        InDBUserByUUIDRepository.factory(
+            lambda: datetime.now(timezone.utc)),
+        ttl_seconds=60, max_entries=10, metrics=metrics,
+        clock=lambda: now[0],
+    )
+    try:
+        await checker.permitted('dummy', READ | WRITE)
+        await checker.permitted('dummy2', READ)
+        with pytest.raises(Forbidden):
+            await checker.permitted('dummy2', WRITE)
+        with pytest.raises(Forbidden):
+            await checker.permitted('dummy3', READ)
+        with pytest.raises(Forbidden):
+            await checker.permitted('nobody', READ)
+        assert sum('role_permissions' in s for s in statements) == 1
+
+        statements.clear()
+        await checker.permitted('dummy2', READ)
+        assert not statements
+
+        with Session(bind=db_engine(config)) as db_session:
+            db_session.execute(delete(UserRoles))
+            db_session.commit()
+        await checker.permitted('dummy2', READ)
+        checker.invalidate('dummy2')
+        with pytest.raises(Forbidden):
+            await checker.permitted('dummy2', READ)
+
+        now[0] = 61
+        with pytest.raises(Forbidden):
+            await checker.permitted('dummy3', READ)
+        await checker.permitted('dummy', WRITE)
+    finally:
+        await db.get_engine().dispose()
+
+    counters = metrics.snapshot()['counters']
+    assert counters['permission_cache.hits'] == 3
+    assert counters['permission_cache.misses'] == 7
+
+
+@pytest.mark.asyncio
+async def test_permitted__unknown_user__not_cached(
+        request: pytest.FixtureRequest,
+) -> None:
+    """A user created after a failed check is found before the TTL ends."""
+    config = get_settings_for_testing()
+    request.addfinalizer(define_cleanup(config))
+
+    db = Database(db_url=config.db_dsn)
+    metrics = InMemoryMetricsRecorder()
+    checker = PermissionChecker(
+        db.session,
+        InDBUserByUUIDRepository.factory(
+            lambda: datetime.now(timezone.utc)),
+        ttl_seconds=60, max_entries=10, metrics=metrics,
+        clock=lambda: 0.0,
+    )
+    try:
+        with pytest.raises(Forbidden):
+            await checker.permitted('dummy', READ)
+
+        with init_and_autocommit_session(config) as db_session:
+            add_default_super_user(db_session)
+        await checker.permitted('dummy', READ)
+        await checker.permitted('dummy', READ)
+    finally:
+        await db.get_engine().dispose()
+
+    counters = metrics.snapshot()['counters']
+    assert counters['permission_cache.hits'] == 1
+    assert counters['permission_cache.misses'] == 2
+
+
+def test_permission_mask__unknown_name__raises() -> None:
+    """Required permissions must be `PermissionName`s."""
+    assert permission_mask(['admin:read', 'admin:write']) == READ | WRITE
+    with pytest.raises(ValueError):
+        permission_mask(['admin:reed'])
@@ -0,0 +1,129 @@
+"""Test cases for the signed session cookie authorizer."""
+from datetime import datetime, timezone
+from typing import Any, Iterator
+
+import pytest
+from fastapi import Request
+from sqlalchemy import Engine, delete, event
+from sqlalchemy.orm import Session
+
+from app.application.exc import Unauthorized
+from app.config import get_settings_for_testing
+from app.domain.entities.login_session import LoginSession
+from app.infrastructure.database.database import Database
+from app.infrastructure.repositories.login_session_in_db import \
+    InDBLoginSessionRepository
+from app.infrastructure.services.login_session import LoginSessionServiceImpl
+from app.interfaces.middlewares.authorizer import \
+    SignedSessionCookieAuthorizer
+from tests.libs.mocks import DUMMY_SESSION_ID1, add_login_session, add_user
+from tests.libs.utils import init_and_autocommit_session, define_cleanup, \
+    db_engine
+
+EXPIRES_AT = datetime(2030, 1, 1, tzinfo=timezone.utc)
+
+
+class _Clock:
+    """Monotonic clock moved by hand."""
+
+    def __init__(self) -> None:
+        self.seconds = 0.0
+
+    def __call__(self) -> float:
+        return self.seconds
+
+
+@pytest.fixture
+def statements() -> Iterator[list[str]]:
+    """Collect the SQL statements executed by the test."""
+    executed: list[str] = []
+
+    def before_cursor_execute(*args: Any) -> None:
+        executed.append(args[2])
+
+    event.listen(Engine, 'before_cursor_execute', before_cursor_execute)
+    yield executed
+    event.remove(Engine, 'before_cursor_execute', before_cursor_execute)
+
+
+def _request(cookie: str) -> Request:
+    return Request({
+        'type': 'http',
+        'headers': [(b'cookie', f'session={cookie}'.encode())],
+    })
+
+
+@pytest.mark.asyncio
+async def test_authorize__signed_cookie__revocation_checked_at_interval(
+        request: pytest.FixtureRequest,
+        statements: list[str],  # pylint: disable=redefined-outer-name
+) -> None:
+    """Requests are authorized from the cookie, and the session is only
+    looked up once per interval to notice a logout."""
+    config = get_settings_for_testing()
+    with init_and_autocommit_session(config) as db_session:
+        add_user(db_session, uuid='dummy', email='user@fawapp.com')
+        add_login_session(
+            db_session, id=DUMMY_SESSION_ID1, user_id=1, user_uuid='dummy',
+            expires_at=EXPIRES_AT)
+    request.addfinalizer(define_cleanup(config))
+
+    service = LoginSessionServiceImpl(
+        config.login_session_secret_key, 60,
+        lambda: datetime(2029, 12, 31, 23, 30, tzinfo=timezone.utc))
+    cookie = service.sign_session(LoginSession(
+        id=DUMMY_SESSION_ID1, user_id=1, user_uuid='dummy',
+        expires_at=EXPIRES_AT))
+    db = Database(db_url=config.db_dsn)
+    clock = _Clock()
+    authorizer = SignedSessionCookieAuthorizer(
+        db.session,  # type: ignore
+        InDBLoginSessionRepository.factory(config.get_now),
+        service,
+        'session',
+        revocation_check_interval_seconds=60,
+        clock=clock,
+    )
+    try:
+        for _ in range(3):
+            authorized = await authorizer.authorize(_request(cookie))
+            assert authorized.state.user_uuid == 'dummy'
+            assert authorized.state.session.expires_at == EXPIRES_AT
+        lookups = [
+            statement for statement in statements
+            if statement.startswith('SELECT login_sessions')
+        ]
+        assert len(lookups) == 1
+
+        with Session(bind=db_engine(config)) as db_session:
+            db_session.execute(delete(LoginSession))
+            db_session.commit()
+        await authorizer.authorize(_request(cookie))
+
+        clock.seconds = 60
+        with pytest.raises(Unauthorized):
+            await authorizer.authorize(_request(cookie))
+        with pytest.raises(Unauthorized):
+            await authorizer.authorize(_request(cookie[:-1] + 'x'))
+    finally:
+        await db.get_engine().dispose()
+
+
+def test_load_signed_session__expired_or_forged__rejected() -> None:
+    """Cookies of expired sessions, or signed with another key, are
+    rejected."""
+    session = LoginSession(
+        id=DUMMY_SESSION_ID1, user_id=1, user_uuid='dummy',
+        expires_at=EXPIRES_AT)
+    before = LoginSessionServiceImpl(
+        'key', 60, lambda: datetime(2029, 12, 31, 23, 30, tzinfo=timezone.utc))
+    after = LoginSessionServiceImpl(
+        'key', 60, lambda: datetime(2030, 1, 1, 0, 30, tzinfo=timezone.utc))
+    other_key = LoginSessionServiceImpl(
+        'other', 60, lambda: datetime(2029, 12, 31, tzinfo=timezone.utc))
+
+    cookie = before.sign_session(session)
+    loaded = before.load_signed_session(cookie)
+    assert loaded is not None and loaded.id == DUMMY_SESSION_ID1
+    assert after.load_signed_session(cookie) is None
+    assert other_key.load_signed_session(cookie) is None
@@ -0,0 +1,123 @@
+"""Test cases for the default JSON response of the application."""
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncGenerator
+from uuid import UUID
+
+import pytest
+import pytest_asyncio
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from fastapi_pagination import Page, Params
+from httpx import AsyncClient, ASGITransport
+from pydantic import BaseModel, TypeAdapter
+
+from app.application.dto.sample_item import SampleItemReadDtoWithMeta
+from app.config import get_settings_for_testing
+from app.interfaces.views.json_response import ErrorJsonResponse, \
+    ErrorJsonResponseDetail, FastJsonResponse, error_json_response
+from app.main import app
+from tests.libs.utils import API_BASE, init_and_autocommit_session, \
+    define_cleanup
+
+UTC_TIME = datetime(2025, 1, 2, 3, 4, 5, 678901, tzinfo=timezone.utc)
+JST_TIME = datetime(2025, 1, 2, 3, 4, 5, tzinfo=timezone(timedelta(hours=9)))
+
+
+class _Event(BaseModel):
+    """Model with the field types the DTOs use."""
+    id: UUID
+    name: str
+    at: datetime
+    local_at: datetime
+    naive_at: datetime
+    ended_at: datetime | None = None
+
+
+def _before(content: Any) -> bytes:
+    """Body rendered before FastJsonResponse, by FastAPI's JSONResponse from
+    the jsonable_encoder tree of the content."""
+    return JSONResponse(jsonable_encoder(content)).body
+
+
+def _event() -> _Event:
+    return _Event(
+        id=UUID('12345678-1234-5678-1234-567812345678'),
+        name='Événement "1"\n<&>',
+        at=UTC_TIME,
+        local_at=JST_TIME,
+        naive_at=UTC_TIME.replace(tzinfo=None),
+    )
+
+
+def _sample_item_page() -> Page[SampleItemReadDtoWithMeta]:
+    items = TypeAdapter(list[SampleItemReadDtoWithMeta]).validate_python([
+        {
+            'uuid': f'dummy{i}', 'name': f'Sample item {i}',
+            'description': None if i % 2 else f'{i}',
+            'created_at': UTC_TIME, 'updated_at': JST_TIME,
+            'meta_data': {'name_length': 13, 'description_length': 1},
+        }
+        for i in range(3)
+    ])
+    return Page.create(items, Params(page=2, size=3), total=7)
+
+
+@pytest.mark.parametrize('content', [
+    _sample_item_page(),
+    Page.create([_event()], Params(), total=1),
+    Page.create([], Params(), total=0),
+    _event(),
+    error_json_response([ErrorJsonResponseDetail(
+        type='EntityNotFound', msg='Not found: "1"', detail=None)]),
+    {'detail': [{'type': 'missing', 'loc': ['query', 'size'],
+                 'msg': 'Field required', 'input': None}]},
+    {'counters': {'hits': 3}, 'gauges': {'hit_ratio': 0.75}},
+])
+def test_render__models_and_json_ready_content__same_as_before(
+        content: Any) -> None:
+    """Models, page envelopes included, and the JSON-ready content FastAPI
+    builds from a response model render to the same bytes as before."""
+    assert FastJsonResponse(content).body == _before(content)
+
+
+def test_render__fields__serialized_as_before() -> None:
+    """UUID and datetime fields keep their formats."""
+    assert FastJsonResponse(_event()).body == (
+        b'{"id":"12345678-1234-5678-1234-567812345678",'
+        b'"name":"\xc3\x89v\xc3\xa9nement \\"1\\"\\n<&>",'
+        b'"at":"2025-01-02T03:04:05.678901Z",'
+        b'"local_at":"2025-01-02T03:04:05+09:00",'
+        b'"naive_at":"2025-01-02T03:04:05.678901",'
+        b'"ended_at":null}')
+
+
+@pytest_asyncio.fixture(scope='function')
+async def client(request: pytest.FixtureRequest) -> AsyncGenerator[
+    AsyncClient, None]:
+    """Test client fixture."""
+    config = get_settings_for_testing()
+    with init_and_autocommit_session(config):
+        pass
+    request.addfinalizer(define_cleanup(config))
+
+    async with AsyncClient(transport=ASGITransport(app=app),
+                           base_url='http://test') as client_:
+        yield client_
+
+
+@pytest.mark.asyncio
+async def test_error_bodies__same_as_before(
+        client: AsyncClient,  # pylint: disable=redefined-outer-name
+) -> None:
+    """Error bodies of the handlers are rendered as before."""
+    response = await client.get(f'{API_BASE}/public/sample-items/1')
+    assert response.status_code == 404
+    assert response.headers['content-type'] == 'application/json'
+    assert response.content == _before(
+        ErrorJsonResponse.model_validate_json(response.content))
+    assert response.json()['detail'][0]['type'] == 'EntityNotFound'
+
+    response = await client.get(
+        f'{API_BASE}/public/sample-items', params={'size': 0})
+    assert response.status_code == 422
+    assert response.content == _before(response.json())
@@ -3,7 +3,9 @@ from contextlib import contextmanager
 from datetime import datetime
 from typing import Any, Callable, Generator
 
+from fastapi.responses import JSONResponse
 from passlib.context import CryptContext
+from pydantic import TypeAdapter
 from sqlalchemy import delete, create_engine
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session
@@ -126,3 +128,11 @@ def define_cleanup(config: Settings) -> Callable[[], None]:
             db_session.commit()
 
     return cleanup
+
+
+def fastapi_json_body(response_model: Any, body: bytes) -> bytes:
+    """Body FastAPI renders for the content of `body` when a route returns it
+    through `response_model` with its default `JSONResponse`."""
+    adapter: TypeAdapter[Any] = TypeAdapter(response_model)
+    content = adapter.dump_python(adapter.validate_json(body), mode='json')
+    return JSONResponse(content).body